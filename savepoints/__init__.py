@@ -7,9 +7,12 @@ import bpy
 from bpy.app.handlers import persistent
 from . import hud
 from . import operators_attributes
+from . import operators_bisect
 from . import operators_core
+from . import operators_diff
 from . import operators_io
 from . import operators_object_history
+from . import operators_region
 from . import operators_render
 from . import operators_snapshot
 from . import operators_tools
@@ -18,7 +21,10 @@ from . import ui
 from . import ui_utils
 from .services.asset_path import remap_snapshot_paths
 from .services.autosave import autosave_timer
-from .services.object_data import load_object_data
+from .services.live_render import register_live_render, stop_live_render, unregister_live_render
+from .services.ghost import clear_parked_ghost_registry, clear_single_ghost_registry
+from .services.object_data import clear_object_data_cache
+from .services.prefetch import start_object_data_prefetch, stop_object_data_prefetch
 
 classes = (
     properties.RetrieveObjectItem,
@@ -31,6 +37,8 @@ classes = (
     operators_tools.SAVEPOINTS_OT_retrieve_objects,
     operators_attributes.SAVEPOINTS_OT_toggle_protection,
     operators_tools.SAVEPOINTS_OT_toggle_ghost,
+    operators_tools.SAVEPOINTS_OT_clear_ghost_cache,
+    operators_tools.SAVEPOINTS_OT_toggle_onion_skin,
     operators_core.SAVEPOINTS_OT_checkout,
     operators_snapshot.SAVEPOINTS_OT_restore,
     operators_snapshot.SAVEPOINTS_OT_open_parent,
@@ -42,9 +50,18 @@ classes = (
     operators_render.SAVEPOINTS_OT_select_all,
     operators_render.SAVEPOINTS_OT_deselect_all,
     operators_render.SAVEPOINTS_OT_batch_render,
+    operators_render.SAVEPOINTS_OT_resume_batch_render,
+    operators_render.SAVEPOINTS_OT_export_live_timelapse,
     operators_object_history.SavePointsObjectHistoryItem,
     operators_object_history.SAVEPOINTS_UL_object_history,
     operators_object_history.SAVEPOINTS_OT_show_object_history,
+    operators_diff.SavePointsDiffItem,
+    operators_diff.SAVEPOINTS_UL_version_diff,
+    operators_diff.SAVEPOINTS_OT_compare_versions,
+    operators_region.SavePointsRegionHistoryItem,
+    operators_region.SAVEPOINTS_UL_region_history,
+    operators_region.SAVEPOINTS_OT_region_history,
+    operators_bisect.SAVEPOINTS_OT_bisect,
     operators_io.SAVEPOINTS_OT_export_project_zip,
     ui.SAVEPOINTS_MT_tag_menu,
     ui.SAVEPOINTS_UL_version_list,
@@ -57,7 +74,7 @@ addon_keymaps = []
 @persistent
 def load_handler(dummy):
     """Sync history when file is loaded."""
-    load_object_data.cache_clear()
+    clear_object_data_cache()
     max_retries = 20
     execution_state = {"retries": 0}
 
@@ -76,8 +93,12 @@ def load_handler(dummy):
             ui_utils.sync_history_to_props(context)
 
             if hasattr(context.scene, "savepoints_settings"):
+                settings = context.scene.savepoints_settings
                 # Reset autosave timer on load so autosave doesn't trigger immediately after opening a file
-                context.scene.savepoints_settings.last_autosave_timestamp = str(time.time())
+                settings.last_autosave_timestamp = str(time.time())
+
+                if settings.use_metadata_prefetch:
+                    start_object_data_prefetch()
         except Exception:
             print("[SavePoints] Error during delayed sync history on load.")
             traceback.print_exc()
@@ -87,6 +108,16 @@ def load_handler(dummy):
     bpy.app.timers.register(_delayed_sync_history, first_interval=0.01)
 
 
+@persistent
+def load_pre_handler(dummy):
+    """Stop background work and drop caches bound to the file that is being closed."""
+    stop_object_data_prefetch()
+    stop_live_render()
+    operators_object_history.cancel_ghost_preview_timers()
+    clear_parked_ghost_registry()
+    clear_single_ghost_registry()
+
+
 @persistent
 def auto_remap_paths_handler(dummy):
     """Handler to automatically remap paths when opening a snapshot."""
@@ -117,13 +148,35 @@ def register():
         default=False,
         update=operators_object_history.update_history_view_mode
     )
+    bpy.types.WindowManager.savepoints_diff_results = bpy.props.CollectionProperty(
+        type=operators_diff.SavePointsDiffItem
+    )
+    bpy.types.WindowManager.savepoints_diff_results_index = bpy.props.IntProperty()
+    bpy.types.WindowManager.savepoints_region_results = bpy.props.CollectionProperty(
+        type=operators_region.SavePointsRegionHistoryItem
+    )
+    bpy.types.WindowManager.savepoints_region_results_index = bpy.props.IntProperty(
+        update=operators_region.update_region_history_selection
+    )
+    bpy.types.WindowManager.savepoints_region_size = bpy.props.FloatProperty(
+        name="Size",
+        description="Edge length of the box around the 3D cursor queried by Region History",
+        default=2.0,
+        min=0.001,
+        soft_max=100.0,
+        subtype='DISTANCE',
+        update=operators_region.update_region_size
+    )
     bpy.types.VIEW3D_MT_object_context_menu.append(operators_object_history.draw_object_context_menu)
+    bpy.types.VIEW3D_MT_object_context_menu.append(operators_region.draw_region_context_menu)
 
+    bpy.app.handlers.load_pre.append(load_pre_handler)
     bpy.app.handlers.load_post.append(load_handler)
     bpy.app.handlers.load_post.append(auto_remap_paths_handler)
 
     if not bpy.app.timers.is_registered(autosave_timer):
         bpy.app.timers.register(autosave_timer, first_interval=10.0, persistent=True)
+    register_live_render()
 
     # Register Keymaps
     wm = bpy.context.window_manager
@@ -170,6 +223,12 @@ def unregister():
 
     if bpy.app.timers.is_registered(autosave_timer):
         bpy.app.timers.unregister(autosave_timer)
+    unregister_live_render()
+
+    stop_object_data_prefetch()
+    operators_object_history.cancel_ghost_preview_timers()
+    if load_pre_handler in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(load_pre_handler)
 
     if load_handler in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(load_handler)
@@ -186,9 +245,15 @@ def unregister():
     del bpy.types.Scene.savepoints_settings
 
     bpy.types.VIEW3D_MT_object_context_menu.remove(operators_object_history.draw_object_context_menu)
+    bpy.types.VIEW3D_MT_object_context_menu.remove(operators_region.draw_region_context_menu)
     del bpy.types.WindowManager.savepoints_object_history
     del bpy.types.WindowManager.savepoints_object_history_index
     del bpy.types.WindowManager.savepoints_object_history_show_all
+    del bpy.types.WindowManager.savepoints_diff_results
+    del bpy.types.WindowManager.savepoints_diff_results_index
+    del bpy.types.WindowManager.savepoints_region_results
+    del bpy.types.WindowManager.savepoints_region_results_index
+    del bpy.types.WindowManager.savepoints_region_size
 
 
 if __name__ == "__main__":
@@ -0,0 +1,184 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import os
+import shutil
+import tempfile
+
+import bpy
+
+from .services.batch_render import create_error_log_text_block
+from .services.bisect import (
+    EXIT_CONDITION_FALSE,
+    EXIT_CONDITION_TRUE,
+    BisectExecutor,
+    VersionBisector,
+    get_versions_since_first_presence,
+    object_missing,
+    vertex_count_exceeds,
+)
+from .ui_utils import set_active_version
+
+
+def get_bisect_version_ids(settings):
+    """Manual versions ordered oldest -> newest (the list is sorted newest first)."""
+    return [v.version_id for v in reversed(settings.versions) if v.version_id.startswith('v')]
+
+
+class SAVEPOINTS_OT_bisect(bpy.types.Operator):
+    """Binary-search the history for the first version where a condition holds"""
+    bl_idname = "savepoints.bisect"
+    bl_label = "Bisect History"
+    bl_options = {'REGISTER'}
+
+    _timer = None
+
+    condition: bpy.props.EnumProperty(
+        name="Condition",
+        items=[
+            ('VERTEX_COUNT', "Vertex Count Exceeds", "Object has more vertices than the threshold (metadata only)"),
+            ('OBJECT_MISSING', "Object Missing", "Object is not present in the version (metadata only)"),
+            ('SCRIPT', "Script", "Run a Text block against each tested snapshot in a background Blender. "
+                                 "The script must set `result = True` when the condition holds"),
+        ],
+        default='VERTEX_COUNT'
+    )
+    object_name: bpy.props.StringProperty(name="Object")
+    threshold: bpy.props.IntProperty(name="Threshold", min=0, default=10000)
+    script_name: bpy.props.StringProperty(name="Script")
+
+    @classmethod
+    def poll(cls, context):
+        return len(get_bisect_version_ids(context.scene.savepoints_settings)) > 0
+
+    def invoke(self, context, _event):
+        if not self.object_name and context.active_object:
+            self.object_name = context.active_object.name
+        return context.window_manager.invoke_props_dialog(self, width=400)
+
+    def draw(self, _context):
+        layout = self.layout
+        layout.prop(self, "condition")
+        if self.condition == 'SCRIPT':
+            layout.prop_search(self, "script_name", bpy.data, "texts")
+            layout.label(text="Set `result = True` in the script when the condition holds.", icon='INFO')
+        else:
+            layout.prop(self, "object_name")
+            if self.condition == 'VERTEX_COUNT':
+                layout.prop(self, "threshold")
+
+    def execute(self, context):
+        settings = context.scene.savepoints_settings
+        self.bisector = VersionBisector(get_bisect_version_ids(settings))
+
+        if self.condition == 'SCRIPT':
+            return self._start_script_bisect(context)
+
+        if not self.object_name:
+            self.report({'ERROR'}, "No object specified")
+            return {'CANCELLED'}
+
+        if self.condition == 'VERTEX_COUNT':
+            predicate = vertex_count_exceeds(self.object_name, self.threshold)
+        else:
+            predicate = object_missing(self.object_name)
+            version_ids = get_versions_since_first_presence(self.bisector.version_ids, self.object_name)
+            if version_ids is None:
+                self.report({'WARNING'}, f"'{self.object_name}' is not present in any version")
+                return {'CANCELLED'}
+            self.bisector = VersionBisector(version_ids)
+
+        try:
+            while not self.bisector.finished:
+                self.bisector.record(predicate(self.bisector.next_candidate()))
+        except Exception as e:
+            self.report({'ERROR'}, f"Bisect failed: {e}")
+            return {'CANCELLED'}
+
+        self._report_result(context)
+        return {'FINISHED'}
+
+    # --- Script mode (modal, one background Blender per tested version) ---
+
+    def _start_script_bisect(self, context):
+        text = bpy.data.texts.get(self.script_name)
+        if not text:
+            self.report({'ERROR'}, "Select a Text block to run")
+            return {'CANCELLED'}
+
+        self.temp_dir = tempfile.mkdtemp(prefix="sp_bisect_")
+        script_path = os.path.join(self.temp_dir, "bisect_check.py")
+        with open(script_path, 'w', encoding='utf-8') as f:
+            f.write(text.as_string())
+
+        self.executor = BisectExecutor(script_path, self.temp_dir, bpy.app.binary_path)
+        if not self._start_next(context):
+            return self._finish(context, cancelled=True)
+
+        self._timer = context.window_manager.event_timer_add(0.5, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.executor.cancel()
+            self.report({'WARNING'}, "Bisect Cancelled by User.")
+            return self._finish(context, cancelled=True)
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        version_id = self.executor.current_version_id
+        log_path = self.executor.current_log_path
+        return_code = self.executor.poll()
+        if return_code is None:
+            return {'RUNNING_MODAL'}
+
+        if return_code not in (EXIT_CONDITION_FALSE, EXIT_CONDITION_TRUE):
+            self.report({'ERROR'}, f"Check failed on {version_id} (Code {self.executor.last_return_code})")
+            if log_path:
+                create_error_log_text_block(version_id, log_path)
+                self.report({'WARNING'}, f"Check Text Editor 'Log_{version_id}' for details.")
+            return self._finish(context, cancelled=True)
+
+        self.bisector.record(return_code == EXIT_CONDITION_TRUE)
+        if self.bisector.finished:
+            self._report_result(context)
+            return self._finish(context)
+
+        if not self._start_next(context):
+            return self._finish(context, cancelled=True)
+        return {'RUNNING_MODAL'}
+
+    def _start_next(self, context):
+        version_id = self.bisector.next_candidate()
+        if not self.executor.start(version_id):
+            self.report({'ERROR'}, f"Could not check {version_id}")
+            return False
+
+        msg = f"SavePoints Bisect: testing {version_id} (~{self.bisector.remaining_steps} steps left)"
+        context.workspace.status_text_set(msg)
+        return True
+
+    def _finish(self, context, cancelled=False):
+        context.workspace.status_text_set(None)
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+
+        if hasattr(self, 'temp_dir') and os.path.exists(self.temp_dir):
+            try:
+                shutil.rmtree(self.temp_dir)
+            except Exception:
+                pass
+
+        return {'CANCELLED'} if cancelled else {'FINISHED'}
+
+    def _report_result(self, context):
+        steps = len(self.bisector.evaluated)
+        first = self.bisector.first_match
+        if first is None:
+            self.report({'INFO'}, f"Condition does not hold in any version ({steps} checked)")
+            return
+
+        set_active_version(context.scene.savepoints_settings, first)
+        self.report({'INFO'}, f"First version where the condition holds: {first} ({steps} checked)")
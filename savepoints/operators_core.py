@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import bpy
+from .services.live_render import queue_live_render
 from .services.manifest import load_manifest
 from .services.snapshot import create_snapshot, find_snapshot_path
 from .services.storage import get_parent_path_from_snapshot
@@ -59,6 +60,8 @@ class SAVEPOINTS_OT_commit(bpy.types.Operator):
         create_snapshot(context, new_id_str, self.note)
 
         settings = context.scene.savepoints_settings
+        if settings.batch_live_render:
+            queue_live_render(new_id_str)
         if settings.use_limit_versions and settings.max_versions_to_keep > 0:
             deleted = prune_versions(settings.max_versions_to_keep)
             if deleted > 0:
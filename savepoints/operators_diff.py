@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import bpy
+
+from .operators_object_history import CHANGE_TYPE_ICONS
+
+# Large scenes can produce tens of thousands of entries; filling a CollectionProperty that big stalls the UI.
+DIFF_DISPLAY_LIMIT = 2000
+
+DIFF_CHANGE_TYPE_ICONS = {
+    **CHANGE_TYPE_ICONS,
+    'CREATED': 'ADD',
+    'REMOVED': 'REMOVE',
+}
+
+
+class SavePointsDiffItem(bpy.types.PropertyGroup):
+    """Data storage for a single changed object in the version diff list."""
+    object_name: bpy.props.StringProperty()
+    change_type: bpy.props.StringProperty()
+    details: bpy.props.StringProperty()
+
+
+class SAVEPOINTS_UL_version_diff(bpy.types.UIList):
+    """UI List to display objects changed between two versions."""
+
+    def draw_item(self, _context, layout, _data, item, _icon, _active_data, _active_propname):
+        if self.layout_type not in {'DEFAULT', 'COMPACT'}:
+            return
+
+        row = layout.row()
+        split = row.split(factor=0.45)
+        split.label(text=item.object_name, icon='OBJECT_DATA')
+
+        split_2 = split.split(factor=0.4)
+        icon_name = DIFF_CHANGE_TYPE_ICONS.get(item.change_type, 'DOT')
+        split_2.label(text=item.change_type, icon=icon_name)
+        split_2.label(text=item.details)
+
+
+class SAVEPOINTS_OT_compare_versions(bpy.types.Operator):
+    """Compare two versions (or a version and the current scene) using stored object metadata"""
+    bl_idname = "savepoints.compare_versions"
+    bl_label = "Compare Versions"
+    bl_options = {'REGISTER'}
+
+    base_version_id: bpy.props.StringProperty(name="Base Version")
+    target_version_id: bpy.props.StringProperty(
+        name="Target Version",
+        description="Version to compare against. Leave empty to compare against the current scene"
+    )
+
+    summary: bpy.props.StringProperty(options={'SKIP_SAVE', 'HIDDEN'})
+
+    def invoke(self, context, _event):
+        if not self._populate(context):
+            return {'CANCELLED'}
+        return context.window_manager.invoke_popup(self, width=600)
+
+    def execute(self, context):
+        if not self._populate(context):
+            return {'CANCELLED'}
+        self.report({'INFO'}, self.summary)
+        return {'FINISHED'}
+
+    def _populate(self, context):
+        if not self.base_version_id:
+            self.report({'ERROR'}, "No base version specified")
+            return False
+
+        from .services.scene_diff import DIFF_CHANGE_TYPES, diff_versions
+
+        try:
+            diff = diff_versions(self.base_version_id, self.target_version_id or None)
+        except Exception as e:
+            self.report({'ERROR'}, f"Failed to compare versions: {e}")
+            return False
+
+        wm = context.window_manager
+        wm.savepoints_diff_results.clear()
+        for entry in diff.entries(limit=DIFF_DISPLAY_LIMIT):
+            item = wm.savepoints_diff_results.add()
+            item.object_name = entry['object_name']
+            item.change_type = entry['change_type']
+            item.details = entry['details']
+        wm.savepoints_diff_results_index = -1
+
+        counts = diff.counts()
+        self.summary = ", ".join(f"{counts[t]} {t.lower()}" for t in DIFF_CHANGE_TYPES if counts[t]) or "No changes"
+        return True
+
+    def draw(self, context):
+        layout = self.layout
+        wm = context.window_manager
+        target_label = self.target_version_id or "Current Scene"
+
+        row = layout.row()
+        row.label(text=f"{self.base_version_id} → {target_label}", icon='ARROW_LEFTRIGHT')
+        row.label(text=self.summary)
+
+        layout.separator()
+        layout.template_list(
+            "SAVEPOINTS_UL_version_diff", "",
+            wm, "savepoints_diff_results",
+            wm, "savepoints_diff_results_index",
+            rows=12
+        )
+
+        if len(wm.savepoints_diff_results) >= DIFF_DISPLAY_LIMIT:
+            layout.label(text=f"Showing the first {DIFF_DISPLAY_LIMIT} changes.", icon='INFO')
+
+
+def get_previous_version_id(settings, version_id):
+    """Returns the version saved right before version_id (the list is sorted newest first)."""
+    ids = [v.version_id for v in settings.versions if v.version_id.startswith('v')]
+    if version_id not in ids:
+        return None
+    idx = ids.index(version_id)
+    return ids[idx + 1] if idx + 1 < len(ids) else None
+
+
+def draw_compare_buttons(layout, settings, version_id):
+    row = layout.row(align=True)
+    op = row.operator(SAVEPOINTS_OT_compare_versions.bl_idname, text="Diff vs Scene", icon='ARROW_LEFTRIGHT')
+    op.base_version_id = version_id
+    op.target_version_id = ""
+
+    previous_id = get_previous_version_id(settings, version_id)
+    sub = row.row(align=True)
+    sub.enabled = previous_id is not None
+    op = sub.operator(SAVEPOINTS_OT_compare_versions.bl_idname, text="Diff vs Previous", icon='TIME')
+    op.base_version_id = previous_id or ""
+    op.target_version_id = version_id
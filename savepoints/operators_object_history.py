@@ -2,9 +2,25 @@
 
 import bpy
 
-from .services.ghost import load_single_object_ghost, cleanup_single_object_ghost
+from .services.ghost import (
+    cleanup_single_object_ghost,
+    get_cached_single_ghost_keys,
+    load_single_object_ghost,
+    prefetch_single_object_ghost,
+)
 from .services.object_history import compare_object_history
 
+# Seconds the list index must stay put before a preview is linked (arrow-key scrolling)
+GHOST_PREVIEW_DELAY = 0.15
+# Idle time before neighbouring entries are prefetched, and between two prefetches
+GHOST_PREFETCH_DELAY = 0.4
+GHOST_PREFETCH_RADIUS = 2
+
+# (version_id, object_name) waiting for the debounce timer
+_pending_preview = None
+# Neighbouring (version_id, object_name) entries still to prefetch, nearest first
+_prefetch_queue = []
+
 CHANGE_TYPE_ICONS = {
     'MAJOR': 'MESH_DATA',
     'MINOR': 'MOD_EDGESPLIT',
@@ -87,8 +103,10 @@ class SAVEPOINTS_UL_object_history(bpy.types.UIList):
 def update_ghost_preview(self, context):
     """
     Callback triggered when the history list index changes.
-    Loads the ghost overlay for the selected version.
+    The ghost for the selected version is linked once the index has settled for
+    GHOST_PREVIEW_DELAY; neighbouring versions are then prefetched while idle.
     """
+    global _pending_preview
     wm = context.window_manager
     idx = wm.savepoints_object_history_index
     history = wm.savepoints_object_history
@@ -97,17 +115,73 @@ def update_ghost_preview(self, context):
     if not obj:
         return
 
-    if 0 <= idx < len(history):
-        item = history[idx]
-        try:
-            load_single_object_ghost(item.version_id, obj.name, context)
-        except Exception as e:
-            print(f"[SavePoints] Ghost load error for {item.version_id}: {e}")
+    cancel_ghost_preview_timers()
 
+    if 0 <= idx < len(history):
+        _pending_preview = (history[idx].version_id, obj.name)
+        _prefetch_queue[:] = _get_neighbour_keys(history, idx, obj.name)
+        if _pending_preview in get_cached_single_ghost_keys():
+            # Already linked: showing it is just a relink, no need to wait
+            _apply_ghost_preview()
+        else:
+            bpy.app.timers.register(_apply_ghost_preview, first_interval=GHOST_PREVIEW_DELAY)
     else:
         cleanup_single_object_ghost(obj.name, context)
 
 
+def flush_ghost_preview():
+    """Loads the pending preview right away instead of waiting for the debounce timer."""
+    if bpy.app.timers.is_registered(_apply_ghost_preview):
+        bpy.app.timers.unregister(_apply_ghost_preview)
+    _apply_ghost_preview()
+
+
+def cancel_ghost_preview_timers():
+    global _pending_preview
+    _pending_preview = None
+    for timer in (_apply_ghost_preview, _prefetch_next_ghost):
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
+
+
+def _get_neighbour_keys(history, idx, object_name):
+    keys = []
+    for offset in range(1, GHOST_PREFETCH_RADIUS + 1):
+        for neighbour in (idx + offset, idx - offset):
+            if 0 <= neighbour < len(history):
+                keys.append((history[neighbour].version_id, object_name))
+    return keys
+
+
+def _apply_ghost_preview():
+    global _pending_preview
+    pending, _pending_preview = _pending_preview, None
+    if pending is None:
+        return None
+
+    version_id, object_name = pending
+    try:
+        load_single_object_ghost(version_id, object_name, bpy.context)
+    except Exception as e:
+        print(f"[SavePoints] Ghost load error for {version_id}: {e}")
+
+    if _prefetch_queue and not bpy.app.timers.is_registered(_prefetch_next_ghost):
+        bpy.app.timers.register(_prefetch_next_ghost, first_interval=GHOST_PREFETCH_DELAY)
+    return None
+
+
+def _prefetch_next_ghost():
+    """Timer: links one neighbouring version per tick so the UI stays responsive."""
+    while _prefetch_queue:
+        version_id, object_name = _prefetch_queue.pop(0)
+        try:
+            if prefetch_single_object_ghost(version_id, object_name, bpy.context):
+                return GHOST_PREFETCH_DELAY if _prefetch_queue else None
+        except Exception as e:
+            print(f"[SavePoints] Ghost prefetch error for {version_id}: {e}")
+    return None
+
+
 class SAVEPOINTS_OT_show_object_history(bpy.types.Operator):
     """Show history and ghost previews for the active object"""
     bl_idname = "savepoints.show_object_history"
@@ -156,6 +230,8 @@ class SAVEPOINTS_OT_show_object_history(bpy.types.Operator):
         self._cleanup(context)
 
     def _cleanup(self, context):
+        cancel_ghost_preview_timers()
+        _prefetch_queue.clear()
         obj = context.active_object
         if obj:
             cleanup_single_object_ghost(obj.name, context)
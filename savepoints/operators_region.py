@@ -0,0 +1,174 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import bpy
+
+from .operators_diff import DIFF_CHANGE_TYPE_ICONS
+from .ui_utils import set_active_version
+
+
+class SavePointsRegionHistoryItem(bpy.types.PropertyGroup):
+    """Data storage for a single version in the region history list."""
+    version_id: bpy.props.StringProperty()
+    change_type: bpy.props.StringProperty()
+    details: bpy.props.StringProperty()
+    objects: bpy.props.StringProperty()
+
+
+class SAVEPOINTS_UL_region_history(bpy.types.UIList):
+    """UI List to display versions that changed something inside a region."""
+
+    def draw_item(self, _context, layout, _data, item, _icon, _active_data, _active_propname):
+        if self.layout_type not in {'DEFAULT', 'COMPACT'}:
+            return
+
+        row = layout.row()
+        split = row.split(factor=0.12)
+        split.label(text=item.version_id)
+
+        split_2 = split.split(factor=0.35)
+        icon_name = DIFF_CHANGE_TYPE_ICONS.get(item.change_type, 'DOT')
+        split_2.label(text=item.details, icon=icon_name)
+        split_2.label(text=item.objects)
+
+
+def update_region_history_selection(self, context):
+    """Selecting an entry makes its version the active one in the main list."""
+    wm = context.window_manager
+    idx = wm.savepoints_region_results_index
+    if not (0 <= idx < len(wm.savepoints_region_results)):
+        return
+
+    set_active_version(context.scene.savepoints_settings, wm.savepoints_region_results[idx].version_id)
+
+
+def get_selection_bounds(objects):
+    """World-space AABB (min, max) enclosing the given objects, or None if empty."""
+    from mathutils import Vector
+
+    corners = [obj.matrix_world @ Vector(c) for obj in objects for c in obj.bound_box]
+    if not corners:
+        return None
+
+    region_min = [min(c[axis] for c in corners) for axis in range(3)]
+    region_max = [max(c[axis] for c in corners) for axis in range(3)]
+    return region_min, region_max
+
+
+def get_cursor_bounds(context, size):
+    """World-space AABB (min, max) of a cube with edges of length size centred on the 3D cursor."""
+    center = context.scene.cursor.location
+    half = size / 2.0
+    return [center[axis] - half for axis in range(3)], [center[axis] + half for axis in range(3)]
+
+
+def populate_region_results(context, bounds) -> int:
+    """Fills the window manager's region history list with the versions that changed inside bounds."""
+    from .services.spatial_index import get_spatial_change_index
+
+    index = get_spatial_change_index()
+    results = index.query(*bounds) if index else []
+
+    wm = context.window_manager
+    wm.savepoints_region_results.clear()
+    for r in results:
+        item = wm.savepoints_region_results.add()
+        item.version_id = r['version_id']
+        counts = r['counts']
+        # Show the dominant change type's icon, the full breakdown in the details
+        item.change_type = max(counts, key=counts.get)
+        item.details = ", ".join(f"{n} {t.lower()}" for t, n in counts.items())
+        item.objects = ", ".join(r['objects'])
+    # Set the raw value so the update callback does not change the active version
+    wm["savepoints_region_results_index"] = -1
+    return len(results)
+
+
+def update_region_size(self, context):
+    """Resizing the cursor box in the open popup queries again."""
+    try:
+        populate_region_results(context, get_cursor_bounds(context, self.savepoints_region_size))
+    except Exception as e:
+        print(f"[SavePoints] Failed to query region history: {e}")
+
+
+def _format_summary(count):
+    return f"{count} versions changed this region" if count else "No changes in this region"
+
+
+class SAVEPOINTS_OT_region_history(bpy.types.Operator):
+    """List the versions in which anything changed inside the selected objects' bounds or a box around the 3D cursor"""
+    bl_idname = "savepoints.region_history"
+    bl_label = "Region History"
+    bl_options = {'REGISTER'}
+
+    source: bpy.props.EnumProperty(
+        name="Region",
+        items=[
+            ('SELECTION', "Selected Objects", "Bounds of the selected objects"),
+            ('CURSOR', "3D Cursor", "Box around the 3D cursor, sized by Region Size"),
+        ],
+        default='SELECTION'
+    )
+    summary: bpy.props.StringProperty(options={'SKIP_SAVE', 'HIDDEN'})
+
+    def invoke(self, context, _event):
+        if not self._populate(context):
+            return {'CANCELLED'}
+        return context.window_manager.invoke_popup(self, width=600)
+
+    def execute(self, context):
+        if not self._populate(context):
+            return {'CANCELLED'}
+        self.report({'INFO'}, self.summary)
+        return {'FINISHED'}
+
+    def _populate(self, context):
+        if self.source == 'CURSOR':
+            bounds = get_cursor_bounds(context, context.window_manager.savepoints_region_size)
+        else:
+            bounds = get_selection_bounds(context.selected_objects)
+            if bounds is None:
+                self.report({'ERROR'}, "No objects selected")
+                return False
+
+        try:
+            count = populate_region_results(context, bounds)
+        except Exception as e:
+            self.report({'ERROR'}, f"Failed to query region history: {e}")
+            return False
+
+        self.summary = _format_summary(count)
+        return True
+
+    def draw(self, context):
+        layout = self.layout
+        wm = context.window_manager
+
+        row = layout.row()
+        if self.source == 'CURSOR':
+            row.label(text="Box around the 3D cursor", icon='PIVOT_CURSOR')
+            row.prop(wm, "savepoints_region_size")
+            row.label(text=_format_summary(len(wm.savepoints_region_results)))
+        else:
+            row.label(text="Region of selected objects", icon='SELECT_SET')
+            row.label(text=self.summary)
+
+        layout.separator()
+        layout.template_list(
+            "SAVEPOINTS_UL_region_history", "",
+            wm, "savepoints_region_results",
+            wm, "savepoints_region_results_index",
+            rows=10
+        )
+
+        layout.separator()
+        layout.label(text="Click an entry to make it the active version", icon='INFO')
+
+
+def draw_region_context_menu(self, _context):
+    layout = self.layout
+    layout.operator_context = 'INVOKE_DEFAULT'
+    layout.operator(SAVEPOINTS_OT_region_history.bl_idname, text="Show Region History", icon='MOD_LATTICE')
+    op = layout.operator(SAVEPOINTS_OT_region_history.bl_idname, text="Show Region History at 3D Cursor",
+                         icon='PIVOT_CURSOR')
+    op.source = 'CURSOR'
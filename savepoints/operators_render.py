@@ -4,15 +4,64 @@ import json
 import os
 import shutil
 import tempfile
+import time
 
 import bpy
 
-from .services.batch_executor import BatchRenderExecutor
+from .services.batch_executor import BatchRenderExecutor, get_threads_per_worker
+from .services.batch_journal import (
+    STATES_WITH_OUTPUT,
+    TASK_CACHED,
+    TASK_DONE,
+    TASK_FAILED,
+    TASK_MISSING,
+    TASK_SKIPPED,
+    BatchJournal,
+    find_resumable_batches,
+)
+from .services.batch_report import (
+    BATCH_REPORT_TEXT_NAME,
+    build_static_record,
+    build_task_record,
+    format_batch_report,
+    summarize,
+    write_batch_report,
+)
 from .services.batch_render import extract_render_settings, get_worker_script_path, get_batch_render_output_dir, \
-    create_error_log_text_block
+    create_error_log_text_block, create_report_text_block, format_duration, write_world_library, \
+    apply_performance_sweep_settings, extract_view_settings, get_world_image_paths
+from .services.batch_order import layout_timelapse, progressive_order
+from .services.ghost_filter import get_camera_view_projection
+from .services.gpu_probe import GpuProbe, build_gpu_config
+from .services.live_render import get_live_render_dir
+from .services.perf_sweep import (
+    PERF_METRICS,
+    PERF_SWEEP_RESOLUTION,
+    PERF_SWEEP_SAMPLES,
+    analyze_sweep,
+    format_metric,
+    write_sweep,
+)
 from .services.post_process import open_folder_platform_independent, create_vse_timelapse, send_os_notification, \
-    launch_timelapse_mp4_generation
+    launch_timelapse_mp4_generation, update_vse_timelapse, get_timelapse_scene_name, FRAMES_PER_IMAGE
+from .services.render_cache import (
+    find_cached_render,
+    find_render_output,
+    get_render_cache_dir,
+    get_render_cache_key,
+    get_settings_fingerprint,
+    hash_snapshot,
+    hash_world_library,
+    load_snapshot_hash_index,
+    restore_render,
+    save_snapshot_hash_index,
+    store_render,
+)
 from .services.selection import get_selected_versions
+from .services.snapshot import find_snapshot_path
+from .services.time_budget import TimeBudgetPlanner, format_quality, pick_calibration_versions
+
+SKIP_REPORT_TEXT_NAME = "SavePoints_Skip_Report"
 
 
 def draw_batch_dialog(operator, layout, context):
@@ -21,15 +70,71 @@ def draw_batch_dialog(operator, layout, context):
     settings = scene.savepoints_settings
 
     # Dry Run Toggle
-    row = layout.row()
+    row = layout.row(align=True)
     row.scale_y = 1.2
     row.prop(operator, "dry_run", toggle=True)
+    row.prop(operator, "performance_sweep", toggle=True)
+
+    if operator.performance_sweep:
+        _draw_performance_sweep_info(layout)
+        return
 
     if operator.dry_run:
         _draw_dry_run_info(layout)
     else:
         _draw_final_render_info(layout, scene, settings)
 
+    _draw_view_settings(layout, settings)
+    _draw_concurrency_settings(layout, settings)
+
+
+def _draw_view_settings(layout, settings):
+    box = layout.box()
+    box.prop(settings, "batch_view_mode")
+    if settings.batch_view_mode == 'COLLECTION':
+        box.prop(settings, "batch_camera_collection")
+    elif settings.batch_view_mode == 'TURNTABLE':
+        col = box.column(align=True)
+        col.prop(settings, "batch_turntable_steps")
+        col.prop(settings, "batch_turntable_pivot")
+    if settings.batch_view_mode != 'CAMERA':
+        box.label(text="One folder and timelapse per view. No render cache.", icon='INFO')
+
+
+def _draw_performance_sweep_info(layout):
+    box = layout.box()
+    col = box.column(align=True)
+    row = col.row()
+    row.alignment = 'CENTER'
+    row.label(text="PERFORMANCE SWEEP", icon='SORTTIME')
+    col.separator()
+    col.label(text=f"• Resolution: {PERF_SWEEP_RESOLUTION}%, Samples: {PERF_SWEEP_SAMPLES}")
+    col.label(text="• One render at a time, no render cache")
+    col.label(text="• Records render time, memory, triangles, textures")
+    col.label(text="• Folder: ..._perf")
+    box.label(text="The version where render cost jumps is highlighted.", icon='INFO')
+
+
+def _draw_concurrency_settings(layout, settings):
+    box = layout.box()
+    box.prop(settings, "batch_use_render_cache")
+    box.prop(settings, "batch_progressive_order")
+    box.prop(settings, "batch_skip_redundant")
+    col = box.column(align=True)
+    col.prop(settings, "batch_max_workers")
+    col.prop(settings, "batch_threads_per_worker")
+    threads = get_threads_per_worker(settings.batch_max_workers, settings.batch_threads_per_worker)
+    if threads:
+        col.label(text=f"{settings.batch_max_workers} x {threads} threads", icon='INFO')
+    if settings.batch_max_workers > 1:
+        col.prop(settings, "batch_partition_gpus")
+
+    col = box.column(align=True)
+    col.prop(settings, "batch_persistent_workers")
+    if settings.batch_persistent_workers:
+        col.prop(settings, "batch_jobs_per_worker")
+        col.prop(settings, "batch_worker_memory_limit")
+
 
 def _draw_dry_run_info(layout):
     box = layout.box()
@@ -89,9 +194,23 @@ def _draw_final_render_info(layout, scene, settings):
         if settings.batch_burn_in:
             col_sub.prop(settings, "batch_burn_in_pos")
 
+    # Time Budget
+    sub.separator()
+    sub.prop(settings, "batch_time_budget")
+    if settings.batch_time_budget:
+        sub.label(text=f"  Quality is lowered as needed to fit {count} versions", icon='TIME')
+
     box.label(text="This may take a while.", icon='INFO')
 
 
+def _format_task_progress(version_id, progress):
+    if 'percent' in progress:
+        return f"{version_id} {progress['percent']:.0f}%"
+    if progress.get('phase'):
+        return f"{version_id} ({progress['phase']})"
+    return version_id
+
+
 class SAVEPOINTS_OT_batch_render(bpy.types.Operator):
     """
     Batch Render selected versions. (Shift+Click to Skip Dialog & RENDER)
@@ -113,9 +232,24 @@ class SAVEPOINTS_OT_batch_render(bpy.types.Operator):
         default=False
     )
 
+    performance_sweep: bpy.props.BoolProperty(
+        name="Performance Sweep",
+        description="Render every selected version with the same fixed low settings and chart render time, "
+                    "memory, triangles and texture memory to find where render cost jumped",
+        default=False
+    )
+
+    resume_dir: bpy.props.StringProperty(
+        name="Resume Folder",
+        description="Output folder of an interrupted batch to continue (see savepoints.resume_batch_render)",
+        default="",
+        options={'HIDDEN', 'SKIP_SAVE'}
+    )
+
     def invoke(self, context, event):
         if event.shift:
             self.dry_run = False
+            self.performance_sweep = False
             self.report({'INFO'}, "🚀 Instant Batch Render Started! (Shift+Click)")
             return self.execute(context)
         return context.window_manager.invoke_props_dialog(self, width=400)
@@ -136,8 +270,11 @@ class SAVEPOINTS_OT_batch_render(bpy.types.Operator):
                 shutil.rmtree(self.temp_dir)
             return {'CANCELLED'}
 
-        total_tasks = len(self.target_versions)
-        self.report({'INFO'}, f"Batch Render Started: {total_tasks} versions.")
+        total_tasks = len(self.target_version_ids)
+        if self.journal and self.resume_dir:
+            self.report({'INFO'}, f"Batch Render Resumed: {total_tasks} versions left.")
+        else:
+            self.report({'INFO'}, f"Batch Render Started: {total_tasks} versions.")
         context.window_manager.progress_begin(0, total_tasks)
 
         self._timer = context.window_manager.event_timer_add(0.5, window=context.window)
@@ -149,6 +286,10 @@ class SAVEPOINTS_OT_batch_render(bpy.types.Operator):
         if event.type == 'TIMER':
             return self._handle_executor_update(context)
         elif event.type == 'ESC':
+            if self.gpu_probe:
+                self.gpu_probe.cancel()
+            if self.calibration:
+                self.calibration.cancel()
             self.executor.cancel()
             self.report({'WARNING'}, "Batch Render Cancelled by User.")
             return self.finish(context)
@@ -156,12 +297,26 @@ class SAVEPOINTS_OT_batch_render(bpy.types.Operator):
         return {'PASS_THROUGH'}
 
     def _prepare_execution(self, context):
-        """Initializes directories, json config, and executor."""
+        """Initializes directories, json config, journal and executor."""
         self.settings = context.scene.savepoints_settings
-        self.target_versions = get_selected_versions(self.settings)
-
-        if not self.target_versions:
-            raise Exception("No versions found to render.")
+        self.journal = None
+        self.report_records = []
+        self.batch_started = time.monotonic()
+
+        if self.resume_dir:
+            self.journal = BatchJournal.load(self.resume_dir)
+            if self.journal is None:
+                raise Exception(f"No batch journal found in {self.resume_dir}")
+            self.dry_run = self.journal.dry_run
+            self.performance_sweep = bool(self.journal.render_settings.get("collect_scene_stats"))
+            self.target_version_ids = self.journal.incomplete_version_ids()
+            if not self.target_version_ids:
+                self.journal.mark_finished()
+                raise Exception("Nothing left to render in this batch.")
+        else:
+            self.target_version_ids = [v.version_id for v in get_selected_versions(self.settings)]
+            if not self.target_version_ids:
+                raise Exception("No versions found to render.")
 
         self.temp_dir = tempfile.mkdtemp(prefix="sp_batch_")
         self.settings_path = os.path.join(self.temp_dir, "render_config.json")
@@ -171,56 +326,351 @@ class SAVEPOINTS_OT_batch_render(bpy.types.Operator):
             raise FileNotFoundError(f"Worker script not found at {self.worker_script_path}")
 
         try:
-            render_settings = extract_render_settings(context, dry_run=self.dry_run)
-            with open(self.settings_path, 'w') as f:
-                json.dump(render_settings, f, indent=4)
+            if self.journal:
+                render_settings = dict(self.journal.render_settings)
+            else:
+                render_settings = extract_render_settings(context, dry_run=self.dry_run)
+                if self.performance_sweep:
+                    apply_performance_sweep_settings(render_settings, PERF_SWEEP_RESOLUTION, PERF_SWEEP_SAMPLES)
+                # A sweep measures the scene through its own camera only
+                if self.settings.batch_view_mode != 'CAMERA' and not self.performance_sweep:
+                    render_settings["views"] = self._extract_views(context)
+            self.view_names = [view["name"] for view in render_settings.get("views") or []]
+            world = bpy.data.worlds.get(render_settings.get("world_name") or "")
+            render_settings["world_blend_path"] = write_world_library(world, self.temp_dir)
+            self.render_settings = render_settings
+            # Devices are probed in the background; no worker is dispatched until the probe is done
+            self.gpu_probe = None
+            if render_settings.get("engine") == 'CYCLES':
+                self.gpu_probe = GpuProbe(bpy.app.binary_path, self.temp_dir)
+                self.gpu_probe.start()
+            self._write_render_config()
         except Exception as e:
             raise Exception(f"Initialization failed: {e}")
 
-        self.output_dir = get_batch_render_output_dir(dry_run=self.dry_run)
+        self.output_dir = self.resume_dir or get_batch_render_output_dir(
+            dry_run=self.dry_run, performance_sweep=self.performance_sweep
+        )
         os.makedirs(self.output_dir, exist_ok=True)
 
-        self.executor = BatchRenderExecutor(
-            tasks=self.target_versions,
+        render_tasks = list(self.target_version_ids)
+        self.skipped_redundant = []
+        # A resumed batch already made this decision; its journal lists the skipped versions as done
+        # A sweep measures every version, so neither skipping nor cached renders apply to it.
+        # Both only know the scene camera and a single image per version, so multi-view batches skip them too
+        if self.settings.batch_skip_redundant and not self.journal and not self.performance_sweep \
+                and not self.view_names:
+            render_tasks = self._skip_redundant_versions(context, render_tasks)
+
+        self.cache_keys = {}
+        self.cache_hits = []
+        if self.settings.batch_use_render_cache and not self.performance_sweep and not self.view_names:
+            render_tasks = self._restore_cached_renders(render_tasks, render_settings)
+
+        if self.settings.batch_progressive_order:
+            render_tasks = self._order_progressively(render_tasks)
+
+        if self.journal:
+            time_budget = self.journal.data.get('time_budget', 0)
+        else:
+            # Budgets apply to final renders; dry runs and sweeps have fixed settings of their own
+            time_budget = 0 if self.dry_run or self.performance_sweep else self.settings.batch_time_budget * 60
+            self.journal = BatchJournal.create(self.output_dir, self.target_version_ids, render_settings, self.dry_run)
+            self.journal.data['time_budget'] = time_budget
+        for vid in self.skipped_redundant:
+            self.journal.mark(vid, TASK_SKIPPED, save=False)
+            self.report_records.append(build_static_record(vid, TASK_SKIPPED))
+        for vid in self.cache_hits:
+            output_file = find_render_output(self.output_dir, f"{vid}_render")
+            self.journal.mark(vid, TASK_CACHED, output_file, save=False)
+            self.report_records.append(build_static_record(vid, TASK_CACHED, output_file))
+        self.journal.save()
+
+        # Progressive final renders keep the timelapse scene up to date while the batch runs
+        self.progressive_timelapse = (self.settings.batch_progressive_order and not self.dry_run
+                                      and not self.performance_sweep and not self.view_names)
+        self.timelapse_scene_name = None
+        self.timelapse_frames = self._get_rendered_outputs() if self.progressive_timelapse else {}
+
+        self.planner = None
+        self.calibration = None
+        self.task_quality = {}
+        if time_budget and render_tasks:
+            self.planner = TimeBudgetPlanner(
+                time_budget, render_settings.get("resolution_percentage", 100), render_settings.get("samples", 1),
+                self._max_workers(), started_at=self.batch_started
+            )
+            # Calibration renders go to the temp folder; their timings seed the planner
+            calibration_dir = os.path.join(self.temp_dir, "calibration")
+            os.makedirs(calibration_dir, exist_ok=True)
+            self.calibration = self._create_executor(
+                pick_calibration_versions(render_tasks), calibration_dir,
+                lambda _vid: self.planner.calibration_quality()
+            )
+
+        self.executor = self._create_executor(
+            render_tasks, self.output_dir, self._plan_task_quality if self.planner else None
+        )
+
+    def _write_render_config(self):
+        with open(self.settings_path, 'w') as f:
+            json.dump(self.render_settings, f, indent=4)
+
+    def _wait_for_gpu_probe(self, context) -> bool:
+        """True while the GPU probe still runs. Once it is done, its devices go into the render config."""
+        if not self.gpu_probe.poll():
+            context.workspace.status_text_set("SavePoints Batch: Detecting GPUs...")
+            return True
+
+        probe = self.gpu_probe.result
+        self.gpu_probe = None
+        # Without a result, the config keeps no device list and every worker probes for itself
+        if probe is not None:
+            self.render_settings["gpu"] = build_gpu_config(
+                probe, self._max_workers(), self.settings.batch_partition_gpus
+            )
+            self._write_render_config()
+        return False
+
+    def _create_executor(self, tasks, output_dir, quality_provider=None):
+        return BatchRenderExecutor(
+            tasks=tasks,
             temp_dir=self.temp_dir,
-            output_dir=self.output_dir,
+            output_dir=output_dir,
             settings_path=self.settings_path,
             worker_script_path=self.worker_script_path,
-            blender_bin=bpy.app.binary_path
+            blender_bin=bpy.app.binary_path,
+            max_workers=self._max_workers(),
+            threads_per_worker=0 if self.performance_sweep else self.settings.batch_threads_per_worker,
+            # A long-lived worker reports the peak memory of every version it rendered so far, not of this one
+            persistent=self.settings.batch_persistent_workers and not self.performance_sweep,
+            jobs_per_worker=self.settings.batch_jobs_per_worker,
+            worker_memory_limit_mb=self.settings.batch_worker_memory_limit,
+            quality_provider=quality_provider
         )
 
-    def _handle_executor_update(self, context):
-        """Delegates update logic to executor and handles status."""
-        status_info = self.executor.update()
-        status = status_info.get('status')
-
-        if status == 'TASK_FINISHED':
-            self._on_task_finished(context, status_info)
-        elif status == 'SKIPPED':
-            self._on_task_skipped(context, status_info)
-        elif status == 'FINISHED':
-            return self.finish(context)
-        elif status == 'CANCELLED':
-            return self.finish(context)
+    def _plan_task_quality(self, version_id):
+        # The task being started has left the queue; renders in flight are counted as half done
+        tasks_left = len(self.executor.task_queue) + 1 + 0.5 * len(self.executor.running_version_ids)
+        quality = self.planner.plan(tasks_left)
+        self.task_quality[version_id] = quality
+        return quality
+
+    def _skip_redundant_versions(self, context, version_ids):
+        """
+        Drops versions with no visible change since the previously rendered one (see render_skip).
+        The decisions are written to skipped_versions.json and a Text Block. Returns the versions to render.
+        """
+        view_projection = get_camera_view_projection(context)
+        if view_projection is None:
+            self.report({'WARNING'}, "Skip Without Visible Changes needs a scene camera. Rendering all versions.")
+            return version_ids
+
+        from .services.render_skip import find_redundant_versions, format_skip_report, write_skip_report
+
+        camera = context.scene.camera
+        # Selected versions are listed newest first; changes are measured forward in time
+        decisions = find_redundant_versions(list(reversed(version_ids)), view_projection, ignore_names=[camera.name])
+        self.skipped_redundant = [d.version_id for d in decisions if not d.render]
+
+        write_skip_report(self.output_dir, decisions)
+        create_report_text_block(SKIP_REPORT_TEXT_NAME, format_skip_report(decisions))
+        if self.skipped_redundant:
+            self.report({'INFO'}, f"Skipped {len(self.skipped_redundant)} versions without visible changes. "
+                                  f"See Text Editor '{SKIP_REPORT_TEXT_NAME}'.")
+
+        skipped = set(self.skipped_redundant)
+        return [vid for vid in version_ids if vid not in skipped]
+
+    def _extract_views(self, context):
+        pivot = self.settings.batch_turntable_pivot
+        views = extract_view_settings(
+            context, self.settings.batch_view_mode, collection=self.settings.batch_camera_collection,
+            steps=self.settings.batch_turntable_steps, pivot=pivot.matrix_world.translation if pivot else None
+        )
+        if not views:
+            if self.settings.batch_view_mode == 'COLLECTION':
+                raise Exception("No cameras found in the selected camera collection.")
+            raise Exception("Turntable needs a scene camera.")
+        if len({view["name"] for view in views}) != len(views):
+            raise Exception("Camera names must be unique after removing special characters.")
+        return views
+
+    def _find_task_output(self, vid):
+        # Multi-view batches write one folder per view; the first view stands for the version
+        folder = os.path.join(self.output_dir, self.view_names[0]) if self.view_names else self.output_dir
+        return find_render_output(folder, f"{vid}_render")
+
+    def _get_sequence_dirs(self):
+        """(folder, scene name suffix) of every image sequence: one per view in multi-view batches."""
+        if not self.view_names:
+            return [(self.output_dir, "_Timelapse")]
+        batch_name = os.path.basename(self.output_dir.rstrip(os.sep))
+        return [(os.path.join(self.output_dir, name), f"_{batch_name}_Timelapse") for name in self.view_names]
+
+    def _order_progressively(self, version_ids):
+        """Milestones, then other tagged versions, then a bisection of the timeline (see batch_order)."""
+        tags = {v.version_id: v.tag for v in self.settings.versions}
+        # Selected versions are listed newest first
+        oldest_first = list(reversed(version_ids))
+        milestones = [vid for vid in oldest_first if tags.get(vid) == 'MILESTONE']
+        tagged = [vid for vid in oldest_first if tags.get(vid) not in (None, 'NONE', 'MILESTONE')]
+        return progressive_order(oldest_first, milestones + tagged)
+
+    def _get_rendered_outputs(self):
+        """Images already in the output folder (cached, or rendered before a resume), by version id."""
+        outputs = {}
+        for vid, entry in self.journal.data['tasks'].items():
+            if entry.get('state') in STATES_WITH_OUTPUT and entry.get('output'):
+                path = os.path.join(self.output_dir, entry['output'])
+                if os.path.exists(path):
+                    outputs[vid] = path
+        return outputs
+
+    def _refresh_progressive_timelapse(self, final=False):
+        """Lays the rendered images out on the timelapse timeline; gaps hold the previous image until final."""
+        slot_ids = list(reversed(self.journal.data.get('order', [])))
+        frames = layout_timelapse(slot_ids, self.timelapse_frames, FRAMES_PER_IMAGE, hold_gaps=not final)
+        if not frames:
+            return None
+        scene_name = self.timelapse_scene_name or get_timelapse_scene_name(self.output_dir)
+        self.timelapse_scene_name = update_vse_timelapse(scene_name, frames)
+        return self.timelapse_scene_name
+
+    def _restore_cached_renders(self, version_ids, render_settings):
+        """Copies renders of unchanged snapshots from the render cache. Returns the versions still to render."""
+        self.cache_dir = get_render_cache_dir()
+        world = bpy.data.worlds.get(render_settings.get("world_name") or "")
+        world_blend_path = render_settings.get("world_blend_path")
+        try:
+            if world and not world_blend_path:
+                # Workers append the world from the live main file, whose edits no key can see
+                raise OSError("the world library could not be written")
+            world_hash = hash_world_library(world_blend_path, get_world_image_paths(world)) if world else None
+        except OSError as e:
+            print(f"[SavePoints] Render cache skipped: {e}")
+            return version_ids
+        fingerprint = get_settings_fingerprint(render_settings, world_hash=world_hash)
+        hash_index = load_snapshot_hash_index(self.cache_dir)
+
+        to_render = []
+        for version_id in version_ids:
+            snapshot_path = find_snapshot_path(version_id)
+            if not snapshot_path:
+                # Let the executor report it as skipped
+                to_render.append(version_id)
+                continue
+
+            try:
+                key = get_render_cache_key(hash_snapshot(snapshot_path, hash_index), fingerprint)
+                cached = find_cached_render(self.cache_dir, key)
+                if cached:
+                    restore_render(cached, self.output_dir, f"{version_id}_render")
+                    self.cache_hits.append(version_id)
+                    continue
+                self.cache_keys[version_id] = key
+            except OSError as e:
+                print(f"[SavePoints] Render cache lookup failed for {version_id}: {e}")
+            to_render.append(version_id)
+
+        save_snapshot_hash_index(self.cache_dir, hash_index)
+        if self.cache_hits:
+            self.report({'INFO'}, f"Reused {len(self.cache_hits)} cached renders.")
+        return to_render
+
+    def _handle_calibration_update(self, context):
+        """Runs the calibration renders of a time-budgeted batch, then hands over to the batch itself."""
+        for status_info in self.calibration.update():
+            status = status_info.get('status')
+
+            if status == 'TASK_FINISHED' and status_info['return_code'] == 0:
+                self.planner.add_observation(self.planner.calibration_quality(), status_info['duration'],
+                                             status_info['render_time'])
+            elif status == 'CANCELLED':
+                return self.finish(context)
+            elif status == 'FINISHED':
+                self.calibration = None
+                if self.planner.calibrated:
+                    quality = self.planner.plan(len(self.executor.task_queue))
+                    self.report({'INFO'}, f"Time budget: starting at {format_quality(quality)}.")
+                else:
+                    self.report({'WARNING'}, "Calibration renders failed. Rendering with the scene settings.")
+                return self._handle_executor_update(context)
 
+        done, total = self.calibration.progress
+        context.workspace.status_text_set(f"SavePoints Batch: Calibrating time budget ({done}/{total})...")
         return {'RUNNING_MODAL'}
 
+    def _handle_executor_update(self, context):
+        """Delegates update logic to executor and handles every event of this tick."""
+        if self.gpu_probe and self._wait_for_gpu_probe(context):
+            return {'RUNNING_MODAL'}
+        if self.calibration:
+            return self._handle_calibration_update(context)
+
+        for status_info in self.executor.update():
+            status = status_info.get('status')
+
+            if status == 'TASK_FINISHED':
+                self._on_task_finished(context, status_info)
+            elif status == 'SKIPPED':
+                self._on_task_skipped(context, status_info)
+            elif status == 'FINISHED':
+                return self.finish(context)
+            elif status == 'CANCELLED':
+                return self.finish(context)
+
+        self._update_status_text(context)
+        return {'RUNNING_MODAL'}
+
+    def _update_status_text(self, context):
+        done, total = self.executor.progress
+        running = self.executor.task_progress
+        msg = f"SavePoints Batch: Processed {len(self.cache_hits) + done}/{len(self.cache_hits) + total} versions..."
+        if running:
+            msg += f" Rendering: {', '.join(_format_task_progress(vid, p) for vid, p in running.items())}"
+
+        eta = self.executor.get_eta()
+        if eta is not None:
+            msg += f" | ETA {format_duration(eta)}"
+        if self.planner:
+            msg += f" | Budget left {format_duration(self.planner.remaining_seconds)}"
+        context.workspace.status_text_set(msg)
+
+        fraction = sum(p.get('percent', 0.0) for p in running.values()) / 100.0
+        context.window_manager.progress_update(len(self.cache_hits) + done + fraction)
+
     def _on_task_finished(self, context, info):
         vid = info['version_id']
         if info['return_code'] == 0:
             self.report({'INFO'}, f"Finished: {vid}")
+            output_file = self._find_task_output(vid)
+            self.journal.mark(vid, TASK_DONE, output_file, 0)
+            record = build_task_record(info, output_file)
+            if self.planner:
+                self.planner.add_observation(self.task_quality.get(vid), info['duration'], info['render_time'])
+                record['quality'] = self.task_quality.get(vid)
+            self.report_records.append(record)
+            # Renders at a budget-reduced quality do not match the settings fingerprint of the cache
+            if vid in self.cache_keys and output_file and not self.planner:
+                store_render(self.cache_dir, self.cache_keys[vid], output_file)
+            if self.progressive_timelapse and output_file:
+                self.timelapse_frames[vid] = str(output_file)
+                self._refresh_progressive_timelapse()
         else:
+            self.journal.mark(vid, TASK_FAILED, return_code=info['return_code'])
+            self.report_records.append(build_task_record(info))
             self.report({'ERROR'}, f"Failed: {vid} (Code {info['return_code']})")
             create_error_log_text_block(vid, info['log_path'])
             self.report({'WARNING'}, f"Check Text Editor 'Log_{vid}' for details.")
 
-        context.window_manager.progress_update(info['progress'][0])
-        msg = f"SavePoints Batch: Processed {info['progress'][0]}/{info['progress'][1]} versions..."
-        context.workspace.status_text_set(msg)
+        context.window_manager.progress_update(len(self.cache_hits) + info['progress'][0])
 
     def _on_task_skipped(self, context, info):
+        self.journal.mark(info['version_id'], TASK_MISSING)
+        self.report_records.append(build_static_record(info['version_id'], TASK_MISSING))
         self.report({'WARNING'}, f"Skipping {info['version_id']}: File not found.")
-        context.window_manager.progress_update(info['progress'][0])
+        context.window_manager.progress_update(len(self.cache_hits) + info['progress'][0])
 
     def finish(self, context):
         # Cleanup UI
@@ -240,8 +690,17 @@ class SAVEPOINTS_OT_batch_render(bpy.types.Operator):
         completed_count = 0
         is_cancelled = False
         if hasattr(self, 'executor'):
-            completed_count = self.executor.current_task_idx
+            completed_count = self.executor.completed_count + len(self.cache_hits)
             is_cancelled = self.executor.is_cancelled
+            # Failed versions keep the batch resumable, so Resume Batch Render retries them
+            failed = self.journal.failed_version_ids()
+            if self.executor.finished and not is_cancelled and not failed:
+                self.journal.mark_finished()
+            elif failed and not is_cancelled:
+                self.report({'WARNING'}, f"{len(failed)} versions failed. Resume Batch Render retries them.")
+            self._write_batch_report()
+            if self.performance_sweep:
+                self._write_performance_sweep()
 
         if completed_count > 0:
             if is_cancelled:
@@ -251,7 +710,7 @@ class SAVEPOINTS_OT_batch_render(bpy.types.Operator):
 
             open_folder_platform_independent(self.output_dir)
 
-            if not self.dry_run and not is_cancelled:
+            if not self.dry_run and not self.performance_sweep and not is_cancelled:
                 self._process_timelapse_creation(context)
                 send_os_notification("SavePoints Batch Render", f"Completed! {completed_count} versions.")
         else:
@@ -259,30 +718,65 @@ class SAVEPOINTS_OT_batch_render(bpy.types.Operator):
 
         return {'FINISHED'}
 
+    def _write_batch_report(self):
+        """Writes batch_report.json with per-version telemetry and a readable copy to a Text Block."""
+        summary = summarize(self.report_records, time.monotonic() - self.batch_started, self.executor.max_workers)
+        write_batch_report(self.output_dir, self.report_records, summary)
+        create_report_text_block(BATCH_REPORT_TEXT_NAME, format_batch_report(self.report_records, summary))
+        for outlier in summary['outliers']:
+            self.report({'WARNING'}, f"{outlier['version_id']} took {outlier['factor']}x the median render time.")
+
+    def _max_workers(self):
+        # Concurrent renders would compete for the machine and skew the timings of a sweep
+        return 1 if self.performance_sweep else self.settings.batch_max_workers
+
+    def _write_performance_sweep(self):
+        # The journal keeps the newest-first selection order; trends read oldest first
+        version_order = list(reversed(self.journal.data.get('order', [])))
+        sweep = analyze_sweep(self.report_records, version_order)
+        write_sweep(self.output_dir, sweep)
+
+        worst = sweep.worst_jump
+        if worst:
+            unit = next(u for key, _label, u in PERF_METRICS if key == worst.metric)
+            self.report({'WARNING'}, f"Render cost jumped at {worst.version_id}: {worst.metric} "
+                                     f"{format_metric(worst.before, unit)} -> {format_metric(worst.after, unit)} "
+                                     f"({worst.factor:.1f}x)")
+        else:
+            self.report({'INFO'}, "Performance sweep: no render cost jump found.")
+
     def _process_timelapse_creation(self, context):
         """Handles VSE creation and Background MP4 generation."""
         try:
-            scene_name = create_vse_timelapse(self.output_dir)
+            sequence_dirs = self._get_sequence_dirs()
+            if self.progressive_timelapse and self.timelapse_frames:
+                scene_names = [self._refresh_progressive_timelapse(final=True)]
+            else:
+                scene_names = [create_vse_timelapse(folder, suffix) for folder, suffix in sequence_dirs]
+            scene_name = next((name for name in scene_names if name), None)
 
             mp4_triggered = False
             if context.scene.savepoints_settings.batch_create_mp4:
-                output_file = os.path.join(self.output_dir, "timelapse.mp4")
-                success = launch_timelapse_mp4_generation(
-                    self.output_dir,
-                    output_file,
-                    context.scene.render.fps,
-                    context.scene.savepoints_settings.batch_burn_in,
-                    context.scene.savepoints_settings.batch_burn_in_pos
-                )
-                if success:
-                    mp4_triggered = True
+                for folder, _suffix in sequence_dirs:
+                    output_file = os.path.join(folder, "timelapse.mp4")
+                    success = launch_timelapse_mp4_generation(
+                        folder,
+                        output_file,
+                        context.scene.render.fps,
+                        context.scene.savepoints_settings.batch_burn_in,
+                        context.scene.savepoints_settings.batch_burn_in_pos
+                    )
+                    if success:
+                        mp4_triggered = True
+                    else:
+                        self.report({'ERROR'}, f"Failed to start MP4 generation for {folder}.")
+                if mp4_triggered:
                     self.report({'INFO'}, "MP4 generation started in background...")
-                else:
-                    self.report({'ERROR'}, "Failed to start MP4 generation.")
 
             if scene_name and not bpy.app.background:
-                count = self.executor.current_task_idx if hasattr(self, 'executor') else 0
-                self._show_timelapse_notification(context, scene_name, mp4_triggered, count)
+                count = self.executor.completed_count + len(self.cache_hits) if hasattr(self, 'executor') else 0
+                extra_scenes = sum(1 for name in scene_names if name) - 1
+                self._show_timelapse_notification(context, scene_name, mp4_triggered, count, extra_scenes)
             elif not scene_name:
                 self.report({'WARNING'}, "Could not create timelapse scene.")
 
@@ -291,13 +785,15 @@ class SAVEPOINTS_OT_batch_render(bpy.types.Operator):
             import traceback
             traceback.print_exc()
 
-    def _show_timelapse_notification(self, context, scene_name, mp4_triggered, count):
+    def _show_timelapse_notification(self, context, scene_name, mp4_triggered, count, extra_scenes=0):
         def draw_notification(self, _context):
             layout = self.layout
             layout.label(text=f"Successfully processed {count} versions.")
             layout.separator()
             layout.label(text="Auto-Timelapse created:", icon='SEQUENCE')
             layout.label(text=f"  Scene: {scene_name}")
+            if extra_scenes:
+                layout.label(text=f"  (+{extra_scenes} more views)")
             layout.label(text="  (Switch scene to view playback)", icon='INFO')
 
             if mp4_triggered:
@@ -308,6 +804,51 @@ class SAVEPOINTS_OT_batch_render(bpy.types.Operator):
         context.window_manager.popup_menu(draw_notification, title="Batch Render Complete", icon='CHECKMARK')
 
 
+class SAVEPOINTS_OT_resume_batch_render(bpy.types.Operator):
+    """Continue the most recent interrupted batch render of this file in its original folder"""
+    bl_idname = "savepoints.resume_batch_render"
+    bl_label = "Resume Batch Render"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        if not bpy.data.filepath:
+            self.report({'ERROR'}, "Blend file must be saved before batch rendering.")
+            return {'CANCELLED'}
+
+        batch_root = os.path.dirname(get_batch_render_output_dir())
+        journals = find_resumable_batches(batch_root, bpy.data.filepath)
+        if not journals:
+            self.report({'INFO'}, "No interrupted batch render found.")
+            return {'CANCELLED'}
+
+        journal = journals[0]
+        self.report({'INFO'}, f"Resuming {os.path.basename(journal.output_dir)}")
+        return bpy.ops.savepoints.batch_render('EXEC_DEFAULT', resume_dir=journal.output_dir)
+
+
+class SAVEPOINTS_OT_export_live_timelapse(bpy.types.Operator):
+    """Encode the images of the live timelapse into an MP4 in the background"""
+    bl_idname = "savepoints.export_live_timelapse"
+    bl_label = "Export Live Timelapse"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        live_dir = get_live_render_dir()
+        if not live_dir or not os.path.isdir(live_dir):
+            self.report({'INFO'}, "No live timelapse renders found.")
+            return {'CANCELLED'}
+
+        settings = context.scene.savepoints_settings
+        output_file = os.path.join(live_dir, "timelapse.mp4")
+        if not launch_timelapse_mp4_generation(live_dir, output_file, context.scene.render.fps,
+                                               settings.batch_burn_in, settings.batch_burn_in_pos):
+            self.report({'ERROR'}, "Failed to start MP4 generation.")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"MP4 generation started in background: {output_file}")
+        return {'FINISHED'}
+
+
 class SAVEPOINTS_OT_switch_scene(bpy.types.Operator):
     """Switch to the specified scene"""
     bl_idname = "savepoints.switch_scene"
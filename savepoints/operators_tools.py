@@ -6,8 +6,20 @@ import bpy
 from bpy_extras.io_utils import ImportHelper
 
 from .properties import RetrieveObjectItem
-from .services.ghost import get_ghost_collection_name, load_ghost, unload_ghost
+from .services.ghost import (
+    evict_parked_ghosts,
+    get_parked_ghost_ids,
+    is_ghost_active,
+    is_onion_skin_active,
+    load_ghost,
+    load_onion_skin,
+    park_ghost,
+    unload_onion_skin,
+)
+from .services.ghost_filter import GHOST_FILTER_COLLECTION, resolve_ghost_object_names
 from .services.linking import link_history, resolve_history_path_from_selection
+from .services.object_data import load_object_data
+from .services.onion_skin import plan_onion_skin
 from .services.retrieve import (
     create_retrieve_temp_file,
     delete_retrieve_temp_file,
@@ -157,20 +169,91 @@ class SAVEPOINTS_OT_toggle_ghost(bpy.types.Operator):
         if not version_id:
             self.report({'ERROR'}, "No version specified")
             return {'CANCELLED'}
-        collection_name = get_ghost_collection_name(version_id)
-
-        existing_col = bpy.data.collections.get(collection_name)
-
-        if existing_col:
-            unload_ghost(version_id, context)
+        if is_ghost_active(version_id):
+            settings = context.scene.savepoints_settings
+            park_ghost(version_id, context, settings.ghost_cache_size, settings.ghost_cache_max_vertices)
             self.report({'INFO'}, f"Ghost Reference {version_id} removed.")
             return {'FINISHED'}
 
         else:
+            settings = context.scene.savepoints_settings
             try:
-                count = load_ghost(version_id, context)
+                object_names = resolve_ghost_object_names(version_id, context, settings.ghost_filter)
+                collection_name = None
+                if settings.ghost_filter == GHOST_FILTER_COLLECTION:
+                    if not settings.ghost_filter_collection:
+                        self.report({'ERROR'}, "Choose a collection for the ghost filter")
+                        return {'CANCELLED'}
+                    collection_name = settings.ghost_filter_collection
+
+                count = load_ghost(version_id, context, object_names=object_names, collection_name=collection_name,
+                                   geometry_only=settings.ghost_mode == 'GEOMETRY',
+                                   proxy_detail=settings.ghost_proxy_detail if settings.ghost_mode == 'PROXY' else None)
                 self.report({'INFO'}, f"Ghost Reference {version_id} loaded ({count} objects).")
                 return {'FINISHED'}
             except Exception as e:
                 self.report({'ERROR'}, f"Failed to load ghost: {e}")
                 return {'CANCELLED'}
+
+
+class SAVEPOINTS_OT_clear_ghost_cache(bpy.types.Operator):
+    """Unload all hidden Ghost References kept in the cache"""
+    bl_idname = "savepoints.clear_ghost_cache"
+    bl_label = "Clear Ghost Cache"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, _context):
+        return len(get_parked_ghost_ids()) > 0
+
+    def execute(self, context):
+        count = evict_parked_ghosts(context)
+        self.report({'INFO'}, f"Unloaded {count} cached Ghost References.")
+        return {'FINISHED'}
+
+
+def get_onion_skin_version_ids(settings) -> list[str]:
+    """Most recent manual versions matching the onion skin tag, newest first."""
+    version_ids = [v.version_id for v in settings.versions
+                   if v.version_id.startswith('v') and settings.onion_skin_tag in {'ALL', v.tag}]
+    return version_ids[:settings.onion_skin_count]
+
+
+class SAVEPOINTS_OT_toggle_onion_skin(bpy.types.Operator):
+    """Overlay several recent versions at once as fading wireframes"""
+    bl_idname = "savepoints.toggle_onion_skin"
+    bl_label = "Toggle Onion Skin"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        if is_onion_skin_active():
+            unload_onion_skin(context)
+            self.report({'INFO'}, "Onion Skin removed.")
+            return {'FINISHED'}
+
+        settings = context.scene.savepoints_settings
+        version_ids = get_onion_skin_version_ids(settings)
+        if not version_ids:
+            self.report({'ERROR'}, "No versions to overlay")
+            return {'CANCELLED'}
+
+        data_maps = {vid: load_object_data(vid) for vid in version_ids}
+        plan = plan_onion_skin(version_ids, data_maps, settings.onion_skin_max_vertices)
+        if not plan.layers:
+            self.report({'ERROR'}, "No version fits the Onion Skin vertex budget (or metadata is too old)")
+            return {'CANCELLED'}
+
+        try:
+            count = load_onion_skin(plan, context)
+        except Exception as e:
+            unload_onion_skin(context)
+            self.report({'ERROR'}, f"Failed to load onion skin: {e}")
+            return {'CANCELLED'}
+
+        msg = (f"Onion Skin: {len(plan.layers)} versions, {count} objects "
+               f"({plan.mesh_count} meshes loaded, {plan.shared_instances} reused)")
+        if plan.skipped:
+            self.report({'WARNING'}, f"{msg}. Skipped: {', '.join(plan.skipped)}")
+        else:
+            self.report({'INFO'}, msg)
+        return {'FINISHED'}
@@ -82,6 +82,123 @@ class SavePointsSettings(bpy.types.PropertyGroup):
         default=True,
     )
 
+    use_metadata_prefetch: bpy.props.BoolProperty(
+        name="Prefetch History Metadata",
+        description="Warm the object history cache in the background after the file is loaded (newest first)",
+        default=False
+    )
+
+    ghost_mode: bpy.props.EnumProperty(
+        name="Ghost Mode",
+        description="How much of the snapshot a Ghost Reference loads",
+        items=[
+            ('FULL', "Full", "Link the objects with their materials and images"),
+            ('GEOMETRY', "Geometry Only",
+             "Link only mesh data and draw it through lightweight local objects. "
+             "Materials and images are never loaded; modifiers are not applied"),
+            ('PROXY', "Proxy",
+             "Draw the low-poly proxies stored at save time without opening the snapshot. "
+             "Versions saved without proxies fall back to Full"),
+        ],
+        default='FULL'
+    )
+
+    store_ghost_proxies: bpy.props.BoolProperty(
+        name="Store Ghost Proxies",
+        description="Save decimated wire geometry of every mesh with each version for instant Proxy ghosts",
+        default=False
+    )
+
+    store_mesh_fingerprints: bpy.props.BoolProperty(
+        name="Store Mesh Fingerprints",
+        description="Hash the geometry of every mesh with each version, so the onion skin can share unchanged "
+                    "meshes between versions and batch renders detect edits that keep the bounds",
+        default=False
+    )
+
+    ghost_proxy_edge_budget: bpy.props.IntProperty(
+        name="Proxy Edge Budget",
+        description="Maximum number of edges stored per object in a ghost proxy",
+        default=2000,
+        min=12,
+        max=1000000
+    )
+
+    ghost_proxy_detail: bpy.props.EnumProperty(
+        name="Proxy Detail",
+        description="Which stored proxy tier a Proxy ghost draws",
+        items=[
+            ('BOUNDS', "Bounding Boxes", "One box per object"),
+            ('EDGES', "Decimated Edges", "The stored edge subset of each object"),
+        ],
+        default='EDGES'
+    )
+
+    ghost_filter: bpy.props.EnumProperty(
+        name="Ghost Objects",
+        description="Which objects of the snapshot a Ghost Reference links. "
+                    "Load time and memory scale with the objects shown",
+        items=[
+            ('ALL', "All Objects", "Link every object of the snapshot"),
+            ('SELECTED', "Selected Objects", "Link only objects named like the currently selected objects"),
+            ('COLLECTION', "Collection", "Link only the objects of one collection"),
+            ('CAMERA', "Camera Frustum", "Link only objects whose stored bounds intersect the active camera's view"),
+            ('VIEW', "Viewport Frustum", "Link only objects whose stored bounds intersect the 3D Viewport"),
+        ],
+        default='ALL'
+    )
+
+    ghost_filter_collection: bpy.props.StringProperty(
+        name="Ghost Collection",
+        description="Name of the collection to link when Ghost Objects is set to Collection"
+    )
+
+    ghost_cache_size: bpy.props.IntProperty(
+        name="Ghost Cache Size",
+        description="Number of hidden Ghost References kept loaded so toggling them back on is instant. "
+                    "0 unloads ghosts immediately",
+        default=3,
+        min=0,
+        max=32
+    )
+
+    ghost_cache_max_vertices: bpy.props.IntProperty(
+        name="Ghost Cache Vertex Budget",
+        description="Evict hidden Ghost References (least recently used first) while they hold more vertices "
+                    "than this",
+        default=5000000,
+        min=0
+    )
+
+    onion_skin_count: bpy.props.IntProperty(
+        name="Onion Skin Versions",
+        description="Number of recent versions overlaid by the Onion Skin",
+        default=5,
+        min=2,
+        max=32
+    )
+
+    onion_skin_tag: bpy.props.EnumProperty(
+        name="Onion Skin Tag",
+        description="Only overlay versions with this tag",
+        items=[
+            ('ALL', "Any Tag", "", 'FILTER', 0),
+            ('STABLE', "Stable", "", 'CHECKMARK', 1),
+            ('MILESTONE', "Milestone", "", 'BOOKMARKS', 2),
+            ('EXPERIMENT', "Experiment", "", 'EXPERIMENTAL', 3),
+            ('BUG', "Bug", "", 'ERROR', 4),
+        ],
+        default='ALL'
+    )
+
+    onion_skin_max_vertices: bpy.props.IntProperty(
+        name="Onion Skin Vertex Budget",
+        description="Older versions are left out once the unique meshes of the Onion Skin would hold more "
+                    "vertices than this. Geometry unchanged between versions is loaded once",
+        default=5000000,
+        min=0
+    )
+
     use_limit_versions: bpy.props.BoolProperty(
         name="Limit Versions",
         description="Enable automatic deletion of old versions to save disk space",
@@ -149,3 +266,120 @@ class SavePointsSettings(bpy.types.PropertyGroup):
         ],
         default='BL'
     )
+
+    batch_time_budget: bpy.props.IntProperty(
+        name="Time Budget (min)",
+        description="Finish the final render within this many minutes: a few calibration renders measure the "
+                    "scene, then resolution, samples and the Cycles time limit are lowered per version as needed. "
+                    "0 renders every version with the scene's settings",
+        default=0,
+        min=0,
+        soft_max=600
+    )
+
+    batch_view_mode: bpy.props.EnumProperty(
+        name="Views",
+        description="Views rendered for every version. Each view gets its own folder and timelapse",
+        items=[
+            ('CAMERA', "Scene Camera", "Render the scene camera only"),
+            ('COLLECTION', "Camera Collection", "Render every camera in a collection"),
+            ('TURNTABLE', "Turntable", "Orbit the scene camera around a pivot in equal steps"),
+        ],
+        default='CAMERA'
+    )
+
+    batch_camera_collection: bpy.props.PointerProperty(
+        name="Cameras",
+        description="Collection whose cameras are rendered for every version",
+        type=bpy.types.Collection
+    )
+
+    batch_turntable_steps: bpy.props.IntProperty(
+        name="Turntable Steps",
+        description="Number of evenly spaced views around the pivot",
+        default=8,
+        min=2,
+        max=72
+    )
+
+    batch_turntable_pivot: bpy.props.PointerProperty(
+        name="Pivot",
+        description="Object the camera orbits around (the 3D cursor when empty)",
+        type=bpy.types.Object
+    )
+
+    batch_live_render: bpy.props.BoolProperty(
+        name="Live Timelapse",
+        description="Render every new version in the background with the current camera and render settings "
+                    "(read again before each render), at low priority and only while you are not editing or rendering. "
+                    "The timelapse is then always up to date and only needs encoding",
+        default=False
+    )
+
+    batch_progressive_order: bpy.props.BoolProperty(
+        name="Progressive Order",
+        description="Render milestones and tagged versions first, then the first, last and middle versions and "
+                    "ever finer steps in between, so a partial batch already covers the whole history. "
+                    "The timelapse scene is updated as renders finish",
+        default=False
+    )
+
+    batch_use_render_cache: bpy.props.BoolProperty(
+        name="Reuse Unchanged Renders",
+        description="Skip versions already rendered with the same snapshot, render settings and Blender version, "
+                    "reusing the image from renders_batch/.render_cache",
+        default=True
+    )
+
+    batch_skip_redundant: bpy.props.BoolProperty(
+        name="Skip Versions Without Visible Changes",
+        description="Skip versions whose stored object metadata shows no change inside the camera view since the "
+                    "previously rendered version. Changes the metadata does not record (materials, lighting values) "
+                    "are not detected",
+        default=False
+    )
+
+    batch_max_workers: bpy.props.IntProperty(
+        name="Parallel Renders",
+        description="Number of background Blender processes rendering at the same time. "
+                    "Several small renders in parallel are usually faster than one render using every core",
+        default=1,
+        min=1,
+        max=32
+    )
+
+    batch_threads_per_worker: bpy.props.IntProperty(
+        name="Threads per Render",
+        description="CPU threads given to each background render. 0 divides the cores evenly between them",
+        default=0,
+        min=0,
+        max=1024
+    )
+
+    batch_partition_gpus: bpy.props.BoolProperty(
+        name="Split GPUs Between Workers",
+        description="When several workers render at once, give each its own GPUs (or pin each to one GPU) "
+                    "instead of every worker using every device",
+        default=True
+    )
+
+    batch_persistent_workers: bpy.props.BoolProperty(
+        name="Reuse Render Processes",
+        description="Keep each background Blender running and open one snapshot after another, "
+                    "paying startup and GPU setup once instead of once per version",
+        default=False
+    )
+
+    batch_jobs_per_worker: bpy.props.IntProperty(
+        name="Versions per Process",
+        description="Restart a reused render process after this many versions (0 = never)",
+        default=25,
+        min=0
+    )
+
+    batch_worker_memory_limit: bpy.props.IntProperty(
+        name="Process Memory Limit (MB)",
+        description="Restart a reused render process once its peak memory exceeds this (0 = no limit)",
+        default=8192,
+        min=0
+    )
@@ -0,0 +1,9 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Add-on logic, kept apart from operators and UI.
+
+NumPy is bundled with Blender but is not a dependency of the project, so the unit tests can run
+without it. Modules that import NumPy at the top (object_table, scene_diff, spatial_index, frustum,
+render_skip, ghost_proxy) are imported inside the functions that use them, never at the top of an
+operator, UI or NumPy-free service module.
+"""
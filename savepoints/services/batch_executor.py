@@ -1,183 +1,642 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import json
 import os
+import queue
+import shutil
 import subprocess
-from typing import Any
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable
 
+from .gpu_probe import WORKER_SLOT_ENV
 from .snapshot import find_snapshot_path
 
 
+@dataclass
+class RenderTask:
+    """A worker process rendering one version."""
+    version_id: str
+    process: subprocess.Popen
+    log_path: str
+    log_handle: Any
+    started_at: float
+    slot: int = 0
+    messages: queue.Queue = field(default_factory=queue.Queue)
+    reader: threading.Thread | None = None
+    # Latest progress message (phase, percent, samples, peak_mb)
+    progress: dict = field(default_factory=dict)
+    # The worker's result message (render_time)
+    result: dict = field(default_factory=dict)
+
+
+# Mirrors workers/worker_protocol.py
+WORKER_MESSAGE_PREFIX = "@@SAVEPOINTS@@ "
+# Seconds a retired persistent worker gets to exit on its own before it is killed
+WORKER_EXIT_TIMEOUT = 5.0
+
+
+def parse_worker_message(line: str) -> dict | None:
+    """Decodes a protocol line from a persistent worker; None for ordinary Blender output."""
+    if not line.startswith(WORKER_MESSAGE_PREFIX):
+        return None
+    try:
+        return json.loads(line[len(WORKER_MESSAGE_PREFIX):])
+    except ValueError:
+        return None
+
+
+def start_output_reader(stream, log_handle, messages: queue.Queue) -> threading.Thread:
+    """
+    Splits a worker's stdout into protocol messages (queued) and log output (written to the log)
+    on a daemon thread, so polling from the UI never blocks.
+    """
+    def read():
+        for line in stream:
+            message = parse_worker_message(line)
+            if message is not None:
+                messages.put(message)
+            else:
+                try:
+                    log_handle.write(line)
+                except Exception:
+                    pass
+
+    reader = threading.Thread(target=read, daemon=True)
+    reader.start()
+    return reader
+
+
+def reap_process(process: subprocess.Popen) -> tuple[int | None, dict]:
+    """
+    Non-blocking poll that also returns the exited child's resource usage where os.wait4 exists:
+    (return code or None while running, {'cpu_time', 'peak_rss_mb'} or {}).
+    """
+    if not hasattr(os, 'wait4') or process.returncode is not None:
+        return process.poll(), {}
+    try:
+        pid, status, rusage = os.wait4(process.pid, os.WNOHANG)
+    except ChildProcessError:
+        # Already reaped elsewhere
+        return process.poll(), {}
+    if pid == 0:
+        return None, {}
+
+    # Recording the exit code keeps Popen from waiting on the reaped pid again
+    process.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak_mb = rusage.ru_maxrss / (1024 * 1024) if sys.platform == "darwin" else rusage.ru_maxrss / 1024
+    return process.returncode, {'cpu_time': rusage.ru_utime + rusage.ru_stime, 'peak_rss_mb': peak_mb}
+
+
+def drain_messages(messages: queue.Queue) -> list[dict]:
+    drained = []
+    while True:
+        try:
+            drained.append(messages.get_nowait())
+        except queue.Empty:
+            return drained
+
+
+def estimate_remaining_seconds(durations: list[float], queued: int, running_fractions: list[float],
+                               max_workers: int) -> float | None:
+    """
+    Time left for the batch, from the average duration of the renders finished so far.
+    running_fractions are the completed fractions (0-1) of the renders in flight.
+    Returns None until a render has finished.
+    """
+    if not durations:
+        return None
+    average = sum(durations) / len(durations)
+    remaining = queued + sum(1.0 - min(max(f, 0.0), 1.0) for f in running_fractions)
+    lanes = max(1, min(max_workers, queued + len(running_fractions)))
+    return average * remaining / lanes
+
+
+class PersistentRenderWorker:
+    """
+    A long-lived Blender process rendering one job at a time from its stdin.
+    Its stdout is read on a thread (see start_output_reader).
+    """
+
+    def __init__(self, cmd: list[str], log_path: str, slot: int = 0, creationflags: int = 0):
+        self.log_path = log_path
+        self.slot = slot
+        self.log_handle = open(log_path, 'w', encoding='utf-8')
+        self.messages: queue.Queue = queue.Queue()
+
+        self.current_version_id: str | None = None
+        self.started_at = 0.0
+        self.jobs_done = 0
+        self.retiring = False
+        self.retired_at: float | None = None
+        self.progress: dict = {}
+
+        self.process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self.log_handle,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1,
+            env=get_worker_env(slot),
+            creationflags=creationflags
+        )
+        self._reader = start_output_reader(self.process.stdout, self.log_handle, self.messages)
+
+    @property
+    def is_idle(self) -> bool:
+        return self.current_version_id is None and not self.retiring
+
+    def submit(self, version_id: str, job: dict) -> bool:
+        try:
+            self.process.stdin.write(json.dumps(job) + "\n")
+            self.process.stdin.flush()
+        except (OSError, ValueError) as e:
+            print(f"[SavePoints] Failed to send job to worker PID {self.process.pid}: {e}")
+            return False
+
+        self.current_version_id = version_id
+        self.started_at = time.monotonic()
+        self.progress = {}
+        return True
+
+    def drain(self) -> list[dict]:
+        return drain_messages(self.messages)
+
+    def has_exited(self) -> bool:
+        if self.process.poll() is None:
+            return False
+        # Let the reader hit EOF so no message sent right before exiting is lost
+        self._reader.join(timeout=1.0)
+        return True
+
+    def retire(self):
+        """Asks the worker to exit once idle by closing its job stream."""
+        self.retiring = True
+        if self.retired_at is None:
+            self.retired_at = time.monotonic()
+        try:
+            self.process.stdin.close()
+        except Exception:
+            pass
+
+    def exit_overdue(self, timeout: float = WORKER_EXIT_TIMEOUT) -> bool:
+        return self.retired_at is not None and time.monotonic() - self.retired_at > timeout
+
+    def kill(self):
+        if self.process.poll() is None:
+            print(f"[SavePoints] Killing process PID: {self.process.pid}")
+            try:
+                self.process.kill()
+            except Exception as e:
+                print(f"Error killing process: {e}")
+
+    def close(self, timeout: float = 5):
+        try:
+            self.process.wait(timeout=timeout)
+        except Exception as e:
+            print(f"Error killing process: {e}")
+        self._reader.join(timeout=1.0)
+        for stream in (self.process.stdin, self.process.stdout, self.log_handle):
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+
+def get_threads_per_worker(max_workers: int, threads_per_worker: int = 0) -> int:
+    """
+    Render threads given to each worker. 0 divides the CPU cores evenly between the workers
+    (and leaves Blender's own default when only one worker runs).
+    """
+    if threads_per_worker > 0:
+        return threads_per_worker
+    if max_workers <= 1:
+        return 0
+    return max(1, (os.cpu_count() or 1) // max_workers)
+
+
+# Unix niceness of low-priority workers (Windows uses BELOW_NORMAL_PRIORITY_CLASS)
+LOW_PRIORITY_NICENESS = 10
+
+
+def get_low_priority_prefix() -> list[str]:
+    """Command prefix that starts a process niced, or [] where `nice` is not available."""
+    if os.name == 'nt':
+        return []
+    nice = shutil.which("nice")
+    return [nice, "-n", str(LOW_PRIORITY_NICENESS)] if nice else []
+
+
+def get_low_priority_creationflags() -> int:
+    return getattr(subprocess, 'BELOW_NORMAL_PRIORITY_CLASS', 0)
+
+
+def get_worker_env(slot: int) -> dict[str, str]:
+    """Environment of a worker process: tells it which device partition (see gpu_probe) is its own."""
+    return {**os.environ, WORKER_SLOT_ENV: str(slot)}
+
+
+def _first_free_slot(used) -> int:
+    slot = 0
+    while slot in used:
+        slot += 1
+    return slot
+
+
 class BatchRenderExecutor:
     """
     Manages the execution of batch render tasks.
-    Handles process creation, monitoring, and queue management.
+    Runs up to max_workers Blender processes at once and reports every state change
+    (task finished, skipped, batch finished or cancelled) as an event from update().
+    quality_provider, when given, is asked for the quality overrides of each task as it starts
+    ({"resolution_percentage", "samples", "time_limit"} or None for the batch settings).
+    low_priority starts the workers niced, for renders running next to interactive work.
     """
 
     def __init__(self, tasks: list[Any], temp_dir: str, output_dir: str, settings_path: str, worker_script_path: str,
-                 blender_bin: str):
-        self.task_queue = list(tasks)
-        self.total_tasks = len(tasks)
-        self.current_task_idx = 0
+                 blender_bin: str, max_workers: int = 1, threads_per_worker: int = 0, persistent: bool = False,
+                 jobs_per_worker: int = 0, worker_memory_limit_mb: int = 0,
+                 quality_provider: Callable[[str], dict | None] | None = None, low_priority: bool = False):
+        # Tasks are version ids (or anything with a version_id, e.g. SavePointsVersion items)
+        self.task_queue = deque(getattr(t, 'version_id', t) for t in tasks)
+        self.total_tasks = len(self.task_queue)
+        self.completed_count = 0
+        # Wall times of successful renders, for the ETA
+        self.durations: list[float] = []
 
         self.temp_dir = temp_dir
         self.output_dir = output_dir
         self.settings_path = settings_path
         self.worker_script_path = worker_script_path
         self.blender_bin = blender_bin
+        self.quality_provider = quality_provider
+        self.command_prefix = get_low_priority_prefix() if low_priority else []
+        self.creationflags = get_low_priority_creationflags() if low_priority else 0
 
-        self.current_process: subprocess.Popen | None = None
-        self.current_version_id: str | None = None
-        self.current_log_path: str | None = None
-        self.current_log_handle = None
+        self.max_workers = max(1, max_workers)
+        self.threads = get_threads_per_worker(self.max_workers, threads_per_worker)
+        self.running: dict[str, RenderTask] = {}
+
+        # Persistent mode: workers open each snapshot themselves and are recycled after
+        # jobs_per_worker jobs or once their peak memory exceeds worker_memory_limit_mb (0 = no limit)
+        self.persistent = persistent
+        self.jobs_per_worker = jobs_per_worker
+        self.worker_memory_limit_mb = worker_memory_limit_mb
+        self.workers: list[PersistentRenderWorker] = []
+        self._workers_started = 0
 
         self.is_cancelled = False
         self.finished = False
         self.startup_flags = ["-b", "--factory-startup"]
 
-    def update(self) -> dict[str, Any]:
+    @property
+    def progress(self) -> tuple[int, int]:
+        return self.completed_count, self.total_tasks
+
+    @property
+    def running_version_ids(self) -> list[str]:
+        if self.persistent:
+            return [w.current_version_id for w in self.workers if w.current_version_id]
+        return list(self.running)
+
+    @property
+    def task_progress(self) -> dict[str, dict]:
+        """Latest progress message of each render in flight, by version id (empty until the worker reports)."""
+        if self.persistent:
+            return {w.current_version_id: w.progress for w in self.workers if w.current_version_id}
+        return {vid: task.progress for vid, task in self.running.items()}
+
+    def get_eta(self) -> float | None:
+        """Estimated seconds until the batch is done, or None before the first render has finished."""
+        if not self.durations:
+            return None
+        average = sum(self.durations) / len(self.durations)
+        now = time.monotonic()
+
+        if self.persistent:
+            in_flight = [(w.progress, w.started_at) for w in self.workers if w.current_version_id]
+        else:
+            in_flight = [(t.progress, t.started_at) for t in self.running.values()]
+
+        fractions = []
+        for progress, started_at in in_flight:
+            if 'percent' in progress:
+                fractions.append(progress['percent'] / 100.0)
+            else:
+                # No report yet (loading): assume it runs like the average, but never count it as done
+                fractions.append(min((now - started_at) / average, 0.95) if average > 0 else 0.0)
+
+        return estimate_remaining_seconds(self.durations, len(self.task_queue), fractions, self.max_workers)
+
+    def update(self) -> list[dict[str, Any]]:
         """
-        Called periodically to check process status and start next task.
+        Called periodically: collects finished workers, then starts queued tasks until every slot is busy.
+        Returns the events of this tick, in order ('TASK_FINISHED', 'SKIPPED', 'FINISHED', 'CANCELLED').
         """
         if self.is_cancelled:
-            if self.current_process:
+            if self.running or self.workers:
                 self.cancel()
-            return {'status': 'CANCELLED'}
+            return [{'status': 'CANCELLED'}]
 
-        # Check existing process
-        if self.current_process:
-            return_code = self.current_process.poll()
+        if self.persistent:
+            return self._update_persistent()
 
-            if return_code is not None:
-                self.current_process.wait()
+        events = []
+        for version_id, task in list(self.running.items()):
+            self._read_messages(task)
+            return_code, usage = reap_process(task.process)
+            if return_code is None:
+                continue
 
-                log_path = self.current_log_path
-                version_id = self.current_version_id
+            duration = time.monotonic() - task.started_at
+            task.process.wait()
+            self._close_log(task)
+            # Messages sent right before exiting are only complete once the reader has finished
+            self._read_messages(task)
+            del self.running[version_id]
+            self.completed_count += 1
+            events.append(self._task_event(version_id, return_code, task.log_path, duration,
+                                           render_time=task.result.get('render_time'),
+                                           scene_stats=task.result.get('scene_stats'), **usage))
 
-                self._cleanup_current_log()
-                self.current_process = None
-                self.current_task_idx += 1
+        while self.task_queue and len(self.running) < self.max_workers:
+            version_id = self.task_queue.popleft()
 
-                return {
-                    'status': 'TASK_FINISHED',
+            snapshot_path = find_snapshot_path(version_id)
+            if not snapshot_path or not snapshot_path.exists():
+                self.completed_count += 1
+                events.append({
+                    'status': 'SKIPPED',
                     'version_id': version_id,
-                    'return_code': return_code,
-                    'log_path': log_path,
-                    'progress': (self.current_task_idx, self.total_tasks)
-                }
-            else:
-                # --- Still Running ---
-                return {
-                    'status': 'RUNNING',
-                    'version_id': self.current_version_id,
-                    'progress': (self.current_task_idx, self.total_tasks)
-                }
-
-        # No process running, try to start next
-        if self.finished or not self.task_queue:
+                    'progress': self.progress,
+                })
+                continue
+
+            task = self._launch_process(version_id, snapshot_path)
+            if task is None:
+                self.completed_count += 1
+                log_path = os.path.join(self.temp_dir, f"render_log_{version_id}.txt")
+                events.append(self._task_event(version_id, -1, log_path, 0.0))
+                continue
+            self.running[version_id] = task
+
+        if not self.running and not self.task_queue:
             self.finished = True
-            return {'status': 'FINISHED'}
-
-        # Get next task
-        version = self.task_queue.pop(0)
-        self.current_version_id = version.version_id
-
-        snapshot_path = find_snapshot_path(version.version_id)
-        if not snapshot_path or not snapshot_path.exists():
-            self.current_task_idx += 1
-            return {
-                'status': 'SKIPPED',
-                'version_id': self.current_version_id,
-                'progress': (self.current_task_idx, self.total_tasks)
-            }
+            events.append({'status': 'FINISHED'})
 
-        if self._launch_process(snapshot_path):
-            return {
-                'status': 'RUNNING',
-                'version_id': self.current_version_id,
-                'progress': (self.current_task_idx, self.total_tasks)
-            }
-        else:
-            error_log = self.current_log_path
-            failed_id = self.current_version_id
-
-            self.current_task_idx += 1
-            self._cleanup_current_log()
-            self.current_process = None
-
-            return {
-                'status': 'TASK_FINISHED',
-                'version_id': failed_id,
-                'return_code': -1,
-                'log_path': error_log,
-                'progress': (self.current_task_idx, self.total_tasks)
+        return events
+
+    def _update_persistent(self) -> list[dict[str, Any]]:
+        events = []
+        for worker in list(self.workers):
+            for message in worker.drain():
+                if message.get('event') == 'result' and worker.current_version_id:
+                    self.completed_count += 1
+                    return_code = 0 if message.get('ok') else 1
+                    events.append(self._task_event(
+                        worker.current_version_id, return_code, worker.log_path, message.get('duration', 0.0),
+                        render_time=message.get('render_time'), cpu_time=message.get('cpu_time'),
+                        peak_rss_mb=message.get('peak_mb'), scene_stats=message.get('scene_stats'),
+                    ))
+                    worker.current_version_id = None
+                    worker.jobs_done += 1
+                    # The worker exits right after this result when it recycles; its 'recycle' message may only
+                    # arrive on a later tick, so the same decision is made here before another job is sent
+                    if self._worker_will_recycle(worker.jobs_done, message.get('peak_mb')):
+                        worker.retiring = True
+                elif message.get('event') == 'recycle':
+                    worker.retiring = True
+                elif message.get('event') == 'progress' and worker.current_version_id:
+                    worker.progress = message
+
+            if worker.has_exited():
+                # A worker dying mid-job fails that job; its log holds the crash output
+                if worker.current_version_id:
+                    self.completed_count += 1
+                    events.append(self._task_event(worker.current_version_id, worker.process.returncode or -1,
+                                                   worker.log_path, time.monotonic() - worker.started_at))
+                worker.close()
+                self.workers.remove(worker)
+            elif worker.exit_overdue():
+                worker.kill()
+            elif worker.retiring and worker.current_version_id is None:
+                worker.retire()
+
+        while self.task_queue:
+            version_id = self.task_queue[0]
+            snapshot_path = find_snapshot_path(version_id)
+            if not snapshot_path or not snapshot_path.exists():
+                self.task_queue.popleft()
+                self.completed_count += 1
+                events.append({'status': 'SKIPPED', 'version_id': version_id, 'progress': self.progress})
+                continue
+
+            worker = self._get_idle_worker()
+            if worker is None:
+                break
+
+            self.task_queue.popleft()
+            job = {
+                'version_id': version_id,
+                'snapshot_path': str(snapshot_path),
+                'output_dir': self.output_dir,
+                'file_prefix': f"{version_id}_render",
             }
+            overrides = self._get_quality(version_id)
+            if overrides:
+                job['overrides'] = overrides
+            if not worker.submit(version_id, job):
+                worker.retire()
+                self.completed_count += 1
+                events.append(self._task_event(version_id, -1, worker.log_path, 0.0))
 
-    def _launch_process(self, snapshot_path) -> bool:
-        """
-        Starts the subprocess. Returns True if successful, False otherwise.
-        """
-        log_filename = f"render_log_{self.current_version_id}.txt"
-        self.current_log_path = os.path.join(self.temp_dir, log_filename)
+        if not self.task_queue and not self.running_version_ids:
+            # Workers exit once their job stream is closed and are reaped above on later ticks, never waited for
+            for worker in self.workers:
+                worker.retire()
+            if not self.workers:
+                self.finished = True
+                events.append({'status': 'FINISHED'})
 
+        return events
+
+    def _worker_will_recycle(self, jobs_done: int, peak_mb) -> bool:
+        """Mirrors the exit rule of render_worker.serve."""
+        if self.jobs_per_worker and jobs_done >= self.jobs_per_worker:
+            return True
+        return bool(self.worker_memory_limit_mb and peak_mb and peak_mb > self.worker_memory_limit_mb)
+
+    @staticmethod
+    def _read_messages(task: RenderTask):
+        for message in drain_messages(task.messages):
+            if message.get('event') == 'progress':
+                task.progress = message
+            elif message.get('event') == 'result':
+                task.result = message
+
+    def _get_idle_worker(self) -> PersistentRenderWorker | None:
+        for worker in self.workers:
+            if worker.is_idle and worker.process.poll() is None:
+                return worker
+
+        # Retiring workers hold their slot until they have exited, so fresh workers never run on top of them
+        if len(self.workers) >= self.max_workers:
+            return None
+
+        self._workers_started += 1
+        log_path = os.path.join(self.temp_dir, f"render_worker_{self._workers_started}.txt")
+        slot = _first_free_slot({w.slot for w in self.workers})
         try:
-            self.current_log_handle = open(self.current_log_path, 'w', encoding='utf-8')
-        except OSError as e:
-            print(f"[SavePoints] Failed to create log file: {e}")
-            return False
+            worker = PersistentRenderWorker(self.build_serve_command(), log_path, slot, self.creationflags)
+        except Exception as e:
+            print(f"[SavePoints] Critical Error: Worker start failed.\n{e}")
+            return None
+
+        print(f"[SavePoints] Started render worker (PID: {worker.process.pid})")
+        self.workers.append(worker)
+        return worker
+
+    def build_serve_command(self) -> list[str]:
+        cmd = [*self.command_prefix, self.blender_bin, *self.startup_flags]
+        if self.threads:
+            cmd += ["-t", str(self.threads)]
+        return cmd + [
+            "-P", self.worker_script_path,
+            "--",
+            "--serve",
+            self.settings_path,
+            str(self.jobs_per_worker),
+            str(self.worker_memory_limit_mb),
+        ]
+
+    def _task_event(self, version_id, return_code, log_path, duration, render_time=None, cpu_time=None,
+                    peak_rss_mb=None, scene_stats=None) -> dict[str, Any]:
+        if return_code == 0 and duration > 0:
+            self.durations.append(duration)
+        return {
+            'status': 'TASK_FINISHED',
+            'version_id': version_id,
+            'return_code': return_code,
+            'log_path': log_path,
+            'duration': duration,
+            'render_time': render_time,
+            'cpu_time': cpu_time,
+            'peak_rss_mb': peak_rss_mb,
+            'scene_stats': scene_stats,
+            'progress': self.progress,
+        }
 
-        cmd = [
-            self.blender_bin,
-            *self.startup_flags,
+    def _get_quality(self, version_id: str) -> dict | None:
+        return self.quality_provider(version_id) if self.quality_provider else None
+
+    def build_command(self, version_id: str, snapshot_path, overrides: dict | None = None) -> list[str]:
+        cmd = [*self.command_prefix, self.blender_bin, *self.startup_flags]
+        if self.threads:
+            cmd += ["-t", str(self.threads)]
+        cmd += [
             str(snapshot_path),
             "-P", self.worker_script_path,
             "--",
             self.settings_path,
             self.output_dir,
-            f"{self.current_version_id}_render"
+            f"{version_id}_render"
         ]
+        if overrides:
+            cmd.append(json.dumps(overrides))
+        return cmd
+
+    def _launch_process(self, version_id: str, snapshot_path) -> RenderTask | None:
+        """
+        Starts the subprocess. Returns its task, or None if it could not be started.
+        """
+        log_path = os.path.join(self.temp_dir, f"render_log_{version_id}.txt")
 
         try:
-            self.current_process = subprocess.Popen(
+            log_handle = open(log_path, 'w', encoding='utf-8')
+        except OSError as e:
+            print(f"[SavePoints] Failed to create log file: {e}")
+            return None
+
+        cmd = self.build_command(version_id, snapshot_path, self._get_quality(version_id))
+        slot = _first_free_slot({t.slot for t in self.running.values()})
+
+        try:
+            process = subprocess.Popen(
                 cmd,
-                stdout=self.current_log_handle,
-                stderr=self.current_log_handle
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                bufsize=1,
+                env=get_worker_env(slot),
+                creationflags=self.creationflags
             )
-            print(f"[SavePoints] Rendering {self.current_version_id} (PID: {self.current_process.pid})")
-            return True
+            print(f"[SavePoints] Rendering {version_id} (PID: {process.pid})")
+            task = RenderTask(version_id, process, log_path, log_handle, time.monotonic(), slot)
+            task.reader = start_output_reader(process.stdout, log_handle, task.messages)
+            return task
 
         except Exception as e:
             error_msg = f"[SavePoints] Critical Error: Process start failed.\n{e}\nCommand: {cmd}"
             print(error_msg)
-            if self.current_log_handle:
-                try:
-                    self.current_log_handle.write(error_msg)
-                except Exception:
-                    pass
-            return False
+            try:
+                log_handle.write(error_msg)
+                log_handle.close()
+            except Exception:
+                pass
+            return None
 
     def cancel(self):
-        """Cancels the current process and clears queue."""
+        """Kills every running worker and clears the queue."""
         self.is_cancelled = True
         self.task_queue.clear()
 
-        if self.current_process:
-            if self.current_process.poll() is None:
-                print(f"[SavePoints] Killing process PID: {self.current_process.pid}")
+        for task in self.running.values():
+            if task.process.poll() is None:
+                print(f"[SavePoints] Killing process PID: {task.process.pid}")
                 try:
-                    self.current_process.kill()
-                    self.current_process.wait(timeout=5)
+                    task.process.kill()
                 except Exception as e:
                     print(f"Error killing process: {e}")
-            else:
-                self.current_process.wait()
-            self.current_process = None
 
-        self._cleanup_current_log()
+        # Kill everything first, then reap, so one slow exit does not delay the others
+        for task in self.running.values():
+            try:
+                task.process.wait(timeout=5)
+            except Exception as e:
+                print(f"Error killing process: {e}")
+            self._close_log(task)
+
+        self.running.clear()
 
-    def _cleanup_current_log(self):
-        if self.current_log_handle:
+        for worker in self.workers:
+            worker.kill()
+        for worker in self.workers:
+            worker.close()
+        self.workers.clear()
+
+    @staticmethod
+    def _close_log(task: RenderTask):
+        if task.reader:
+            # Let the reader hit EOF so the whole log is written before it is closed
+            task.reader.join(timeout=1.0)
+            task.reader = None
+        if task.process.stdout:
+            try:
+                task.process.stdout.close()
+            except Exception:
+                pass
+        if task.log_handle:
             try:
-                self.current_log_handle.close()
+                task.log_handle.close()
             except Exception:
                 pass
-            self.current_log_handle = None
+            task.log_handle = None
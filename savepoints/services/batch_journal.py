@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import datetime
+import json
+import os
+from pathlib import Path
+
+JOURNAL_FILENAME = "batch_journal.json"
+JOURNAL_FORMAT = 1
+
+TASK_PENDING = 'PENDING'
+TASK_DONE = 'DONE'
+TASK_FAILED = 'FAILED'
+TASK_CACHED = 'CACHED'  # restored from the render cache
+TASK_MISSING = 'MISSING'  # snapshot file not found
+TASK_SKIPPED = 'SKIPPED'  # no visible changes (see render_skip)
+
+# States whose output image must exist for the task to count as complete
+STATES_WITH_OUTPUT = (TASK_DONE, TASK_CACHED)
+# Rebuilt for every run: the world library lives in the run's temp folder, and GPUs are probed again
+_PER_RUN_SETTINGS = ("world_blend_path", "gpu")
+
+
+class BatchJournal:
+    """
+    Progress record of one batch, kept next to its renders so an interrupted batch can be resumed.
+    Holds the render settings, the task list in dispatch order and the state and output file of every task.
+    Saved after every change with an atomic replace, so a crash never leaves a half-written journal.
+    """
+
+    def __init__(self, output_dir: str, data: dict):
+        self.output_dir = output_dir
+        self.data = data
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.output_dir, JOURNAL_FILENAME)
+
+    @property
+    def render_settings(self) -> dict:
+        return self.data.get('render_settings', {})
+
+    @property
+    def dry_run(self) -> bool:
+        return self.data.get('dry_run', False)
+
+    @property
+    def finished(self) -> bool:
+        return self.data.get('finished', False)
+
+    @property
+    def resumable(self) -> bool:
+        """Unfinished, or finished with failed versions that a resume renders again."""
+        return not self.finished or bool(self.failed_version_ids())
+
+    @classmethod
+    def create(cls, output_dir: str, version_ids: list[str], render_settings: dict, dry_run: bool = False):
+        data = {
+            'format': JOURNAL_FORMAT,
+            'created': datetime.datetime.now().isoformat(timespec='seconds'),
+            'blend_path': render_settings.get('main_blend_path', ''),
+            'dry_run': dry_run,
+            'finished': False,
+            'render_settings': {k: v for k, v in render_settings.items() if k not in _PER_RUN_SETTINGS},
+            'order': list(version_ids),
+            'tasks': {vid: {'state': TASK_PENDING} for vid in version_ids},
+        }
+        journal = cls(output_dir, data)
+        journal.save()
+        return journal
+
+    @classmethod
+    def load(cls, output_dir: str) -> "BatchJournal | None":
+        try:
+            with open(os.path.join(output_dir, JOURNAL_FILENAME), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or 'tasks' not in data:
+            return None
+        return cls(output_dir, data)
+
+    def save(self) -> None:
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[SavePoints] Failed to save batch journal: {e}")
+
+    def mark(self, version_id: str, state: str, output_file: str | os.PathLike | None = None,
+             return_code: int | None = None, save: bool = True) -> None:
+        entry = {'state': state}
+        if output_file:
+            # Relative to the batch folder: multi-view batches write into one subfolder per view
+            entry['output'] = os.path.relpath(output_file, self.output_dir)
+        if return_code is not None:
+            entry['return_code'] = return_code
+        self.data['tasks'][version_id] = entry
+        if save:
+            self.save()
+
+    def mark_finished(self) -> None:
+        self.data['finished'] = True
+        self.save()
+
+    def failed_version_ids(self) -> list[str]:
+        return [vid for vid, entry in self.data['tasks'].items() if entry.get('state') == TASK_FAILED]
+
+    def get_state(self, version_id: str) -> str | None:
+        entry = self.data['tasks'].get(version_id)
+        return entry.get('state') if entry else None
+
+    def incomplete_version_ids(self) -> list[str]:
+        """
+        Tasks to dispatch again, in the original order: pending and failed tasks, and finished
+        ones whose output image has since disappeared. Missing snapshots and skipped versions stay done.
+        """
+        order = self.data.get('order') or list(self.data['tasks'])
+        incomplete = []
+        for vid in order:
+            entry = self.data['tasks'].get(vid, {})
+            state = entry.get('state', TASK_PENDING)
+            if state in STATES_WITH_OUTPUT:
+                output = entry.get('output')
+                if output and os.path.exists(os.path.join(self.output_dir, output)):
+                    continue
+            elif state in (TASK_MISSING, TASK_SKIPPED):
+                continue
+            incomplete.append(vid)
+        return incomplete
+
+
+def find_resumable_batches(batch_root: str, blend_path: str | None = None) -> list[BatchJournal]:
+    """
+    Batches under renders_batch/ left unfinished or with failed versions, newest first,
+    optionally only those of one .blend file.
+    """
+    journals = []
+    for journal_path in Path(batch_root).glob(f"*/{JOURNAL_FILENAME}"):
+        journal = BatchJournal.load(str(journal_path.parent))
+        # Live timelapse folders are never finished; they are rendered by live_render
+        if journal is None or not journal.resumable or journal.data.get('live'):
+            continue
+        if blend_path and os.path.normcase(journal.data.get('blend_path', '')) != os.path.normcase(blend_path):
+            continue
+        journals.append(journal)
+
+    journals.sort(key=lambda j: j.data.get('created', ''), reverse=True)
+    return journals
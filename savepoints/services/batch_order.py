@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from collections import deque
+
+
+def progressive_order(version_ids: list[str], priority_ids=()) -> list[str]:
+    """
+    Render order for version_ids (oldest first) that covers the whole timeline early:
+    priority_ids first (in the order given), then the first and last versions, the middle,
+    the quarters, the eighths... A batch stopped at any point still spans the history evenly.
+    """
+    version_set = set(version_ids)
+    order = [vid for vid in dict.fromkeys(priority_ids) if vid in version_set]
+    seen = set(order)
+
+    def add(index):
+        vid = version_ids[index]
+        if vid not in seen:
+            seen.add(vid)
+            order.append(vid)
+
+    if not version_ids:
+        return order
+    add(0)
+    add(len(version_ids) - 1)
+
+    # Breadth-first bisection: every level halves all gaps before any gap is split further
+    intervals = deque([(0, len(version_ids) - 1)])
+    while intervals:
+        lo, hi = intervals.popleft()
+        if hi - lo < 2:
+            continue
+        mid = (lo + hi) // 2
+        add(mid)
+        intervals.append((lo, mid))
+        intervals.append((mid, hi))
+    return order
+
+
+def layout_timelapse(slot_ids: list[str], rendered: dict[str, str], frames_per_image: int,
+                     hold_gaps: bool = True) -> list[tuple[str, str, int, int]]:
+    """
+    Places the rendered images {version_id: path} on the timelapse timeline of slot_ids (oldest first):
+    [(version_id, path, frame_start, duration)]. With hold_gaps, every version keeps its final position
+    and holds until the next rendered one, so a partial batch already plays as a coarse timelapse.
+    Without, the rendered versions are packed one after another (the finished timelapse).
+    """
+    if not hold_gaps:
+        slot_ids = [vid for vid in slot_ids if vid in rendered]
+    placed = [(index, vid) for index, vid in enumerate(slot_ids) if vid in rendered]
+
+    frames = []
+    for n, (index, vid) in enumerate(placed):
+        next_index = placed[n + 1][0] if n + 1 < len(placed) else index + 1
+        frames.append((vid, rendered[vid], 1 + index * frames_per_image, (next_index - index) * frames_per_image))
+    return frames
@@ -1,16 +1,17 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import datetime
+import math
 import os
 from typing import Any
 
 import bpy
 
 
-def get_batch_render_output_dir(base_path="//", dry_run=False):
+def get_batch_render_output_dir(base_path="//", dry_run=False, performance_sweep=False):
     """
     Generates the output directory path for batch rendering.
-    Format: renders_batch/{blend_name}_{timestamp}
+    Format: renders_batch/{blend_name}_{timestamp} (with a _dryrun or _perf suffix)
     """
     abs_base = bpy.path.abspath(base_path)
     if bpy.data.filepath:
@@ -19,7 +20,9 @@ def get_batch_render_output_dir(base_path="//", dry_run=False):
         blend_name = "untitled"
 
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    if dry_run:
+    if performance_sweep:
+        folder_name = f"{blend_name}_{timestamp}_perf"
+    elif dry_run:
         folder_name = f"{blend_name}_{timestamp}_dryrun"
     else:
         folder_name = f"{blend_name}_{timestamp}"
@@ -27,6 +30,63 @@ def get_batch_render_output_dir(base_path="//", dry_run=False):
     return os.path.join(abs_base, "renders_batch", folder_name)
 
 
+def _get_camera_settings(camera, matrix_world=None) -> dict[str, Any]:
+    """Camera transform and lens, as applied by workers/scene_utils.setup_camera."""
+    if camera is None:
+        return {"camera_matrix_world": [], "camera_data": None}
+    matrix_world = camera.matrix_world if matrix_world is None else matrix_world
+    return {
+        "camera_matrix_world": [list(row) for row in matrix_world],
+        "camera_data": {
+            "type": camera.data.type,
+            "lens": camera.data.lens,
+            "ortho_scale": camera.data.ortho_scale,
+            "sensor_width": camera.data.sensor_width,
+            "sensor_height": camera.data.sensor_height,
+            "sensor_fit": camera.data.sensor_fit,
+            "shift_x": camera.data.shift_x,
+            "shift_y": camera.data.shift_y,
+            "clip_start": camera.data.clip_start,
+            "clip_end": camera.data.clip_end,
+        },
+    }
+
+
+def extract_view_settings(context, mode, collection=None, steps=8, pivot=None) -> list[dict[str, Any]]:
+    """
+    Views rendered for every version in a multi-view batch, each {"name", "camera_matrix_world", "camera_data"}.
+    COLLECTION: every camera in the collection, by name. TURNTABLE: the scene camera orbited in `steps`
+    steps around the vertical axis through pivot (a location, default the 3D cursor).
+    The name is also the view's output folder.
+    """
+    if mode == 'COLLECTION':
+        if collection is None:
+            return []
+        cameras = sorted((obj for obj in collection.all_objects if obj.type == 'CAMERA'), key=lambda obj: obj.name)
+        return [{"name": bpy.path.clean_name(cam.name), **_get_camera_settings(cam)} for cam in cameras]
+
+    if mode == 'TURNTABLE':
+        from mathutils import Matrix
+
+        camera = context.scene.camera
+        if camera is None or steps < 1:
+            return []
+        pivot = context.scene.cursor.location if pivot is None else pivot
+        to_pivot = Matrix.Translation(pivot)
+        from_pivot = Matrix.Translation(-pivot)
+        views = []
+        for step in range(steps):
+            angle = 2 * math.pi * step / steps
+            orbit = to_pivot @ Matrix.Rotation(angle, 4, 'Z') @ from_pivot
+            views.append({
+                "name": f"turntable_{round(math.degrees(angle)):03d}",
+                **_get_camera_settings(camera, orbit @ camera.matrix_world),
+            })
+        return views
+
+    return []
+
+
 def extract_render_settings(context, dry_run=False):
     scene = context.scene
     render = scene.render
@@ -39,19 +99,7 @@ def extract_render_settings(context, dry_run=False):
         "resolution_percentage": render.resolution_percentage,
         "engine": render.engine,
         "frame_current": scene.frame_current,
-        "camera_matrix_world": [list(row) for row in camera.matrix_world] if camera else [],
-        "camera_data": {
-            "type": camera.data.type,
-            "lens": camera.data.lens,
-            "ortho_scale": camera.data.ortho_scale,
-            "sensor_width": camera.data.sensor_width,
-            "sensor_height": camera.data.sensor_height,
-            "sensor_fit": camera.data.sensor_fit,
-            "shift_x": camera.data.shift_x,
-            "shift_y": camera.data.shift_y,
-            "clip_start": camera.data.clip_start,
-            "clip_end": camera.data.clip_end,
-        } if camera else None,
+        **_get_camera_settings(camera),
         "world_name": scene.world.name if scene.world else None,
         "view_settings": {
             "view_transform": scene.view_settings.view_transform,
@@ -61,6 +109,7 @@ def extract_render_settings(context, dry_run=False):
         },
         "active_view_layer": context.view_layer.name,  # For ViewLayer syncing
         "main_blend_path": bpy.data.filepath,  # For appending assets
+        "world_blend_path": None,  # Set by the operator once the world library is written
         "output_format_override": scene.savepoints_settings.batch_output_format,
         "image_settings": {
             "file_format": img_settings.file_format,
@@ -89,6 +138,75 @@ def extract_render_settings(context, dry_run=False):
     return settings
 
 
+def format_duration(seconds: float) -> str:
+    """Compact duration for status text: 45s, 3m 20s, 2h 05m."""
+    seconds = int(round(max(seconds, 0)))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+
+WORLD_LIBRARY_FILENAME = "world.blend"
+
+
+def write_world_library(world, directory):
+    """
+    Writes the world (with its node trees and images) to a small .blend in directory, so workers
+    append it from there instead of opening the main file once per version.
+    Returns the file path, or None when there is nothing to write or writing failed.
+    """
+    if world is None:
+        return None
+
+    path = os.path.join(directory, WORLD_LIBRARY_FILENAME)
+    try:
+        # ABSOLUTE keeps relative image paths valid from the temp folder; packed images stay packed
+        bpy.data.libraries.write(path, {world}, path_remap='ABSOLUTE', fake_user=True)
+    except Exception as e:
+        print(f"[SavePoints] Failed to write world library: {e}")
+        return None
+    return path
+
+
+def get_world_image_paths(world):
+    """Absolute paths of the external images used by the world's node tree, including its node groups."""
+    paths = set()
+    trees = [world.node_tree] if world.node_tree else []
+    seen = set()
+    while trees:
+        tree = trees.pop()
+        if tree.as_pointer() in seen:
+            continue
+        seen.add(tree.as_pointer())
+        for node in tree.nodes:
+            image = getattr(node, "image", None)
+            if image and image.source != 'GENERATED' and not image.packed_file:
+                paths.add(bpy.path.abspath(image.filepath, library=image.library))
+            group = getattr(node, "node_tree", None)
+            if group:
+                trees.append(group)
+    return sorted(paths)
+
+
+def apply_performance_sweep_settings(settings, resolution_percentage, samples):
+    """
+    Fixed low settings for performance sweeps, so render times of different versions are comparable,
+    and asks workers to report triangle counts and texture memory.
+    """
+    settings["output_format_override"] = "JPEG"
+    settings["resolution_percentage"] = resolution_percentage
+    settings["samples"] = samples
+    settings["image_settings"]["quality"] = 70
+    settings["image_settings"]["file_format"] = 'JPEG'
+    settings["image_settings"]["color_mode"] = 'RGB'
+    settings["collect_scene_stats"] = True
+    return settings
+
+
 def get_worker_script_path():
     """
     Returns the absolute path to the worker script file.
@@ -121,3 +239,13 @@ def create_error_log_text_block(version_id, log_path):
         new_text.write(f"Failed to read log file: {e}")
 
     return new_text
+
+
+def create_report_text_block(text_name, content):
+    """Creates or replaces a Blender Text Block holding a batch report."""
+    if text_name in bpy.data.texts:
+        bpy.data.texts.remove(bpy.data.texts[text_name])
+
+    new_text = bpy.data.texts.new(name=text_name)
+    new_text.write(content)
+    return new_text
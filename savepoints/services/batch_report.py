@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+import os
+import statistics
+
+BATCH_REPORT_FILENAME = "batch_report.json"
+BATCH_REPORT_TEXT_NAME = "SavePoints_Batch_Report"
+# A version taking this many times the median wall time is flagged as an outlier
+OUTLIER_FACTOR = 5.0
+
+# Summary of the last batch of this session, drawn by the batch panel
+_last_summary: dict | None = None
+
+
+def build_task_record(event: dict, output_file=None) -> dict:
+    """
+    Telemetry of one finished task from its TASK_FINISHED event. Overhead is the wall time not spent
+    rendering (process start-up, loading the snapshot, writing the image).
+    """
+    wall_time = event.get('duration', 0.0)
+    render_time = event.get('render_time')
+    record = {
+        'version_id': event['version_id'],
+        'state': 'DONE' if event.get('return_code') == 0 else 'FAILED',
+        'return_code': event.get('return_code'),
+        'wall_time': round(wall_time, 3),
+        'cpu_time': _round(event.get('cpu_time')),
+        'peak_rss_mb': _round(event.get('peak_rss_mb')),
+        'render_time': _round(render_time),
+        'overhead': round(max(wall_time - render_time, 0.0), 3) if render_time is not None else None,
+        'output_bytes': None,
+    }
+    # Only performance sweeps collect scene statistics
+    scene_stats = event.get('scene_stats') or {}
+    if scene_stats:
+        record['triangles'] = scene_stats.get('triangles')
+        record['texture_mb'] = _round(scene_stats.get('texture_mb'))
+    if output_file:
+        try:
+            record['output_bytes'] = os.path.getsize(output_file)
+        except OSError:
+            pass
+    return record
+
+
+def build_static_record(version_id: str, state: str, output_file=None) -> dict:
+    """Record of a version that was not rendered in this run (cached, skipped, missing)."""
+    record = {'version_id': version_id, 'state': state}
+    if output_file:
+        try:
+            record['output_bytes'] = os.path.getsize(output_file)
+        except OSError:
+            pass
+    return record
+
+
+def summarize(records: list[dict], batch_wall_time: float | None = None, max_workers: int = 1) -> dict:
+    rendered = [r for r in records if r.get('wall_time') is not None]
+    wall_times = [r['wall_time'] for r in rendered]
+    summary = {
+        'versions': len(records),
+        'rendered': len(rendered),
+        'failed': sum(1 for r in rendered if r['state'] == 'FAILED'),
+        'not_rendered': len(records) - len(rendered),
+        'batch_wall_time': _round(batch_wall_time),
+        'max_workers': max_workers,
+        'outliers': [],
+    }
+    if not rendered:
+        return summary
+
+    median = statistics.median(wall_times)
+    slowest = max(rendered, key=lambda r: r['wall_time'])
+    summary.update({
+        'total_task_time': round(sum(wall_times), 3),
+        'median_wall_time': round(median, 3),
+        'slowest_version': slowest['version_id'],
+        'slowest_wall_time': slowest['wall_time'],
+        'total_cpu_time': _round(_sum_known(r.get('cpu_time') for r in rendered)),
+        'max_peak_rss_mb': _round(max((r['peak_rss_mb'] for r in rendered if r.get('peak_rss_mb')), default=None)),
+        'total_overhead': _round(_sum_known(r.get('overhead') for r in rendered)),
+        'total_render_time': _round(_sum_known(r.get('render_time') for r in rendered)),
+    })
+    if median > 0:
+        summary['outliers'] = [
+            {'version_id': r['version_id'], 'factor': round(r['wall_time'] / median, 1)}
+            for r in sorted(rendered, key=lambda r: r['wall_time'], reverse=True)
+            if r['wall_time'] >= OUTLIER_FACTOR * median
+        ]
+    return summary
+
+
+def write_batch_report(output_dir: str, records: list[dict], summary: dict) -> str | None:
+    global _last_summary
+    _last_summary = summary
+
+    path = os.path.join(output_dir, BATCH_REPORT_FILENAME)
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'summary': summary, 'tasks': records}, f, indent=2)
+    except OSError as e:
+        print(f"[SavePoints] Failed to write batch report: {e}")
+        return None
+    return path
+
+
+def get_last_batch_summary() -> dict | None:
+    return _last_summary
+
+
+def format_batch_report(records: list[dict], summary: dict) -> str:
+    lines = [
+        f"Batch: {summary['rendered']} rendered ({summary['failed']} failed), "
+        f"{summary['not_rendered']} not rendered, {summary['max_workers']} workers",
+    ]
+    if summary.get('batch_wall_time') is not None:
+        lines.append(f"Elapsed: {summary['batch_wall_time']:.1f}s")
+    if summary['rendered']:
+        lines.append(f"Median per version: {summary['median_wall_time']:.1f}s, "
+                     f"slowest: {summary['slowest_version']} ({summary['slowest_wall_time']:.1f}s)")
+        if summary.get('total_overhead') is not None and summary.get('total_render_time') is not None:
+            lines.append(f"Rendering: {summary['total_render_time']:.1f}s, overhead: {summary['total_overhead']:.1f}s")
+    for outlier in summary['outliers']:
+        lines.append(f"Outlier: {outlier['version_id']} took {outlier['factor']}x the median")
+
+    lines.append("")
+    lines.append(f"{'Version':<10}{'State':<8}{'Wall':>8}{'CPU':>8}{'Render':>8}{'Peak MB':>9}{'Output KB':>11}")
+    for r in records:
+        lines.append(
+            f"{r['version_id']:<10}{r['state']:<8}{_cell(r.get('wall_time'))}{_cell(r.get('cpu_time'))}"
+            f"{_cell(r.get('render_time'))}{_cell(r.get('peak_rss_mb'), 9, '.0f')}"
+            f"{_cell(r['output_bytes'] / 1024 if r.get('output_bytes') else None, 11, '.0f')}"
+        )
+    return "\n".join(lines)
+
+
+def _cell(value, width=8, fmt='.1f'):
+    return f"{'-':>{width}}" if value is None else f"{value:>{width}{fmt}}"
+
+
+def _sum_known(values):
+    known = [v for v in values if v is not None]
+    return sum(known) if known else None
+
+
+def _round(value, digits=3):
+    return None if value is None else round(value, digits)
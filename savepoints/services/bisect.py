@@ -0,0 +1,205 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import os
+import subprocess
+from typing import Callable
+
+from .object_data import load_object_data
+from .snapshot import find_snapshot_path
+
+# Exit codes of workers/bisect_worker.py. The verdicts use codes Blender never exits with itself,
+# so a crash or a failed file load (exit code 1, or a negative signal code) can't pass for one
+EXIT_CONDITION_FALSE = 10
+EXIT_CONDITION_TRUE = 11
+EXIT_ERROR = 2
+
+
+class VersionBisector:
+    """
+    Binary search for the first version where a condition holds.
+    Versions are ordered oldest -> newest and the condition is assumed to stay true once it
+    becomes true (like `git bisect`). Evaluation is driven from outside (next_candidate / record),
+    so the same search can run synchronously or step by step from a modal operator.
+    """
+
+    def __init__(self, version_ids: list[str]):
+        self.version_ids = list(version_ids)
+        self.low = -1  # last index known not to match
+        self.high = len(self.version_ids)  # first index known to match (len = none found yet)
+        self.evaluated: list[tuple[str, bool]] = []
+
+    @property
+    def finished(self) -> bool:
+        return self.high - self.low <= 1
+
+    @property
+    def first_match(self) -> str | None:
+        """The first matching version once finished, or None if no version matches."""
+        if not self.finished or self.high >= len(self.version_ids):
+            return None
+        return self.version_ids[self.high]
+
+    @property
+    def remaining_steps(self) -> int:
+        return max(0, (self.high - self.low - 1).bit_length())
+
+    def next_candidate(self) -> str | None:
+        if self.finished:
+            return None
+        return self.version_ids[(self.low + self.high) // 2]
+
+    def record(self, result: bool) -> None:
+        mid = (self.low + self.high) // 2
+        self.evaluated.append((self.version_ids[mid], bool(result)))
+        if result:
+            self.high = mid
+        else:
+            self.low = mid
+
+
+def bisect_versions(version_ids: list[str], predicate: Callable[[str], bool]) -> tuple[str | None, list]:
+    """
+    Returns (first matching version id or None, [(version_id, result), ...] in evaluation order).
+    The predicate is called about log2(n) times.
+    """
+    bisector = VersionBisector(version_ids)
+    while not bisector.finished:
+        bisector.record(predicate(bisector.next_candidate()))
+    return bisector.first_match, bisector.evaluated
+
+
+def vertex_count_exceeds(object_name: str, threshold: int) -> Callable[[str], bool]:
+    """Metadata predicate: the object's vertex count is greater than threshold."""
+
+    def predicate(version_id):
+        data = load_object_data(version_id).get(object_name)
+        return bool(data) and data.get('v_count', 0) > threshold
+
+    return predicate
+
+
+def object_missing(object_name: str) -> Callable[[str], bool]:
+    """
+    Metadata predicate: the object is not present in the version.
+    Only monotonic after the object first appeared; bisect the versions from get_versions_since_first_presence.
+    """
+
+    def predicate(version_id):
+        return object_name not in load_object_data(version_id)
+
+    return predicate
+
+
+def get_versions_since_first_presence(version_ids: list[str], object_name: str) -> list[str] | None:
+    """
+    The versions (oldest first) from the first one containing the object, or None if no version has it.
+    Versions before the object was created also lack it, so "missing" is only a bisectable condition after that.
+    """
+    for index, version_id in enumerate(version_ids):
+        if object_name in load_object_data(version_id):
+            return version_ids[index:]
+    return None
+
+
+def get_bisect_worker_script_path():
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "workers", "bisect_worker.py"))
+
+
+class BisectExecutor:
+    """
+    Evaluates a user script against snapshots in a background Blender process,
+    one version at a time (same process handling as BatchRenderExecutor).
+    """
+
+    def __init__(self, script_path: str, temp_dir: str, blender_bin: str,
+                 worker_script_path: str | None = None):
+        self.script_path = script_path
+        self.temp_dir = temp_dir
+        self.blender_bin = blender_bin
+        self.worker_script_path = worker_script_path or get_bisect_worker_script_path()
+
+        self.current_process: subprocess.Popen | None = None
+        self.current_version_id: str | None = None
+        self.current_log_path: str | None = None
+        self.current_log_handle = None
+        self.last_return_code: int | None = None
+        self.startup_flags = ["-b", "--factory-startup"]
+
+    def start(self, version_id: str) -> bool:
+        """Launches the check for version_id. Returns False if it could not be started."""
+        self.current_version_id = version_id
+
+        snapshot_path = find_snapshot_path(version_id)
+        if not snapshot_path or not snapshot_path.exists():
+            print(f"[SavePoints] Bisect: snapshot for {version_id} not found.")
+            return False
+
+        self.current_log_path = os.path.join(self.temp_dir, f"bisect_log_{version_id}.txt")
+        try:
+            self.current_log_handle = open(self.current_log_path, 'w', encoding='utf-8')
+        except OSError as e:
+            print(f"[SavePoints] Failed to create log file: {e}")
+            return False
+
+        cmd = [
+            self.blender_bin,
+            *self.startup_flags,
+            str(snapshot_path),
+            "-P", self.worker_script_path,
+            "--",
+            self.script_path,
+        ]
+
+        try:
+            self.current_process = subprocess.Popen(
+                cmd,
+                stdout=self.current_log_handle,
+                stderr=self.current_log_handle
+            )
+            print(f"[SavePoints] Bisect checking {version_id} (PID: {self.current_process.pid})")
+            return True
+        except Exception as e:
+            print(f"[SavePoints] Critical Error: Process start failed.\n{e}\nCommand: {cmd}")
+            self._cleanup_current_log()
+            return False
+
+    def poll(self) -> int | None:
+        """
+        Returns EXIT_CONDITION_TRUE or EXIT_CONDITION_FALSE once the check is done, EXIT_ERROR for
+        any other exit code and None while it is still running. The raw code is kept in last_return_code.
+        """
+        if not self.current_process:
+            return EXIT_ERROR
+
+        return_code = self.current_process.poll()
+        if return_code is None:
+            return None
+
+        self.current_process.wait()
+        self.current_process = None
+        self._cleanup_current_log()
+        self.last_return_code = return_code
+        return return_code if return_code in (EXIT_CONDITION_FALSE, EXIT_CONDITION_TRUE) else EXIT_ERROR
+
+    def cancel(self):
+        if self.current_process:
+            if self.current_process.poll() is None:
+                print(f"[SavePoints] Killing process PID: {self.current_process.pid}")
+                try:
+                    self.current_process.kill()
+                    self.current_process.wait(timeout=5)
+                except Exception as e:
+                    print(f"Error killing process: {e}")
+            else:
+                self.current_process.wait()
+            self.current_process = None
+
+        self._cleanup_current_log()
+
+    def _cleanup_current_log(self):
+        if self.current_log_handle:
+            try:
+                self.current_log_handle.close()
+            except Exception:
+                pass
+            self.current_log_handle = None
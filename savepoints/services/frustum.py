@@ -0,0 +1,34 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import numpy as np
+
+
+def frustum_planes(view_projection) -> np.ndarray:
+    """
+    Extracts the 6 clip planes (Gribb/Hartmann) of a 4x4 view-projection matrix as a (6, 4)
+    array [a, b, c, d]; a point p is inside a plane when a*x + b*y + c*z + d >= 0.
+    """
+    m = np.asarray(view_projection, dtype=np.float64).reshape(4, 4)
+    planes = np.stack([
+        m[3] + m[0], m[3] - m[0],  # left, right
+        m[3] + m[1], m[3] - m[1],  # bottom, top
+        m[3] + m[2], m[3] - m[2],  # near, far
+    ])
+    norms = np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+    return planes / np.where(norms > 0, norms, 1.0)
+
+
+def aabbs_in_frustum(aabbs, planes) -> np.ndarray:
+    """
+    Conservative visibility test for (N, 6) [min_xyz, max_xyz] boxes against (6, 4) planes.
+    A box is rejected only if it lies entirely behind one plane.
+    """
+    aabbs = np.asarray(aabbs, dtype=np.float64)
+    if len(aabbs) == 0:
+        return np.zeros(0, dtype=bool)
+
+    normals = planes[:, :3]  # (6, 3)
+    # For each plane, the box corner furthest along the normal (the "positive vertex")
+    positive = np.where(normals[None, :, :] >= 0, aabbs[:, None, 3:], aabbs[:, None, :3])  # (N, 6, 3)
+    distances = np.einsum('npk,pk->np', positive, normals) + planes[:, 3]
+    return np.all(distances >= 0, axis=1)
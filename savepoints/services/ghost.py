@@ -1,9 +1,18 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from collections import OrderedDict
 from pathlib import Path
 
 import bpy
 
+from .ghost_filter import get_ghost_filter_signature
+from .object_data import load_object_data
+from .onion_skin import (
+    ONION_SKIN_COLLECTION_NAME,
+    OnionSkinPlan,
+    get_onion_layer_collection_name,
+    get_onion_layer_color,
+)
 from .snapshot import find_snapshot_path
 from .storage import (
     get_history_dir,
@@ -18,22 +27,132 @@ _LINKED_DATA_COLLECTIONS = (
     "node_groups", "fonts", "cache_files", "movieclips"
 )
 
+# Linked alongside meshes but never needed to draw a wireframe
+_SHADING_DATA_COLLECTIONS = ("materials", "node_groups", "textures", "images")
+
+# Custom property on the ghost collection recording which object subset was linked
+GHOST_FILTER_PROP = "savepoints_ghost_filter"
+
+# Custom property on the onion skin collection listing the versions it linked from
+ONION_SKIN_VERSIONS_PROP = "savepoints_onion_versions"
+
+# Ghosts toggled off are parked (collection unlinked from the scene, library kept) so toggling
+# them back on skips bpy.data.libraries.load. Least recently parked first: {version_id: vertex_count}
+_parked_ghosts: OrderedDict[str, int] = OrderedDict()
+
+
+# Custom property on a single-object ghost collection recording its version
+SINGLE_GHOST_VERSION_PROP = "savepoints_single_version"
+SINGLE_GHOST_CACHE_SIZE = 8
+
+# Object History previews, unlinked from the scene but kept loaded: {(version_id, object_name): collection_name}
+_single_ghost_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+
 
 def get_ghost_collection_name(version_id: str) -> str:
     return f"Ghost_Reference_{version_id}"
 
 
-def unload_ghost(version_id: str, context: bpy.types.Context) -> None:
-    collection_name = get_ghost_collection_name(version_id)
-    existing_col = bpy.data.collections.get(collection_name)
+def get_parked_ghost_collection_name(version_id: str) -> str:
+    return f"Ghost_Cache_{version_id}"
 
-    if existing_col:
-        _remove_ghost_collection(existing_col, context)
 
-    _purge_ghost_libraries(version_id)
+def unload_ghost(version_id: str, context: bpy.types.Context) -> None:
+    """Fully removes a ghost (active or parked) and purges its library."""
+    for collection_name in (get_ghost_collection_name(version_id), get_parked_ghost_collection_name(version_id)):
+        existing_col = bpy.data.collections.get(collection_name)
+        if existing_col:
+            _remove_ghost_collection(existing_col, context)
+
+    _parked_ghosts.pop(version_id, None)
+    if not _is_version_in_use(version_id):
+        _purge_ghost_libraries(version_id)
     _cleanup_orphan_libraries()
 
 
+def _is_version_in_use(version_id: str) -> bool:
+    """True while any ghost (full, parked, onion layer, single-object shown or cached) still links from the version."""
+    return (is_ghost_active(version_id) or version_id in _parked_ghosts
+            or version_id in _get_onion_skin_versions() or version_id in _get_single_ghost_versions())
+
+
+def park_ghost(version_id: str, context: bpy.types.Context, max_count: int, max_vertices: int) -> None:
+    """
+    Hides an active ghost by unlinking its collection from the scene, keeping the linked library
+    for a fast reload. Falls back to unload_ghost when the cache is disabled (max_count == 0).
+    Least recently parked ghosts are evicted while the cache exceeds max_count or max_vertices.
+    """
+    col = bpy.data.collections.get(get_ghost_collection_name(version_id))
+    if not col:
+        return
+
+    if max_count <= 0:
+        unload_ghost(version_id, context)
+        return
+
+    if context.scene.collection.children.get(col.name):
+        context.scene.collection.children.unlink(col)
+    col.name = get_parked_ghost_collection_name(version_id)
+
+    _parked_ghosts[version_id] = _count_ghost_vertices(col)
+    _parked_ghosts.move_to_end(version_id)
+
+    evict_parked_ghosts(context, max_count, max_vertices)
+
+
+def evict_parked_ghosts(context: bpy.types.Context, max_count: int = 0, max_vertices: int = 0) -> int:
+    """
+    Unloads least recently parked ghosts until the cache fits the budget.
+    With the default budget of 0 the whole cache is cleared. Returns the number of evicted ghosts.
+    """
+    evicted = 0
+    while _parked_ghosts and (len(_parked_ghosts) > max_count or sum(_parked_ghosts.values()) > max_vertices):
+        unload_ghost(next(iter(_parked_ghosts)), context)
+        evicted += 1
+    return evicted
+
+
+def get_parked_ghost_ids() -> list[str]:
+    return list(_parked_ghosts)
+
+
+def clear_parked_ghost_registry() -> None:
+    """Forgets parked ghosts without touching bpy.data (the file they belong to is being closed)."""
+    _parked_ghosts.clear()
+
+
+def is_ghost_active(version_id: str) -> bool:
+    return bpy.data.collections.get(get_ghost_collection_name(version_id)) is not None
+
+
+def _restore_parked_ghost(version_id: str, context: bpy.types.Context, signature: str) -> int | None:
+    """
+    Relinks a parked ghost into the scene. Returns its object count, or None if it is not cached
+    or was loaded with a different object filter.
+    """
+    if _parked_ghosts.pop(version_id, None) is None:
+        return None
+
+    col = bpy.data.collections.get(get_parked_ghost_collection_name(version_id))
+    if not col:
+        # Removed behind our back (e.g. orphan purge); drop the stale library before a fresh load
+        if not _is_version_in_use(version_id):
+            _purge_ghost_libraries(version_id)
+        return None
+
+    if col.get(GHOST_FILTER_PROP) != signature:
+        unload_ghost(version_id, context)
+        return None
+
+    col.name = get_ghost_collection_name(version_id)
+    context.scene.collection.children.link(col)
+    return len(col.objects)
+
+
+def _count_ghost_vertices(collection: bpy.types.Collection) -> int:
+    return sum(len(obj.data.vertices) for obj in collection.objects if obj.type == 'MESH' and obj.data)
+
+
 def _cleanup_orphan_libraries():
     """Removes any libraries that have 0 users to prevent buildup."""
     for lib in list(bpy.data.libraries):
@@ -46,6 +165,9 @@ def _cleanup_orphan_libraries():
 
 def _remove_ghost_collection(collection: bpy.types.Collection, context: bpy.types.Context) -> None:
     objects_to_remove = [obj for obj in collection.objects]
+    # Proxy ghosts own local meshes that no library purge will catch
+    local_meshes = [obj.data for obj in objects_to_remove
+                    if obj.type == 'MESH' and obj.data and obj.library is None and obj.data.library is None]
 
     if context.scene.collection.children.get(collection.name):
         context.scene.collection.children.unlink(collection)
@@ -53,11 +175,21 @@ def _remove_ghost_collection(collection: bpy.types.Collection, context: bpy.type
     bpy.data.collections.remove(collection)
 
     for obj in objects_to_remove:
+        # Ghosts of the same version share linked objects; keep those another ghost collection still shows
         try:
+            if obj.users_collection:
+                continue
             bpy.data.objects.remove(obj, do_unlink=True)
         except Exception:
             pass
 
+    for mesh in local_meshes:
+        try:
+            if mesh.users == 0:
+                bpy.data.meshes.remove(mesh)
+        except Exception:
+            pass
+
 
 def _purge_ghost_libraries(version_id: str) -> None:
     if not is_safe_filename(version_id):
@@ -75,7 +207,7 @@ def _purge_ghost_libraries(version_id: str) -> None:
         p = (history_dir / version_id / fname).resolve()
         expected_paths.add(p)
 
-    libs_to_process = []
+    libs_to_process = {}
     for lib in bpy.data.libraries:
         if not lib.filepath:
             continue
@@ -86,22 +218,31 @@ def _purge_ghost_libraries(version_id: str) -> None:
             lib_path = Path(abs_filepath_str).resolve()
 
             if lib_path in expected_paths:
-                libs_to_process.append(lib)
+                libs_to_process[lib.name] = lib
         except (OSError, ValueError):
             continue
 
-    for lib in libs_to_process:
-        for attr in _LINKED_DATA_COLLECTIONS:
-            collection = getattr(bpy.data, attr, None)
-            if not collection:
-                continue
+    if not libs_to_process:
+        return
+
+    # One pass over the ID collections, grouping linked IDs by library
+    ids_by_library = {name: [] for name in libs_to_process}
+    for attr in _LINKED_DATA_COLLECTIONS:
+        collection = getattr(bpy.data, attr, None)
+        if not collection:
+            continue
+
+        for item in collection:
+            lib = item.library
+            if lib is not None and lib.name in ids_by_library:
+                ids_by_library[lib.name].append(item)
 
-            items = [item for item in collection if getattr(item, "library", None) == lib]
-            for item in items:
-                try:
-                    collection.remove(item, do_unlink=True)
-                except Exception:
-                    pass
+    for name, lib in libs_to_process.items():
+        # batch_remove unlinks everything in a single relink pass instead of one per ID
+        try:
+            bpy.data.batch_remove(ids_by_library[name])
+        except Exception as e:
+            print(f"[SavePoints] Batch remove failed for {name}: {e}")
 
         try:
             bpy.data.libraries.remove(lib)
@@ -109,24 +250,164 @@ def _purge_ghost_libraries(version_id: str) -> None:
             pass
 
 
-def load_ghost(version_id: str, context: bpy.types.Context) -> int:
-    collection_name = get_ghost_collection_name(version_id)
+def load_ghost(version_id: str, context: bpy.types.Context, object_names: list[str] | None = None,
+               collection_name: str | None = None, geometry_only: bool = False,
+               proxy_detail: str | None = None) -> int:
+    """
+    Links the snapshot's objects as a wireframe ghost. Only object_names are linked when given,
+    or only the objects of the snapshot collection collection_name; by default everything.
+
+    With geometry_only, only mesh datablocks are linked and shown through local objects placed with
+    the stored matrices; materials and images are dropped before anything draws them. Falls back to a
+    full ghost when the version's metadata predates mesh names (or a collection filter is used).
+
+    With proxy_detail ('BOUNDS' or 'EDGES'), the ghost is a single local wire mesh built from the
+    proxies stored at commit time, without opening the snapshot at all. Falls back to a full ghost
+    when the version has no proxies.
+    """
+    geometry_only = geometry_only and not collection_name
+    proxy_detail = proxy_detail if not collection_name else None
+    base_signature = get_ghost_filter_signature(object_names, collection_name)
+    signature = base_signature
+    if proxy_detail:
+        signature = f"PROXY|{proxy_detail}|{base_signature}"
+    elif geometry_only:
+        signature = f"GEOMETRY|{base_signature}"
+
+    restored_count = _restore_parked_ghost(version_id, context, signature)
+    if restored_count is not None:
+        return restored_count
+
+    ghost_collection_name = get_ghost_collection_name(version_id)
+
+    if proxy_detail:
+        count = _load_proxy_ghost(version_id, object_names, proxy_detail, ghost_collection_name, context)
+        if count is not None:
+            bpy.data.collections[ghost_collection_name][GHOST_FILTER_PROP] = signature
+            return count
+        signature = base_signature
 
     snapshot_path = find_snapshot_path(version_id)
 
     if not snapshot_path:
         raise FileNotFoundError(f"Snapshot file not found for version: {version_id}")
 
-    objects = _load_objects_from_snapshot(str(snapshot_path))
-    return _setup_ghost_collection(collection_name, objects, context)
+    count = None
+    if geometry_only:
+        count = _load_geometry_ghost(str(snapshot_path), version_id, object_names, ghost_collection_name, context)
+        if count is None:
+            signature = base_signature
+
+    if count is None:
+        if collection_name:
+            objects = _load_collection_objects_from_snapshot(str(snapshot_path), collection_name)
+        else:
+            objects = _load_objects_from_snapshot(str(snapshot_path), object_names)
+        count = _setup_ghost_collection(ghost_collection_name, objects, context)
+
+    bpy.data.collections[ghost_collection_name][GHOST_FILTER_PROP] = signature
+    return count
+
+
+def _load_proxy_ghost(version_id: str, object_names: list[str] | None, detail: str, ghost_collection_name: str,
+                      context: bpy.types.Context) -> int | None:
+    """Returns the number of proxied objects, or None when the version has no stored proxies."""
+    from .ghost_proxy import load_ghost_proxies
+
+    proxies = load_ghost_proxies(version_id)
+    if proxies is None:
+        return None
+
+    verts, edges = proxies.build_wire(detail, object_names)
+
+    mesh = bpy.data.meshes.new(f"Ghost_Proxy_{version_id}")
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set("co", verts.reshape(-1))
+    mesh.edges.add(len(edges))
+    mesh.edges.foreach_set("vertices", edges.reshape(-1))
+    mesh.update()
 
+    obj = bpy.data.objects.new(f"Ghost_Proxy_{version_id}", mesh)
+    _setup_ghost_collection(ghost_collection_name, [obj], context)
 
-def _load_objects_from_snapshot(path: str) -> list:
+    if object_names is None:
+        return len(proxies)
+    return int(len(set(object_names).intersection(proxies.names.tolist())))
+
+
+def _load_geometry_ghost(path: str, version_id: str, object_names: list[str] | None, ghost_collection_name: str,
+                         context: bpy.types.Context) -> int | None:
+    """Returns the ghost object count, or None when the metadata has no mesh names to link by."""
+    data_map = load_object_data(version_id)
+    if not any('data_name' in d for d in data_map.values()):
+        return None
+
+    wanted = set(object_names) if object_names is not None else None
+    entries = {name: d for name, d in data_map.items()
+               if d.get('data_name') and (wanted is None or name in wanted)}
+
+    # Objects sharing a mesh link it once
+    mesh_names = sorted({d['data_name'] for d in entries.values()})
+    with bpy.data.libraries.load(path, link=True) as (data_from, data_to):
+        available = set(data_from.meshes)
+        mesh_names = [n for n in mesh_names if n in available]
+        data_to.meshes = mesh_names
+
+    meshes = {name: mesh for name, mesh in zip(mesh_names, data_to.meshes) if mesh}
+    _remove_linked_shading_data({mesh.library.name for mesh in meshes.values() if mesh.library})
+
+    objects = []
+    for obj_name, d in entries.items():
+        mesh = meshes.get(d['data_name'])
+        if not mesh:
+            continue
+        obj = bpy.data.objects.new(f"Ghost_{obj_name}", mesh)
+        matrix = d.get('matrix')
+        if matrix and len(matrix) == 16:
+            obj.matrix_world = [matrix[i:i + 4] for i in range(0, 16, 4)]
+        objects.append(obj)
+
+    return _setup_ghost_collection(ghost_collection_name, objects, context)
+
+
+def _remove_linked_shading_data(library_names: set[str]) -> None:
+    """Drops materials, node trees and images pulled in by linked meshes, before any image is loaded."""
+    if not library_names:
+        return
+
+    ids = []
+    for attr in _SHADING_DATA_COLLECTIONS:
+        for item in getattr(bpy.data, attr, ()):
+            if item.library is not None and item.library.name in library_names:
+                ids.append(item)
+
+    if ids:
+        try:
+            bpy.data.batch_remove(ids)
+        except Exception as e:
+            print(f"[SavePoints] Failed to drop ghost shading data: {e}")
+
+
+def _load_objects_from_snapshot(path: str, object_names: list[str] | None = None) -> list:
     with bpy.data.libraries.load(path, link=True) as (data_from, data_to):
-        data_to.objects = data_from.objects
+        if object_names is None:
+            data_to.objects = data_from.objects
+        else:
+            wanted = set(object_names)
+            data_to.objects = [name for name in data_from.objects if name in wanted]
     return data_to.objects
 
 
+def _load_collection_objects_from_snapshot(path: str, collection_name: str) -> list:
+    with bpy.data.libraries.load(path, link=True) as (data_from, data_to):
+        if collection_name not in data_from.collections:
+            raise ValueError(f"Collection '{collection_name}' not found in snapshot")
+        data_to.collections = [collection_name]
+
+    linked_col = data_to.collections[0] if data_to.collections else None
+    return list(linked_col.all_objects) if linked_col else []
+
+
 def _setup_ghost_collection(name: str, objects: list, context: bpy.types.Context) -> int:
     new_col = bpy.data.collections.new(name)
     context.scene.collection.children.link(new_col)
@@ -142,44 +423,246 @@ def _setup_ghost_collection(name: str, objects: list, context: bpy.types.Context
     return count
 
 
+def is_onion_skin_active() -> bool:
+    return bpy.data.collections.get(ONION_SKIN_COLLECTION_NAME) is not None
+
+
+def load_onion_skin(plan: OnionSkinPlan, context: bpy.types.Context) -> int:
+    """
+    Draws several versions at once as fading wire layers under one parent collection.
+    Each layer links only the meshes its plan lists (shared geometry is linked by the newest
+    layer that has it) and instances them through local objects placed with the stored matrices.
+    Returns the number of objects drawn.
+    """
+    unload_onion_skin(context)
+
+    parent = bpy.data.collections.new(ONION_SKIN_COLLECTION_NAME)
+    context.scene.collection.children.link(parent)
+
+    meshes = {}
+    loaded_versions = []
+    count = 0
+    for index, layer in enumerate(plan.layers):
+        snapshot_path = find_snapshot_path(layer.version_id)
+        if not snapshot_path:
+            print(f"[SavePoints] Snapshot file missing for version: {layer.version_id}")
+            continue
+
+        if layer.link_meshes:
+            with bpy.data.libraries.load(str(snapshot_path), link=True) as (data_from, data_to):
+                available = set(data_from.meshes)
+                keys = [k for k, name in layer.link_meshes.items() if name in available]
+                data_to.meshes = [layer.link_meshes[k] for k in keys]
+
+            linked = {k: mesh for k, mesh in zip(keys, data_to.meshes) if mesh}
+            _remove_linked_shading_data({mesh.library.name for mesh in linked.values() if mesh.library})
+            meshes.update(linked)
+        loaded_versions.append(layer.version_id)
+
+        layer_col = bpy.data.collections.new(get_onion_layer_collection_name(layer.version_id))
+        parent.children.link(layer_col)
+        color = get_onion_layer_color(index, len(plan.layers))
+
+        for obj_name, mesh_key, matrix in layer.instances:
+            mesh = meshes.get(mesh_key)
+            if not mesh:
+                continue
+            obj = bpy.data.objects.new(f"Onion_{layer.version_id}_{obj_name}", mesh)
+            if len(matrix) == 16:
+                obj.matrix_world = [matrix[i:i + 4] for i in range(0, 16, 4)]
+            obj.color = color
+            obj.display_type = 'WIRE'
+            obj.hide_select = True
+            obj.show_in_front = False
+            layer_col.objects.link(obj)
+            count += 1
+
+    parent[ONION_SKIN_VERSIONS_PROP] = ",".join(loaded_versions)
+    return count
+
+
+def _get_onion_skin_versions() -> list[str]:
+    parent = bpy.data.collections.get(ONION_SKIN_COLLECTION_NAME)
+    if not parent:
+        return []
+    return [v for v in parent.get(ONION_SKIN_VERSIONS_PROP, "").split(",") if v]
+
+
+def unload_onion_skin(context: bpy.types.Context) -> None:
+    """Removes the onion skin and purges the libraries it linked, unless a ghost of that version still uses them."""
+    parent = bpy.data.collections.get(ONION_SKIN_COLLECTION_NAME)
+    if not parent:
+        return
+
+    version_ids = _get_onion_skin_versions()
+    linked_meshes = {obj.data for col in parent.children for obj in col.objects
+                     if obj.data is not None and obj.data.library is not None}
+
+    for col in list(parent.children):
+        _remove_ghost_collection(col, context)
+    _remove_ghost_collection(parent, context)
+
+    # Also covers meshes of libraries kept alive below because another ghost uses them
+    orphans = [mesh for mesh in linked_meshes if mesh.users == 0]
+    if orphans:
+        try:
+            bpy.data.batch_remove(orphans)
+        except Exception as e:
+            print(f"[SavePoints] Failed to remove onion skin meshes: {e}")
+
+    _purge_unused_versions(version_ids)
+
+
+def get_single_ghost_collection_name(object_name: str) -> str:
+    return f"Ghost_Single_{object_name}"
+
+
+def get_cached_single_ghost_collection_name(version_id: str, object_name: str) -> str:
+    return f"Ghost_Single_Cache_{version_id}_{object_name}"
+
+
 def load_single_object_ghost(version_id: str, object_name: str, context: bpy.types.Context) -> None:
-    cleanup_single_object_ghost(object_name, context)
+    """
+    Shows one object of a version as a ghost, replacing the one shown for that object.
+    The replaced ghost is kept unlinked in a small LRU cache, so stepping back to it is instant.
+    """
+    shown = bpy.data.collections.get(get_single_ghost_collection_name(object_name))
+    if shown and shown.get(SINGLE_GHOST_VERSION_PROP) == version_id:
+        return
+    if shown:
+        _park_single_ghost(shown, object_name, context)
+
+    cached_name = _single_ghost_cache.pop((version_id, object_name), None)
+    col = bpy.data.collections.get(cached_name) if cached_name else None
+    if col is None:
+        col = _link_single_ghost(version_id, object_name)
+        if col is None:
+            return
+
+    col.name = get_single_ghost_collection_name(object_name)
+    context.scene.collection.children.link(col)
+    _evict_single_ghosts(context)
+
+
+def prefetch_single_object_ghost(version_id: str, object_name: str, context: bpy.types.Context) -> bool:
+    """Links a version's object into the cache without showing it. Returns True if a load happened."""
+    key = (version_id, object_name)
+    if key in _single_ghost_cache:
+        _single_ghost_cache.move_to_end(key)
+        return False
+
+    shown = bpy.data.collections.get(get_single_ghost_collection_name(object_name))
+    if shown and shown.get(SINGLE_GHOST_VERSION_PROP) == version_id:
+        return False
+
+    col = _link_single_ghost(version_id, object_name)
+    if col is None:
+        return False
+
+    col.name = get_cached_single_ghost_collection_name(version_id, object_name)
+    _single_ghost_cache[key] = col.name
+    _evict_single_ghosts(context)
+    return True
 
+
+def get_cached_single_ghost_keys() -> list[tuple[str, str]]:
+    return list(_single_ghost_cache)
+
+
+def _link_single_ghost(version_id: str, object_name: str) -> bpy.types.Collection | None:
+    """Links the object into a new collection that is not linked to the scene yet."""
     snapshot_path = find_snapshot_path(version_id)
     if not snapshot_path or not Path(snapshot_path).exists():
         print(f"[SavePoints] Snapshot file missing for version: {version_id}")
-        return
+        return None
 
     try:
         with bpy.data.libraries.load(str(snapshot_path), link=True) as (data_from, data_to):
             if object_name in data_from.objects:
                 data_to.objects = [object_name]
             else:
-                return
+                return None
     except OSError:
         print(f"[SavePoints] Failed to load library: {snapshot_path}")
-        return
+        return None
 
     obj = data_to.objects[0] if data_to.objects else None
     if not obj:
-        return
-
-    col_name = f"Ghost_Single_{object_name}"
+        return None
 
-    new_col = bpy.data.collections.new(col_name)
-    context.scene.collection.children.link(new_col)
+    new_col = bpy.data.collections.new(get_single_ghost_collection_name(object_name))
+    new_col[SINGLE_GHOST_VERSION_PROP] = version_id
     new_col.objects.link(obj)
 
     obj.display_type = 'WIRE'
     obj.hide_select = True
     obj.show_in_front = True
+    return new_col
+
+
+def _park_single_ghost(col: bpy.types.Collection, object_name: str, context: bpy.types.Context) -> None:
+    version_id = col.get(SINGLE_GHOST_VERSION_PROP)
+    if context.scene.collection.children.get(col.name):
+        context.scene.collection.children.unlink(col)
+
+    if not version_id:
+        _remove_ghost_collection(col, context)
+        return
+
+    col.name = get_cached_single_ghost_collection_name(version_id, object_name)
+    _single_ghost_cache[(version_id, object_name)] = col.name
+    _single_ghost_cache.move_to_end((version_id, object_name))
+
+
+def _evict_single_ghosts(context: bpy.types.Context, max_count: int = SINGLE_GHOST_CACHE_SIZE) -> None:
+    evicted_versions = set()
+    while len(_single_ghost_cache) > max_count:
+        (version_id, _object_name), col_name = _single_ghost_cache.popitem(last=False)
+        col = bpy.data.collections.get(col_name)
+        if col:
+            _remove_ghost_collection(col, context)
+            evicted_versions.add(version_id)
+
+    if evicted_versions:
+        _purge_unused_versions(evicted_versions)
+
+
+def _get_single_ghost_versions() -> set[str]:
+    """Versions of the single-object ghosts that are shown or cached."""
+    versions = {version_id for version_id, _object_name in _single_ghost_cache}
+    for col in bpy.data.collections:
+        version_id = col.get(SINGLE_GHOST_VERSION_PROP)
+        if version_id:
+            versions.add(version_id)
+    return versions
+
+
+def _purge_unused_versions(version_ids) -> None:
+    for version_id in version_ids:
+        if not _is_version_in_use(version_id):
+            _purge_ghost_libraries(version_id)
+    _cleanup_orphan_libraries()
 
 
 def cleanup_single_object_ghost(object_name: str, context: bpy.types.Context) -> None:
-    col_name = f"Ghost_Single_{object_name}"
+    """Removes the shown ghost of the object and every cached one."""
+    col_name = get_single_ghost_collection_name(object_name)
     col = bpy.data.collections.get(col_name)
 
+    removed_versions = set()
     if col:
+        removed_versions.add(col.get(SINGLE_GHOST_VERSION_PROP))
         _remove_ghost_collection(col, context)
 
-    _cleanup_orphan_libraries()
+    for key in [k for k in _single_ghost_cache if k[1] == object_name]:
+        cached = bpy.data.collections.get(_single_ghost_cache.pop(key))
+        if cached:
+            _remove_ghost_collection(cached, context)
+            removed_versions.add(key[0])
+
+    _purge_unused_versions(v for v in removed_versions if v)
+
+
+def clear_single_ghost_registry() -> None:
+    """Forgets cached single-object ghosts without touching bpy.data (the file they belong to is being closed)."""
+    _single_ghost_cache.clear()
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import hashlib
+
+import bpy
+
+from ..ui_utils import find_3d_view_override
+
+GHOST_FILTER_ALL = 'ALL'
+GHOST_FILTER_SELECTED = 'SELECTED'
+GHOST_FILTER_COLLECTION = 'COLLECTION'
+GHOST_FILTER_CAMERA = 'CAMERA'
+GHOST_FILTER_VIEW = 'VIEW'
+
+
+def resolve_ghost_object_names(version_id: str, context: bpy.types.Context, filter_mode: str) -> list[str] | None:
+    """
+    Names of the snapshot objects a ghost should link, decided before anything is loaded.
+    Returns None when every object should be linked (ALL, and COLLECTION which links by collection).
+    Frustum modes test the world AABBs stored in the version's object metadata.
+    """
+    if filter_mode == GHOST_FILTER_SELECTED:
+        return [obj.name for obj in context.selected_objects]
+
+    if filter_mode in {GHOST_FILTER_CAMERA, GHOST_FILTER_VIEW}:
+        if filter_mode == GHOST_FILTER_CAMERA:
+            view_projection = get_camera_view_projection(context)
+            if view_projection is None:
+                raise ValueError("The scene has no active camera")
+        else:
+            view_projection = get_viewport_view_projection(context)
+            if view_projection is None:
+                raise ValueError("No 3D Viewport found")
+
+        from .frustum import aabbs_in_frustum, frustum_planes
+        from .object_table import load_object_table
+
+        table = load_object_table(version_id)
+        visible = aabbs_in_frustum(table.world_aabbs(), frustum_planes(view_projection))
+        return table.names[visible].tolist()
+
+    return None
+
+
+def get_camera_view_projection(context: bpy.types.Context):
+    camera = context.scene.camera
+    if not camera:
+        return None
+
+    render = context.scene.render
+    projection = camera.calc_matrix_camera(
+        context.evaluated_depsgraph_get(),
+        x=render.resolution_x,
+        y=render.resolution_y,
+        scale_x=render.pixel_aspect_x,
+        scale_y=render.pixel_aspect_y,
+    )
+    return _matrix_to_rows(projection @ camera.matrix_world.inverted())
+
+
+def get_viewport_view_projection(context: bpy.types.Context):
+    space = context.space_data if context.area and context.area.type == 'VIEW_3D' else None
+    if space is None:
+        override = find_3d_view_override(context)
+        if not override:
+            return None
+        space = override["area"].spaces.active
+
+    region_3d = getattr(space, "region_3d", None)
+    if not region_3d:
+        return None
+    return _matrix_to_rows(region_3d.perspective_matrix)
+
+
+def get_ghost_filter_signature(object_names: list[str] | None, collection_name: str | None) -> str:
+    """Identifies which subset a ghost was loaded with, so a cached ghost is only reused for the same subset."""
+    if collection_name:
+        return f"COLLECTION:{collection_name}"
+    if object_names is None:
+        return GHOST_FILTER_ALL
+
+    digest = hashlib.blake2b("\n".join(sorted(object_names)).encode('utf-8'), digest_size=8).hexdigest()
+    return f"NAMES:{digest}"
+
+
+def _matrix_to_rows(matrix):
+    return [list(row) for row in matrix]
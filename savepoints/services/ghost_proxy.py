@@ -0,0 +1,213 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from pathlib import Path
+
+import bpy
+import numpy as np
+
+from .object_table import box_corners
+from .storage import get_history_dir, ensure_directory
+
+GHOST_PROXY_SUFFIX = "_proxies.npz"
+
+PROXY_DETAIL_BOUNDS = 'BOUNDS'
+PROXY_DETAIL_EDGES = 'EDGES'
+
+# The 12 edges of a box in object_table.box_corners order (corners differing in exactly one axis bit)
+_BOX_EDGES = np.array([
+    [0, 1], [2, 3], [4, 5], [6, 7],
+    [0, 2], [1, 3], [4, 6], [5, 7],
+    [0, 4], [1, 5], [2, 6], [3, 7],
+], dtype=np.int64)
+
+
+def get_ghost_proxy_path(history_dir: str | Path, version_id: str) -> Path:
+    return Path(history_dir) / version_id / f"{version_id}{GHOST_PROXY_SUFFIX}"
+
+
+class GhostProxies:
+    """
+    Decimated wire geometry of every mesh object in a version, in flat arrays:
+    object i owns verts[vert_offsets[i]:vert_offsets[i + 1]] (object space) and
+    edges[edge_offsets[i]:edge_offsets[i + 1]] (indices local to the object's vertex range).
+    """
+
+    def __init__(self, names, matrices, bboxes, vert_offsets, verts, edge_offsets, edges):
+        self.names = names  # (N,) str
+        self.matrices = matrices  # (N, 16) float32, row-major world matrix
+        self.bboxes = bboxes  # (N, 6) float32, local AABB
+        self.vert_offsets = vert_offsets  # (N + 1,) int64
+        self.verts = verts  # (V, 3) float32
+        self.edge_offsets = edge_offsets  # (N + 1,) int64
+        self.edges = edges  # (E, 2) uint32
+
+    def __len__(self):
+        return len(self.names)
+
+    def save(self, path: Path) -> None:
+        np.savez_compressed(
+            path,
+            names=self.names, matrices=self.matrices, bboxes=self.bboxes,
+            vert_offsets=self.vert_offsets, verts=self.verts,
+            edge_offsets=self.edge_offsets, edges=self.edges,
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "GhostProxies":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                data['names'], data['matrices'], data['bboxes'],
+                data['vert_offsets'], data['verts'], data['edge_offsets'], data['edges'],
+            )
+
+    def build_wire(self, detail: str = PROXY_DETAIL_EDGES, object_names=None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Merges the proxies of the requested objects into one world-space wire:
+        returns (verts (V, 3) float32, edges (E, 2) int32).
+        Objects without stored edges, or every object with BOUNDS detail, are drawn as boxes.
+        """
+        rows = np.arange(len(self.names))
+        if object_names is not None:
+            rows = rows[np.isin(self.names, list(object_names))]
+
+        vert_counts = np.diff(self.vert_offsets)
+        edge_counts = np.diff(self.edge_offsets)
+        if detail == PROXY_DETAIL_BOUNDS:
+            box_rows, edge_rows = rows, rows[:0]
+        else:
+            has_edges = edge_counts[rows] > 0
+            box_rows, edge_rows = rows[~has_edges], rows[has_edges]
+
+        verts_parts, edges_parts = [], []
+        base = 0
+
+        if len(edge_rows):
+            vert_index, vert_owner = _gather_ranges(self.vert_offsets, edge_rows)
+            m = self.matrices[edge_rows].astype(np.float64).reshape(-1, 4, 4)[vert_owner]
+            local = self.verts[vert_index].astype(np.float64)
+            verts_parts.append(np.einsum('nij,nj->ni', m[:, :3, :3], local) + m[:, :3, 3])
+
+            # Shift each object's local edge indices to where its vertices landed in the merged array
+            edge_index, edge_owner = _gather_ranges(self.edge_offsets, edge_rows)
+            new_vert_starts = np.cumsum(vert_counts[edge_rows]) - vert_counts[edge_rows]
+            edges_parts.append(self.edges[edge_index].astype(np.int64) + new_vert_starts[edge_owner][:, None])
+            base = len(vert_index)
+
+        if len(box_rows):
+            bboxes = self.bboxes[box_rows]
+            corners = box_corners(bboxes)
+            m = self.matrices[box_rows].reshape(-1, 4, 4)
+            world = np.einsum('nij,nkj->nki', m[:, :3, :3], corners) + m[:, None, :3, 3]
+            verts_parts.append(world.reshape(-1, 3))
+            box_offsets = base + 8 * np.arange(len(box_rows))
+            edges_parts.append((_BOX_EDGES[None, :, :] + box_offsets[:, None, None]).reshape(-1, 2))
+
+        if not verts_parts:
+            return np.empty((0, 3), dtype=np.float32), np.empty((0, 2), dtype=np.int32)
+
+        return (np.concatenate(verts_parts).astype(np.float32),
+                np.concatenate(edges_parts).astype(np.int32))
+
+
+def _gather_ranges(offsets, rows):
+    """
+    Flat indices of the CSR ranges offsets[r]:offsets[r + 1] for each r in rows,
+    plus the position in rows each index came from.
+    """
+    starts = offsets[rows]
+    lengths = offsets[rows + 1] - starts
+    owner = np.repeat(np.arange(len(rows)), lengths)
+    index = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths) + starts[owner]
+    return index, owner
+
+
+def decimate_edges(verts, edges, edge_budget: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Keeps at most edge_budget edges, sampled evenly over the edge list, and only the vertices they use.
+    Returns (verts, edges) with edges re-indexed into the compacted vertex array.
+    """
+    if len(edges) > edge_budget:
+        keep = np.linspace(0, len(edges) - 1, edge_budget).astype(np.int64)
+        edges = edges[keep]
+
+    used, inverse = np.unique(edges.reshape(-1), return_inverse=True)
+    return verts[used], inverse.reshape(-1, 2).astype(np.uint32)
+
+
+def collect_ghost_proxies(objects, edge_budget: int) -> GhostProxies:
+    """Reads evaluated mesh geometry of the given objects and decimates it to edge_budget edges per object."""
+    depsgraph = bpy.context.evaluated_depsgraph_get() if bpy.context.view_layer else None
+
+    names, matrices, bboxes = [], [], []
+    vert_parts, edge_parts = [], []
+    vert_offsets, edge_offsets = [0], [0]
+
+    for obj in objects:
+        if obj.type != 'MESH' or not obj.data:
+            continue
+        try:
+            eval_obj = obj.evaluated_get(depsgraph) if depsgraph else obj
+            mesh = eval_obj.data
+
+            verts = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", verts)
+            edges = np.empty(len(mesh.edges) * 2, dtype=np.int64)
+            mesh.edges.foreach_get("vertices", edges)
+
+            verts, edges = decimate_edges(verts.reshape(-1, 3), edges.reshape(-1, 2), edge_budget)
+
+            corners = np.array([tuple(c) for c in eval_obj.bound_box], dtype=np.float32).reshape(-1, 3)
+            bbox = np.concatenate([corners.min(axis=0), corners.max(axis=0)])
+        except Exception as e:
+            print(f"[SavePoints] Error building ghost proxy for {obj.name}: {e}")
+            continue
+
+        names.append(obj.name)
+        matrices.append([x for row in eval_obj.matrix_world for x in row])
+        bboxes.append(bbox)
+        vert_parts.append(verts)
+        edge_parts.append(edges)
+        vert_offsets.append(vert_offsets[-1] + len(verts))
+        edge_offsets.append(edge_offsets[-1] + len(edges))
+
+    return GhostProxies(
+        np.array(names, dtype=str),
+        np.array(matrices, dtype=np.float32).reshape(-1, 16),
+        np.array(bboxes, dtype=np.float32).reshape(-1, 6),
+        np.array(vert_offsets, dtype=np.int64),
+        np.concatenate(vert_parts) if vert_parts else np.empty((0, 3), dtype=np.float32),
+        np.array(edge_offsets, dtype=np.int64),
+        np.concatenate(edge_parts) if edge_parts else np.empty((0, 2), dtype=np.uint32),
+    )
+
+
+def save_ghost_proxies(version_id: str, objects, edge_budget: int) -> None:
+    """Stores {version_id}_proxies.npz next to the object metadata."""
+    history_dir_str = get_history_dir()
+    if not history_dir_str:
+        return
+
+    proxies = collect_ghost_proxies(objects, edge_budget)
+    output_path = get_ghost_proxy_path(history_dir_str, version_id)
+    ensure_directory(output_path.parent)
+
+    try:
+        proxies.save(output_path)
+    except Exception as e:
+        print(f"[SavePoints] Failed to save ghost proxies: {e}")
+
+
+def load_ghost_proxies(version_id: str) -> GhostProxies | None:
+    history_dir_str = get_history_dir()
+    if not history_dir_str:
+        return None
+
+    path = get_ghost_proxy_path(history_dir_str, version_id)
+    if not path.exists():
+        return None
+
+    try:
+        return GhostProxies.load(path)
+    except Exception as e:
+        print(f"[SavePoints] Failed to read ghost proxies for {version_id}: {e}")
+        return None
@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+import os
+import subprocess
+import time
+
+GPU_PROBE_TIMEOUT = 120
+# Mirrors workers/gpu_utils.py
+WORKER_SLOT_ENV = "SAVEPOINTS_WORKER_SLOT"
+
+# Devices do not change while Blender runs: {blender_bin: probe result}
+_probe_cache: dict[str, dict] = {}
+
+
+def get_gpu_probe_script_path():
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "workers", "gpu_probe_worker.py"))
+
+
+class GpuProbe:
+    """
+    Runs the GPU probe worker without blocking the UI: start() it, then poll() from a timer until it
+    returns True. result is then {"device_type", "devices"} (device_type "NONE" when only the CPU is
+    usable), remembered for the session, or None when the probe failed or timed out, in which case
+    every render worker probes for itself as before.
+    """
+
+    def __init__(self, blender_bin: str, temp_dir: str, timeout: float = GPU_PROBE_TIMEOUT, clock=time.monotonic):
+        self.blender_bin = blender_bin
+        self.output_path = os.path.join(temp_dir, "gpu_probe.json")
+        self.log_path = os.path.join(temp_dir, "gpu_probe_log.txt")
+        self.timeout = timeout
+        self.clock = clock
+        self.result: dict | None = _probe_cache.get(blender_bin)
+        self.done = self.result is not None
+        self.process: subprocess.Popen | None = None
+        self.log_handle = None
+        self.started_at = 0.0
+
+    def start(self) -> None:
+        if self.done:
+            return
+        cmd = [self.blender_bin, "-b", "--factory-startup", "-P", get_gpu_probe_script_path(), "--", self.output_path]
+        try:
+            self.log_handle = open(self.log_path, 'w', encoding='utf-8')
+            self.process = subprocess.Popen(cmd, stdout=self.log_handle, stderr=self.log_handle)
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"[SavePoints] GPU probe failed, workers will probe individually: {e}")
+            self._close_log()
+            self.done = True
+            return
+        self.started_at = self.clock()
+
+    def poll(self) -> bool:
+        """True once the probe has finished, failed or timed out."""
+        if self.done:
+            return True
+        if self.process.poll() is None:
+            if self.clock() - self.started_at > self.timeout:
+                print(f"[SavePoints] GPU probe timed out after {self.timeout:.0f}s, workers will probe individually")
+                self.cancel()
+            return self.done
+
+        self.process = None
+        self._close_log()
+        self.done = True
+        self.result = _read_probe_result(self.output_path)
+        if self.result is not None:
+            _probe_cache[self.blender_bin] = self.result
+        return True
+
+    def cancel(self) -> None:
+        if self.process and self.process.poll() is None:
+            try:
+                self.process.kill()
+            except OSError:
+                pass
+        self.process = None
+        self._close_log()
+        self.done = True
+
+    def _close_log(self):
+        if self.log_handle:
+            try:
+                self.log_handle.close()
+            except OSError:
+                pass
+            self.log_handle = None
+
+
+def _read_probe_result(output_path: str) -> dict | None:
+    try:
+        with open(output_path, 'r', encoding='utf-8') as f:
+            result = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[SavePoints] GPU probe failed, workers will probe individually: {e}")
+        return None
+    if not isinstance(result, dict) or "device_type" not in result:
+        return None
+    return result
+
+
+def partition_devices(device_ids: list[str], worker_count: int) -> list[list[str]]:
+    """
+    Splits devices between concurrent workers, one list per worker slot.
+    With at least as many devices as workers, each worker gets its own devices (round robin);
+    with fewer, workers are pinned to one device each and share them evenly.
+    """
+    if worker_count <= 1 or not device_ids:
+        return [list(device_ids)]
+    if len(device_ids) >= worker_count:
+        return [list(device_ids[slot::worker_count]) for slot in range(worker_count)]
+    return [[device_ids[slot % len(device_ids)]] for slot in range(worker_count)]
+
+
+def build_gpu_config(probe: dict, worker_count: int, partition: bool) -> dict:
+    """The "gpu" entry of render_config.json, applied by workers/gpu_utils.apply_devices."""
+    config = {"device_type": probe.get("device_type", "NONE"), "devices": probe.get("devices", [])}
+    if partition:
+        config["partitions"] = partition_devices([d["id"] for d in config["devices"]], worker_count)
+    return config
+
+
+def clear_gpu_probe_cache() -> None:
+    _probe_cache.clear()
@@ -0,0 +1,249 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+import os
+import shutil
+import tempfile
+import time
+from collections import deque
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .autosave import UNSAFE_MODES, is_rendering
+from .batch_executor import BatchRenderExecutor
+from .batch_journal import STATES_WITH_OUTPUT, TASK_DONE, TASK_FAILED, TASK_MISSING, TASK_PENDING, BatchJournal
+from .batch_order import layout_timelapse
+from .batch_render import extract_render_settings, get_worker_script_path
+from .post_process import FRAMES_PER_IMAGE, get_timelapse_scene_name, update_vse_timelapse
+from .render_cache import find_render_output
+
+LIVE_CHECK_INTERVAL = 2.0
+# Seconds without edits before the session counts as idle and a live render may start
+LIVE_IDLE_SECONDS = 20.0
+LIVE_FOLDER_SUFFIX = "_live"
+
+
+class _LiveRender:
+    """State of the live timelapse of the open file: one niced worker rendering new versions in order."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.output_dir: str | None = None
+        self.journal: BatchJournal | None = None
+        self.temp_dir: str | None = None
+        self.settings_path: str | None = None
+        self.render_settings: dict | None = None
+        self.pending: deque[str] = deque()
+        self.executor: BatchRenderExecutor | None = None
+        self.running_version_id: str | None = None
+        self.last_activity = time.monotonic()
+
+    @property
+    def active(self) -> bool:
+        return self.journal is not None
+
+
+_live = _LiveRender()
+
+
+def get_live_render_dir() -> str | None:
+    """renders_batch/{blend_name}_live next to the .blend file; None for unsaved files."""
+    if not bpy.data.filepath:
+        return None
+    blend_name = os.path.splitext(os.path.basename(bpy.data.filepath))[0]
+    return os.path.join(bpy.path.abspath("//"), "renders_batch", f"{blend_name}{LIVE_FOLDER_SUFFIX}")
+
+
+def start_live_render(context) -> bool:
+    """
+    Starts the live timelapse of the open file and picks up versions a previous session left unrendered.
+    Returns False when the file is not saved yet.
+    """
+    output_dir = get_live_render_dir()
+    if not output_dir:
+        return False
+    stop_live_render()
+    os.makedirs(output_dir, exist_ok=True)
+
+    journal = BatchJournal.load(output_dir)
+    if journal is None:
+        journal = BatchJournal.create(output_dir, [], {})
+    journal.data['live'] = True
+
+    _live.temp_dir = tempfile.mkdtemp(prefix="sp_live_")
+    _live.settings_path = os.path.join(_live.temp_dir, "render_config.json")
+    _live.output_dir = output_dir
+    _live.journal = journal
+    _update_render_settings(context)
+    _live.pending = deque(journal.incomplete_version_ids())
+    print(f"[SavePoints] Live timelapse started in {output_dir} ({len(_live.pending)} versions pending)")
+    return True
+
+
+def stop_live_render() -> None:
+    """Kills the running live render (its version stays pending in the journal) and forgets the state."""
+    if _live.executor:
+        _live.executor.cancel()
+    if _live.temp_dir and os.path.exists(_live.temp_dir):
+        shutil.rmtree(_live.temp_dir, ignore_errors=True)
+    _live.reset()
+
+
+def queue_live_render(version_id: str) -> None:
+    """Queues a freshly committed version; it renders once the session is idle."""
+    if not _live.active:
+        return
+    journal = _live.journal
+    if version_id not in journal.data['order']:
+        journal.data['order'].append(version_id)
+    journal.mark(version_id, TASK_PENDING)
+    if version_id not in _live.pending:
+        _live.pending.append(version_id)
+
+
+def get_live_render_status() -> dict | None:
+    if not _live.active:
+        return None
+    rendered = sum(1 for entry in _live.journal.data['tasks'].values() if entry.get('state') in STATES_WITH_OUTPUT)
+    return {
+        'rendered': rendered,
+        'pending': len(_live.pending),
+        'running': _live.running_version_id,
+        'output_dir': _live.output_dir,
+    }
+
+
+def is_session_idle(context) -> bool:
+    if is_rendering() or context.mode in UNSAFE_MODES:
+        return False
+    return time.monotonic() - _live.last_activity >= LIVE_IDLE_SECONDS
+
+
+def live_render_timer():
+    """Timer driving the live timelapse: starts one niced render at a time while the session is idle."""
+    try:
+        context = bpy.context
+        settings = getattr(getattr(context, "scene", None), "savepoints_settings", None)
+        if not settings or not settings.batch_live_render:
+            if _live.active:
+                stop_live_render()
+            return LIVE_CHECK_INTERVAL
+
+        if not _live.active or _live.output_dir != get_live_render_dir():
+            if not start_live_render(context):
+                return LIVE_CHECK_INTERVAL
+
+        if _live.executor:
+            # An interactive render needs the machine: give the version back and retry when idle again
+            if is_rendering():
+                _requeue_running()
+            else:
+                _update_executor()
+        elif _live.pending and is_session_idle(context):
+            _start_next()
+
+    except Exception as e:
+        print(f"[SavePoints] Live timelapse timer error: {e}")
+
+    return LIVE_CHECK_INTERVAL
+
+
+def _update_render_settings(context) -> None:
+    """
+    Captures the current camera and render settings; called before every live render so changes made
+    since the toggle was enabled apply to the next version. The config is rewritten only when they changed.
+    """
+    render_settings = extract_render_settings(context)
+    # Workers append the world from the main file; the world library of a batch lives in a temp folder
+    render_settings["world_blend_path"] = None
+    if render_settings == _live.render_settings:
+        return
+
+    with open(_live.settings_path, 'w') as f:
+        json.dump(render_settings, f, indent=4)
+    _live.render_settings = render_settings
+    _live.journal.data['render_settings'] = render_settings
+    _live.journal.save()
+
+
+def _start_next():
+    _update_render_settings(bpy.context)
+    version_id = _live.pending.popleft()
+    _live.running_version_id = version_id
+    _live.executor = BatchRenderExecutor(
+        tasks=[version_id],
+        temp_dir=_live.temp_dir,
+        output_dir=_live.output_dir,
+        settings_path=_live.settings_path,
+        worker_script_path=get_worker_script_path(),
+        blender_bin=bpy.app.binary_path,
+        low_priority=True
+    )
+    _update_executor()
+
+
+def _update_executor():
+    for event in _live.executor.update():
+        status = event.get('status')
+        vid = event.get('version_id')
+        if status == 'TASK_FINISHED':
+            if event['return_code'] == 0:
+                output_file = find_render_output(_live.output_dir, f"{vid}_render")
+                _live.journal.mark(vid, TASK_DONE, output_file, 0)
+                _refresh_live_timelapse()
+            else:
+                _live.journal.mark(vid, TASK_FAILED, return_code=event['return_code'])
+                print(f"[SavePoints] Live render of {vid} failed (Code {event['return_code']}), "
+                      f"see {event['log_path']}")
+        elif status == 'SKIPPED':
+            _live.journal.mark(vid, TASK_MISSING)
+        elif status in ('FINISHED', 'CANCELLED'):
+            _live.executor = None
+            _live.running_version_id = None
+            return
+
+
+def _requeue_running():
+    _live.executor.cancel()
+    _live.executor = None
+    if _live.running_version_id:
+        _live.pending.appendleft(_live.running_version_id)
+        _live.running_version_id = None
+
+
+def _refresh_live_timelapse():
+    if bpy.app.background:
+        return
+    rendered = {}
+    for vid, entry in _live.journal.data['tasks'].items():
+        if entry.get('state') in STATES_WITH_OUTPUT and entry.get('output'):
+            rendered[vid] = os.path.join(_live.output_dir, entry['output'])
+    # Versions are queued as they are committed, so the journal order is oldest first
+    frames = layout_timelapse(_live.journal.data['order'], rendered, FRAMES_PER_IMAGE, hold_gaps=False)
+    if frames:
+        update_vse_timelapse(get_timelapse_scene_name(_live.output_dir), frames)
+
+
+@persistent
+def _on_depsgraph_update(_scene, depsgraph):
+    # Edits count as activity; the timelapse scene and its images are updated by live renders themselves
+    if any(not isinstance(update.id, (bpy.types.Scene, bpy.types.Image)) for update in depsgraph.updates):
+        _live.last_activity = time.monotonic()
+
+
+def register_live_render():
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if not bpy.app.timers.is_registered(live_render_timer):
+        bpy.app.timers.register(live_render_timer, first_interval=LIVE_CHECK_INTERVAL, persistent=True)
+
+
+def unregister_live_render():
+    if bpy.app.timers.is_registered(live_render_timer):
+        bpy.app.timers.unregister(live_render_timer)
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    stop_live_render()
@@ -1,6 +1,9 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import hashlib
 import json
+import os
+from array import array
 from functools import lru_cache
 from pathlib import Path
 
@@ -9,6 +12,7 @@ import bpy
 from .storage import get_history_dir, ensure_directory
 
 OBJECT_DATA_SUFFIX = "_objects.json"
+OBJECT_DATA_CACHE_SIZE = 128
 
 
 def _round_float(val):
@@ -33,10 +37,25 @@ def _bbox_to_min_max(bbox):
     return [min_pt, max_pt]
 
 
-def extract_object_data(obj, depsgraph=None):
+def get_mesh_fingerprint(mesh) -> str:
+    """Hash of a mesh's vertex positions and edges; equal across versions when the geometry is unchanged."""
+    co = array('f', [0.0]) * (len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get("co", co)
+    edges = array('i', [0]) * (len(mesh.edges) * 2)
+    mesh.edges.foreach_get("vertices", edges)
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(co.tobytes())
+    h.update(edges.tobytes())
+    return h.hexdigest()
+
+
+def extract_object_data(obj, depsgraph=None, fingerprints=None):
     """
     Extract data from object.
     Uses evaluated object if depsgraph is provided to ensure latest state.
+    Mesh fingerprints are stored only when a fingerprints dict is given; it caches them by mesh name
+    so meshes shared by several objects are hashed once.
     """
     data = {}
 
@@ -51,20 +70,24 @@ def extract_object_data(obj, depsgraph=None):
     mesh = obj.data
     if obj.type == 'MESH' and mesh:
         data['v_count'] = len(mesh.vertices)
+        # Lets geometry-only ghosts link the mesh without the object (and its materials)
+        data['data_name'] = mesh.name
+        if fingerprints is not None:
+            if mesh.name not in fingerprints:
+                fingerprints[mesh.name] = get_mesh_fingerprint(mesh)
+            data['geo_hash'] = fingerprints[mesh.name]
     else:
         data['v_count'] = 0
 
     return data
 
 
-def save_object_data(version_id, objects):
+def collect_object_data(objects, fingerprint_meshes=True):
     """
-    Saves metadata for the given objects to {version_id}_objects.json inside the version folder.
+    Extracts metadata for the given objects from the live scene.
+    Returns a dict: { "ObjectName": {data} } in the same format as the stored files.
+    fingerprint_meshes=False skips hashing mesh geometry (not needed for diffs).
     """
-    history_dir_str = get_history_dir()
-    if not history_dir_str:
-        return
-
     depsgraph = None
     if bpy.context.view_layer:
         for obj in objects:
@@ -74,20 +97,32 @@ def save_object_data(version_id, objects):
         bpy.context.view_layer.update()
         depsgraph = bpy.context.evaluated_depsgraph_get()
 
-    history_dir = Path(history_dir_str)
-    version_dir = history_dir / version_id
-    ensure_directory(version_dir)
-
-    output_path = version_dir / f"{version_id}{OBJECT_DATA_SUFFIX}"
-
     data_map = {}
+    fingerprints = {} if fingerprint_meshes else None
     for obj in objects:
         try:
-            data_map[obj.name] = extract_object_data(obj, depsgraph)
+            data_map[obj.name] = extract_object_data(obj, depsgraph, fingerprints)
         except Exception as e:
             print(f"[SavePoints] Error extracting data for {obj.name}: {e}")
             continue
 
+    return data_map
+
+
+def save_object_data(version_id, objects, fingerprint_meshes=False):
+    """
+    Saves metadata for the given objects to {version_id}_objects.json inside the version folder.
+    Mesh fingerprints hash every vertex, so they are only stored when asked for (Store Mesh Fingerprints).
+    """
+    history_dir_str = get_history_dir()
+    if not history_dir_str:
+        return
+
+    data_map = collect_object_data(objects, fingerprint_meshes)
+
+    output_path = get_object_data_path(history_dir_str, version_id)
+    ensure_directory(output_path.parent)
+
     try:
         with open(output_path, 'w', encoding='utf-8') as f:
             # Use compact separators to save space
@@ -96,7 +131,44 @@ def save_object_data(version_id, objects):
         print(f"[SavePoints] Failed to save object data: {e}")
 
 
-@lru_cache(maxsize=128)
+def get_object_data_path(history_dir: str | Path, version_id: str) -> Path:
+    """Return the path of the metadata file for a version inside the given history directory."""
+    return Path(history_dir) / version_id / f"{version_id}{OBJECT_DATA_SUFFIX}"
+
+
+@lru_cache(maxsize=OBJECT_DATA_CACHE_SIZE)
+def _read_object_data_file(file_path: str, _mtime_ns: int) -> dict:
+    # Keyed by path and mtime so entries never leak across projects or outlive a rewrite (e.g. autosave).
+    # Reading the raw bytes first keeps the GIL released during disk IO; only the parse holds it.
+    try:
+        raw = Path(file_path).read_bytes()
+        return json.loads(raw)
+    except Exception:
+        return {}
+
+
+def read_object_data_file(file_path: str | Path) -> dict:
+    """
+    Reads a metadata file through the shared cache.
+    Does not touch bpy, so it is safe to call from a background thread.
+    """
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except OSError:
+        return {}
+    return _read_object_data_file(str(file_path), mtime_ns)
+
+
+def get_object_data_cache_usage() -> tuple[int, int]:
+    """Returns (cached entries, maximum entries) of the object metadata cache."""
+    info = _read_object_data_file.cache_info()
+    return info.currsize, info.maxsize or 0
+
+
+def clear_object_data_cache() -> None:
+    _read_object_data_file.cache_clear()
+
+
 def load_object_data(version_id):
     """
     Loads metadata from {version_id}_objects.json.
@@ -106,14 +178,4 @@ def load_object_data(version_id):
     if not history_dir_str:
         return {}
 
-    history_dir = Path(history_dir_str)
-    file_path = history_dir / version_id / f"{version_id}{OBJECT_DATA_SUFFIX}"
-
-    if not file_path.exists():
-        return {}
-
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception:
-        return {}
+    return read_object_data_file(get_object_data_path(history_dir_str, version_id))
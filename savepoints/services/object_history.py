@@ -8,6 +8,7 @@ CHANGE_TYPE_MAJOR = 'MAJOR'
 CHANGE_TYPE_MINOR = 'MINOR'
 CHANGE_TYPE_MOVED = 'MOVED'
 CHANGE_TYPE_CREATED = 'CREATED'
+CHANGE_TYPE_REMOVED = 'REMOVED'
 CHANGE_TYPE_RECORD = 'RECORD'
 
 
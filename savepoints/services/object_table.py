@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import os
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+
+import numpy as np
+
+from .object_data import get_object_data_path, read_object_data_file
+from .storage import get_history_dir
+
+OBJECT_TABLE_CACHE_SIZE = 16
+
+
+class ObjectTable:
+    """
+    Column-oriented view of one version's object metadata.
+    Rows are sorted by object name so tables can be joined with NumPy set operations.
+    """
+
+    def __init__(self, names, matrices, bboxes, v_counts):
+        self.names = names  # (N,) str
+        self.matrices = matrices  # (N, 16) float64, row-major world matrix
+        self.bboxes = bboxes  # (N, 6) float64, local AABB [min_xyz, max_xyz]
+        self.v_counts = v_counts  # (N,) int64
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def empty(cls):
+        return cls(
+            np.empty(0, dtype=str),
+            np.empty((0, 16), dtype=np.float64),
+            np.empty((0, 6), dtype=np.float64),
+            np.empty(0, dtype=np.int64),
+        )
+
+    @classmethod
+    def from_object_data(cls, data_map: dict) -> "ObjectTable":
+        """Builds a table from the {name: {matrix, bbox, v_count}} dict stored per version."""
+        if not data_map:
+            return cls.empty()
+
+        names = sorted(data_map)
+        rows = [data_map[n] for n in names]
+
+        count = len(rows)
+
+        # fromiter over a flat stream avoids building N small Python lists per column
+        matrices = np.fromiter(
+            chain.from_iterable(r.get('matrix') or _IDENTITY for r in rows), dtype=np.float64, count=count * 16
+        ).reshape(count, 16)
+        bboxes = np.fromiter(
+            chain.from_iterable(_flatten_bbox(r.get('bbox')) for r in rows), dtype=np.float64, count=count * 6
+        ).reshape(count, 6)
+        v_counts = np.fromiter((r.get('v_count', 0) for r in rows), dtype=np.int64, count=count)
+
+        return cls(np.array(names, dtype=str), matrices, bboxes, v_counts)
+
+    def index_of(self, names) -> np.ndarray:
+        """Row indices for the given names (which must exist in the table)."""
+        return np.searchsorted(self.names, names)
+
+    def world_aabbs(self, rows=None) -> np.ndarray:
+        """
+        World-space AABBs as an (N, 6) array [min_xyz, max_xyz].
+        The stored bbox is in object space, so its 8 corners are transformed by the stored matrix.
+        """
+        bboxes = self.bboxes if rows is None else self.bboxes[rows]
+        matrices = self.matrices if rows is None else self.matrices[rows]
+        if len(bboxes) == 0:
+            return np.empty((0, 6), dtype=np.float64)
+
+        corners = box_corners(bboxes)
+
+        m = matrices.reshape(-1, 4, 4)
+        world = np.einsum('nij,nkj->nki', m[:, :3, :3], corners) + m[:, None, :3, 3]
+        return np.concatenate([world.min(axis=1), world.max(axis=1)], axis=1)
+
+
+# (8, 3): whether each box corner takes the max (True) or min (False) along each axis.
+# Corner i has bit `axis` of i set when it sits on the max side of that axis.
+_CORNER_SELECTOR = np.array([[(i >> axis) & 1 for axis in range(3)] for i in range(8)], dtype=bool)
+_EMPTY_BBOX = (0.0,) * 6
+_IDENTITY = [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+
+
+def box_corners(bboxes) -> np.ndarray:
+    """The 8 corners of (N, 6) [min_xyz, max_xyz] boxes as an (N, 8, 3) array."""
+    return np.where(_CORNER_SELECTOR[None, :, :], bboxes[:, None, 3:], bboxes[:, None, :3])
+
+
+def _flatten_bbox(bbox):
+    if not bbox or len(bbox) != 2:
+        return _EMPTY_BBOX
+    return chain(bbox[0], bbox[1])
+
+
+@lru_cache(maxsize=OBJECT_TABLE_CACHE_SIZE)
+def _build_object_table(file_path: str, _mtime_ns: int) -> ObjectTable:
+    return ObjectTable.from_object_data(read_object_data_file(file_path))
+
+
+def load_object_table(version_id: str, history_dir: str | Path | None = None) -> ObjectTable:
+    """Loads the metadata table of a version (cached by file path and mtime)."""
+    history_dir = history_dir or get_history_dir()
+    if not history_dir:
+        return ObjectTable.empty()
+
+    path = get_object_data_path(history_dir, version_id)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return ObjectTable.empty()
+
+    return _build_object_table(str(path), mtime_ns)
+
+
+def clear_object_table_cache() -> None:
+    _build_object_table.cache_clear()
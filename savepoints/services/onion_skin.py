@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from dataclasses import dataclass, field
+
+ONION_SKIN_COLLECTION_NAME = "Ghost_Onion_Skin"
+
+# Newest layer -> oldest layer
+ONION_SKIN_NEWEST_COLOR = (1.0, 0.55, 0.1)
+ONION_SKIN_OLDEST_COLOR = (0.1, 0.45, 1.0)
+ONION_SKIN_MIN_ALPHA = 0.15
+
+
+def get_onion_layer_collection_name(version_id: str) -> str:
+    return f"Ghost_Onion_{version_id}"
+
+
+@dataclass
+class OnionLayer:
+    version_id: str
+    # Mesh datablock names to link from this version's snapshot: {mesh_key: data_name}
+    link_meshes: dict = field(default_factory=dict)
+    # Objects to draw: (object_name, mesh_key, 16-float row-major matrix)
+    instances: list = field(default_factory=list)
+
+
+@dataclass
+class OnionSkinPlan:
+    layers: list = field(default_factory=list)
+    skipped: list = field(default_factory=list)
+    vertex_count: int = 0
+    shared_instances: int = 0
+
+    @property
+    def object_count(self) -> int:
+        return sum(len(layer.instances) for layer in self.layers)
+
+    @property
+    def mesh_count(self) -> int:
+        return sum(len(layer.link_meshes) for layer in self.layers)
+
+
+def plan_onion_skin(version_ids: list[str], data_maps: dict, max_vertices: int) -> OnionSkinPlan:
+    """
+    Decides what each onion skin layer links and draws, from stored object metadata only.
+    version_ids are ordered newest first. A mesh whose geometry fingerprint was already linked
+    by a newer layer is instanced instead of linked again, and an object identical to one already
+    drawn (same geometry, same matrix) is not drawn twice. Layers are added until the unique
+    meshes would exceed max_vertices; the remaining versions are reported as skipped.
+    Versions whose metadata predates mesh names cannot be planned and are skipped.
+    """
+    plan = OnionSkinPlan()
+    linked_keys = set()
+    drawn = set()
+
+    for index, version_id in enumerate(version_ids):
+        data_map = data_maps.get(version_id) or {}
+        entries = {name: d for name, d in data_map.items() if d.get('data_name')}
+        if not entries:
+            plan.skipped.append(version_id)
+            continue
+
+        layer = OnionLayer(version_id)
+        layer_drawn = set()
+        layer_vertices = 0
+        layer_shared = 0
+        for obj_name, d in sorted(entries.items()):
+            # Without a fingerprint the mesh can only be shared within its own version
+            mesh_key = d.get('geo_hash') or f"{version_id}/{d['data_name']}"
+            matrix = tuple(d.get('matrix') or ())
+
+            if (mesh_key, matrix) in drawn or (mesh_key, matrix) in layer_drawn:
+                continue
+            layer_drawn.add((mesh_key, matrix))
+
+            if mesh_key in linked_keys:
+                layer_shared += 1
+            elif mesh_key not in layer.link_meshes:
+                layer.link_meshes[mesh_key] = d['data_name']
+                layer_vertices += d.get('v_count', 0)
+
+            layer.instances.append((obj_name, mesh_key, list(matrix)))
+
+        if plan.vertex_count + layer_vertices > max_vertices:
+            plan.skipped.extend(version_ids[index:])
+            break
+
+        linked_keys.update(layer.link_meshes)
+        drawn.update(layer_drawn)
+        plan.vertex_count += layer_vertices
+        plan.shared_instances += layer_shared
+        if layer.instances:
+            plan.layers.append(layer)
+
+    return plan
+
+
+def get_onion_layer_color(index: int, total: int) -> tuple[float, float, float, float]:
+    """RGBA for layer index (0 = newest) of total layers: warm and opaque to cool and faint."""
+    t = index / (total - 1) if total > 1 else 0.0
+    rgb = [a + (b - a) * t for a, b in zip(ONION_SKIN_NEWEST_COLOR, ONION_SKIN_OLDEST_COLOR)]
+    return rgb[0], rgb[1], rgb[2], 1.0 - (1.0 - ONION_SKIN_MIN_ALPHA) * t
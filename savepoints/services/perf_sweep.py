@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+import os
+import statistics
+from dataclasses import asdict, dataclass, field
+
+PERF_SWEEP_FILENAME = "performance_sweep.json"
+PERF_SWEEP_RESOLUTION = 25
+PERF_SWEEP_SAMPLES = 16
+
+# (record key, label, unit) of every tracked metric; render time drives the highlight
+PERF_METRICS = (
+    ('render_time', "Render Time", "s"),
+    ('peak_rss_mb', "Peak Memory", "MB"),
+    ('triangles', "Triangles", ""),
+    ('texture_mb', "Texture Memory", "MB"),
+)
+# A version is a jump when a metric reaches this multiple of the median of the versions just before it
+JUMP_FACTOR = 1.5
+JUMP_BASELINE_WINDOW = 3
+
+# Result of the last sweep of this session, drawn by the batch panel
+_last_sweep = None
+
+
+@dataclass
+class CostJump:
+    version_id: str
+    metric: str
+    before: float
+    after: float
+
+    @property
+    def factor(self) -> float:
+        return self.after / self.before if self.before else float('inf')
+
+
+@dataclass
+class PerformanceSweep:
+    # Oldest first: [{'version_id', 'render_time', 'peak_rss_mb', 'triangles', 'texture_mb'}]
+    points: list = field(default_factory=list)
+    jumps: list = field(default_factory=list)
+
+    @property
+    def worst_jump(self) -> CostJump | None:
+        """The biggest render-time jump, or the biggest jump of any metric when render time never jumped."""
+        render_jumps = [j for j in self.jumps if j.metric == 'render_time']
+        candidates = render_jumps or self.jumps
+        return max(candidates, key=lambda j: j.factor) if candidates else None
+
+    def peak(self, metric: str) -> float:
+        return max((p[metric] for p in self.points if p.get(metric) is not None), default=0.0)
+
+
+def find_cost_jumps(points: list[dict], metric: str, factor: float = JUMP_FACTOR,
+                    window: int = JUMP_BASELINE_WINDOW) -> list[CostJump]:
+    """
+    Versions (points ordered oldest first) where the metric reached `factor` times both the median of the
+    preceding `window` measured versions and the version just before. The median keeps a single noisy render
+    from faking a baseline; the previous version keeps a lasting regression from being reported twice.
+    """
+    jumps = []
+    history = []
+    for point in points:
+        value = point.get(metric)
+        if value is None:
+            continue
+        if history:
+            baseline = max(statistics.median(history[-window:]), history[-1])
+            if baseline > 0 and value >= factor * baseline:
+                jumps.append(CostJump(point['version_id'], metric, baseline, value))
+        history.append(value)
+    return jumps
+
+
+def analyze_sweep(records: list[dict], version_order: list[str]) -> PerformanceSweep:
+    """Builds the trend from successful batch report records, in version_order (oldest first)."""
+    by_version = {r['version_id']: r for r in records if r.get('state') == 'DONE'}
+    points = [
+        {'version_id': vid, **{key: by_version[vid].get(key) for key, _label, _unit in PERF_METRICS}}
+        for vid in version_order if vid in by_version
+    ]
+
+    jumps = []
+    for key, _label, _unit in PERF_METRICS:
+        jumps.extend(find_cost_jumps(points, key))
+    return PerformanceSweep(points, jumps)
+
+
+def write_sweep(output_dir: str, sweep: PerformanceSweep) -> str | None:
+    global _last_sweep
+    _last_sweep = sweep
+
+    path = os.path.join(output_dir, PERF_SWEEP_FILENAME)
+    worst = sweep.worst_jump
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'points': sweep.points,
+                'jumps': [{**asdict(j), 'factor': round(j.factor, 2)} for j in sweep.jumps],
+                'worst_jump': worst.version_id if worst else None,
+            }, f, indent=2)
+    except OSError as e:
+        print(f"[SavePoints] Failed to write performance sweep: {e}")
+        return None
+    return path
+
+
+def get_last_sweep() -> PerformanceSweep | None:
+    return _last_sweep
+
+
+def format_metric(value, unit: str) -> str:
+    if value is None:
+        return "-"
+    if not unit:
+        return f"{value / 1_000_000:.2f}M" if value >= 1_000_000 else f"{value:,.0f}"
+    return f"{value:.1f}{unit}" if unit == "s" else f"{value:.0f} {unit}"
@@ -86,29 +86,8 @@ def create_vse_timelapse(directory_path, scene_name_suffix="_Timelapse"):
         print("No images found to create timelapse.")
         return None
 
-    clean_path = directory_path.rstrip(os.sep)
-    base_name = os.path.basename(clean_path)
-    if not base_name:
-        base_name = "render"
-    scene_name = f"{base_name}{scene_name_suffix}"
-
-    new_scene = bpy.data.scenes.new(name=scene_name)
-
-    current_scene = bpy.context.scene
-    new_scene.render.resolution_x = current_scene.render.resolution_x
-    new_scene.render.resolution_y = current_scene.render.resolution_y
-    new_scene.render.fps = current_scene.render.fps
-    new_scene.render.fps_base = current_scene.render.fps_base
-
-    if not new_scene.sequence_editor:
-        new_scene.sequence_editor_create()
-
-    seq = new_scene.sequence_editor
-
-    if hasattr(seq, 'strips'):
-        strips_collection = seq.strips
-    else:
-        strips_collection = seq.sequences
+    new_scene = _new_timelapse_scene(get_timelapse_scene_name(directory_path, scene_name_suffix))
+    strips_collection = _get_strips_collection(new_scene)
 
     try:
         current_frame = 1
@@ -136,6 +115,73 @@ def create_vse_timelapse(directory_path, scene_name_suffix="_Timelapse"):
         return None
 
 
+def get_timelapse_scene_name(directory_path, scene_name_suffix="_Timelapse"):
+    clean_path = directory_path.rstrip(os.sep)
+    base_name = os.path.basename(clean_path)
+    if not base_name:
+        base_name = "render"
+    return f"{base_name}{scene_name_suffix}"
+
+
+def _new_timelapse_scene(scene_name):
+    new_scene = bpy.data.scenes.new(name=scene_name)
+
+    current_scene = bpy.context.scene
+    new_scene.render.resolution_x = current_scene.render.resolution_x
+    new_scene.render.resolution_y = current_scene.render.resolution_y
+    new_scene.render.fps = current_scene.render.fps
+    new_scene.render.fps_base = current_scene.render.fps_base
+
+    if not new_scene.sequence_editor:
+        new_scene.sequence_editor_create()
+    return new_scene
+
+
+def _get_strips_collection(scene):
+    seq = scene.sequence_editor
+    if hasattr(seq, 'strips'):
+        return seq.strips
+    return seq.sequences
+
+
+def update_vse_timelapse(scene_name, frames):
+    """
+    Creates or updates a timelapse scene so it shows frames [(key, image path, frame_start, duration)].
+    Strips already in place are kept and only shortened or lengthened, so the scene can be refreshed
+    cheaply every time a progressive batch finishes a render.
+    Returns the scene name if successful, None otherwise.
+    """
+    scene = bpy.data.scenes.get(scene_name) or _new_timelapse_scene(scene_name)
+    if not scene.sequence_editor:
+        scene.sequence_editor_create()
+    strips_collection = _get_strips_collection(scene)
+    targets = {f"Timelapse_{key}": (path, start, duration) for key, path, start, duration in frames}
+
+    try:
+        # Targets never overlap: once moved strips are removed and the rest are cut to their targets,
+        # new strips and extensions only fill free frames
+        for strip in list(strips_collection):
+            target = targets.get(strip.name)
+            if target is None or strip.frame_final_start != target[1]:
+                strips_collection.remove(strip)
+            elif strip.frame_final_duration > target[2]:
+                strip.frame_final_duration = target[2]
+
+        for name, (path, start, duration) in targets.items():
+            strip = strips_collection.get(name)
+            if strip is None:
+                strip = strips_collection.new_image(name=name, filepath=path, channel=1, frame_start=start)
+            strip.frame_final_duration = duration
+
+        if targets:
+            scene.frame_end = max(start + duration for _path, start, duration in targets.values()) - 1
+        return scene.name
+
+    except Exception as e:
+        print(f"SavePoints Error updating VSE timelapse: {e}")
+        return None
+
+
 def launch_timelapse_mp4_generation(input_dir, output_file, fps, burn_in, burn_in_pos):
     """
     Launches the timelapse worker script in a background process to generate an MP4.
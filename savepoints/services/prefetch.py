@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import threading
+from pathlib import Path
+
+from .manifest import load_manifest
+from .object_data import get_object_data_path, get_object_data_cache_usage, read_object_data_file
+from .storage import get_history_dir
+from .versioning import get_sorted_versions
+
+# Pause between files so the UI thread can grab the GIL between two JSON parses.
+PREFETCH_YIELD_SECONDS = 0.005
+
+_prefetch_thread: threading.Thread | None = None
+_stop_event: threading.Event | None = None
+
+
+def start_object_data_prefetch() -> bool:
+    """
+    Warm the object metadata cache in a background thread, newest version first.
+    Everything that needs bpy (history dir, manifest) is resolved here on the main thread;
+    the worker only reads files. Returns True if a prefetch was started.
+    """
+    stop_object_data_prefetch()
+
+    history_dir_str = get_history_dir()
+    if not history_dir_str or not Path(history_dir_str).exists():
+        return False
+
+    manifest = load_manifest(create_if_missing=False)
+    paths = [
+        get_object_data_path(history_dir_str, v["id"])
+        for v in get_sorted_versions(manifest, newest_first=True)
+        if v.get("id")
+    ]
+    if not paths:
+        return False
+
+    global _prefetch_thread, _stop_event
+    _stop_event = threading.Event()
+    _prefetch_thread = threading.Thread(
+        target=_prefetch_worker,
+        args=(paths, _stop_event),
+        name="SavePointsPrefetch",
+        daemon=True
+    )
+    _prefetch_thread.start()
+    return True
+
+
+def stop_object_data_prefetch(timeout: float = 1.0) -> None:
+    """Signal the running prefetch (if any) to stop and wait briefly for it."""
+    global _prefetch_thread, _stop_event
+    if _stop_event:
+        _stop_event.set()
+    if _prefetch_thread and _prefetch_thread.is_alive():
+        _prefetch_thread.join(timeout)
+    _prefetch_thread = None
+    _stop_event = None
+
+
+def is_prefetch_running() -> bool:
+    return bool(_prefetch_thread and _prefetch_thread.is_alive())
+
+
+def _prefetch_worker(paths: list[Path], stop_event: threading.Event) -> None:
+    for path in paths:
+        if stop_event.is_set():
+            return
+
+        # Respect the cache budget: never evict entries that were loaded on demand.
+        used, capacity = get_object_data_cache_usage()
+        if capacity and used >= capacity:
+            return
+
+        if path.exists():
+            try:
+                read_object_data_file(path)
+            except Exception as e:
+                print(f"[SavePoints] Prefetch failed for {path.name}: {e}")
+
+        # Event.wait releases the GIL, unlike a busy loop.
+        stop_event.wait(PREFETCH_YIELD_SECONDS)
@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import hashlib
+import json
+import os
+import shutil
+from functools import lru_cache
+from pathlib import Path
+
+import bpy
+
+RENDER_CACHE_DIRNAME = ".render_cache"
+SNAPSHOT_HASH_INDEX = "snapshot_hashes.json"
+_HASH_CHUNK_SIZE = 1024 * 1024
+SNAPSHOT_HASH_CACHE_SIZE = 1024
+# Per-batch temp paths and device assignments that say nothing about the rendered image
+_VOLATILE_SETTINGS = ("world_blend_path", "gpu")
+
+
+def get_render_cache_dir(base_path="//") -> str:
+    """Renders shared by every batch of this project: renders_batch/.render_cache (kept out of the history folder)."""
+    return os.path.join(bpy.path.abspath(base_path), "renders_batch", RENDER_CACHE_DIRNAME)
+
+
+def get_settings_fingerprint(render_settings: dict, blender_version: str | None = None,
+                             world_hash: str | None = None) -> str:
+    """Hash of the canonicalized render settings, the world's contents and the Blender version that renders them."""
+    if blender_version is None:
+        blender_version = bpy.app.version_string
+    stable = {k: v for k, v in render_settings.items() if k not in _VOLATILE_SETTINGS}
+    if world_hash is not None:
+        stable["world_hash"] = world_hash
+    canonical = json.dumps(stable, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.blake2b(f"{blender_version}\n{canonical}".encode('utf-8'), digest_size=16).hexdigest()
+
+
+def hash_world_library(world_blend_path: str, image_paths=()) -> str:
+    """
+    Hash of the world library written for a batch, plus the size and mtime of the external images it
+    points to, so an HDRI overwritten in place changes the key as well.
+    """
+    stat = os.stat(world_blend_path)
+    h = hashlib.blake2b(_hash_file(world_blend_path, stat.st_size, stat.st_mtime_ns).encode('ascii'), digest_size=16)
+    for path in sorted(image_paths):
+        try:
+            image_stat = os.stat(path)
+            h.update(f"\n{path}:{image_stat.st_size}:{image_stat.st_mtime_ns}".encode('utf-8'))
+        except OSError:
+            h.update(f"\n{path}:missing".encode('utf-8'))
+    return h.hexdigest()
+
+
+def load_snapshot_hash_index(cache_dir: str) -> dict:
+    try:
+        with open(os.path.join(cache_dir, SNAPSHOT_HASH_INDEX), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_snapshot_hash_index(cache_dir: str, index: dict) -> None:
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(os.path.join(cache_dir, SNAPSHOT_HASH_INDEX), 'w', encoding='utf-8') as f:
+            json.dump(index, f, separators=(',', ':'))
+    except OSError as e:
+        print(f"[SavePoints] Failed to save snapshot hash index: {e}")
+
+
+@lru_cache(maxsize=SNAPSHOT_HASH_CACHE_SIZE)
+def _hash_file(path: str, _size: int, _mtime_ns: int) -> str:
+    # Keyed by size and mtime like object_data's reader, so a rewritten file is never served a stale digest
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def hash_snapshot(snapshot_path, index: dict | None = None) -> str:
+    """
+    Content hash of a snapshot file. Snapshots are never rewritten, so the digest is remembered by path,
+    size and mtime: for the session in memory, and across sessions in index. Each file is read only once.
+    """
+    path = str(snapshot_path)
+    stat = os.stat(path)
+    if index is not None:
+        entry = index.get(path)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+
+    digest = _hash_file(path, stat.st_size, stat.st_mtime_ns)
+
+    if index is not None:
+        index[path] = [stat.st_size, stat.st_mtime_ns, digest]
+    return digest
+
+
+def clear_snapshot_hash_cache() -> None:
+    _hash_file.cache_clear()
+
+
+def get_render_cache_key(snapshot_hash: str, settings_fingerprint: str) -> str:
+    return hashlib.blake2b(f"{snapshot_hash}:{settings_fingerprint}".encode('utf-8'), digest_size=16).hexdigest()
+
+
+def find_render_output(output_dir: str, file_prefix: str) -> Path | None:
+    """The image a worker wrote for file_prefix (Blender may append a frame number and extension)."""
+    matches = sorted(Path(output_dir).glob(f"{file_prefix}*"))
+    files = [p for p in matches if p.is_file()]
+    return files[0] if files else None
+
+
+def find_cached_render(cache_dir: str, key: str) -> Path | None:
+    return find_render_output(cache_dir, key)
+
+
+def store_render(cache_dir: str, key: str, output_file: Path) -> None:
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _copy_file(output_file, Path(cache_dir) / f"{key}{output_file.suffix}")
+    except OSError as e:
+        print(f"[SavePoints] Failed to cache render {output_file.name}: {e}")
+
+
+def restore_render(cached_file: Path, output_dir: str, file_prefix: str) -> Path:
+    target = Path(output_dir) / f"{file_prefix}{cached_file.suffix}"
+    _copy_file(cached_file, target)
+    return target
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """
+    Independent copy: a hardlink would let an edit of a batch image silently change the cached render.
+    Where the file system supports it, copy_file_range clones the data copy-on-write instead of copying.
+    """
+    if dst.exists():
+        dst.unlink()
+    if hasattr(os, 'copy_file_range'):
+        try:
+            _copy_file_range(src, dst)
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            if dst.exists():
+                dst.unlink()
+    shutil.copy2(src, dst)
+
+
+def _copy_file_range(src: Path, dst: Path) -> None:
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            if copied == 0:
+                break
+            remaining -= copied
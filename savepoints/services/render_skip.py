@@ -0,0 +1,147 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .frustum import aabbs_in_frustum, frustum_planes
+from .object_data import get_object_data_path, read_object_data_file
+from .object_table import ObjectTable
+from .scene_diff import diff_object_tables
+from .storage import get_history_dir
+
+SKIP_REPORT_FILENAME = "skipped_versions.json"
+
+REASON_FIRST = "first version"
+REASON_NO_METADATA = "no stored metadata"
+REASON_VISIBLE = "visible changes"
+REASON_NON_MESH = "non-mesh object changed"
+REASON_UNCHANGED = "no changes"
+REASON_OFF_CAMERA = "changes outside camera view"
+
+
+@dataclass
+class SkipDecision:
+    version_id: str
+    render: bool
+    reason: str
+    # Version the changes were measured against (the last one kept for rendering)
+    compared_to: str | None = None
+    changed: int = 0
+    visible: int = 0
+
+
+def find_redundant_versions(version_ids: list[str], view_projection, ignore_names=(),
+                            history_dir: str | Path | None = None) -> list[SkipDecision]:
+    """
+    Decides, from stored object metadata only, which versions would render the same image as the
+    previously rendered one. version_ids are ordered oldest first; each version is compared with the
+    last version kept for rendering, so small off-camera edits cannot add up unnoticed.
+    A version is skipped when none of its changed objects has a world AABB (before or after the
+    change) inside the camera frustum. Changed non-mesh objects (lights, empties) are treated as
+    visible, and versions without metadata are always rendered.
+    ignore_names are left out of the comparison (e.g. the camera, which batch renders override).
+    """
+    history_dir = history_dir or get_history_dir()
+    planes = frustum_planes(view_projection)
+    ignore = np.array(sorted(ignore_names), dtype=str)
+
+    decisions = []
+    previous_id = None
+    previous_map = None
+    for version_id in version_ids:
+        data_map = _load_data_map(history_dir, version_id)
+        if data_map is None:
+            decisions.append(SkipDecision(version_id, True, REASON_NO_METADATA, previous_id))
+            # Nothing to compare the next version with
+            previous_id, previous_map = version_id, None
+            continue
+
+        if previous_map is None:
+            reason = REASON_FIRST if previous_id is None else REASON_NO_METADATA
+            decisions.append(SkipDecision(version_id, True, reason, previous_id))
+            previous_id, previous_map = version_id, data_map
+            continue
+
+        decision = _decide(version_id, previous_id, previous_map, data_map, planes, ignore)
+        decisions.append(decision)
+        if decision.render:
+            previous_id, previous_map = version_id, data_map
+
+    return decisions
+
+
+def _decide(version_id, previous_id, old_map, new_map, planes, ignore) -> SkipDecision:
+    old = ObjectTable.from_object_data(old_map)
+    new = ObjectTable.from_object_data(new_map)
+
+    changed = np.union1d(diff_object_tables(old, new).changed_names(), _geometry_changed_names(old_map, new_map))
+    changed = np.setdiff1d(changed, ignore)
+    if len(changed) == 0:
+        return SkipDecision(version_id, False, REASON_UNCHANGED, previous_id)
+
+    visible = 0
+    non_mesh = False
+    for table in (old, new):
+        rows = np.flatnonzero(np.isin(table.names, changed))
+        if len(rows) == 0:
+            continue
+        non_mesh = non_mesh or bool(np.any(table.v_counts[rows] == 0))
+        visible += int(np.count_nonzero(aabbs_in_frustum(table.world_aabbs(rows), planes)))
+
+    if non_mesh:
+        return SkipDecision(version_id, True, REASON_NON_MESH, previous_id, len(changed), visible)
+    if visible:
+        return SkipDecision(version_id, True, REASON_VISIBLE, previous_id, len(changed), visible)
+    return SkipDecision(version_id, False, REASON_OFF_CAMERA, previous_id, len(changed))
+
+
+def _geometry_changed_names(old_map: dict, new_map: dict) -> list[str]:
+    """Objects whose mesh fingerprint changed without changing vertex count, bounds or matrix."""
+    names = []
+    for name, new_data in new_map.items():
+        old_data = old_map.get(name)
+        if not old_data:
+            continue
+        old_hash, new_hash = old_data.get('geo_hash'), new_data.get('geo_hash')
+        if old_hash and new_hash and old_hash != new_hash:
+            names.append(name)
+    return names
+
+
+def _load_data_map(history_dir, version_id) -> dict | None:
+    if not history_dir:
+        return None
+    path = get_object_data_path(history_dir, version_id)
+    if not os.path.exists(path):
+        return None
+    return read_object_data_file(path)
+
+
+def write_skip_report(output_dir: str, decisions: list[SkipDecision]) -> str | None:
+    """Writes every decision to skipped_versions.json in the batch output folder."""
+    path = os.path.join(output_dir, SKIP_REPORT_FILENAME)
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'skipped': [d.version_id for d in decisions if not d.render],
+                'decisions': [asdict(d) for d in decisions],
+            }, f, indent=2)
+    except OSError as e:
+        print(f"[SavePoints] Failed to write skip report: {e}")
+        return None
+    return path
+
+
+def format_skip_report(decisions: list[SkipDecision]) -> str:
+    skipped = [d for d in decisions if not d.render]
+    lines = [f"Skipped {len(skipped)} of {len(decisions)} versions with no visible changes.", ""]
+    for d in decisions:
+        action = "RENDER" if d.render else "SKIP  "
+        detail = f" ({d.visible}/{d.changed} changed objects in view)" if d.changed else ""
+        against = f" vs {d.compared_to}" if d.compared_to else ""
+        lines.append(f"{action} {d.version_id}{against}: {d.reason}{detail}")
+    return "\n".join(lines)
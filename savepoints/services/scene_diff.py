@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import bpy
+import numpy as np
+
+from .object_data import collect_object_data
+from .object_history import (
+    CHANGE_TYPE_CREATED,
+    CHANGE_TYPE_MAJOR,
+    CHANGE_TYPE_MINOR,
+    CHANGE_TYPE_MOVED,
+    CHANGE_TYPE_REMOVED,
+)
+from .object_table import ObjectTable, load_object_table
+
+DIFF_CHANGE_TYPES = (
+    CHANGE_TYPE_CREATED,
+    CHANGE_TYPE_REMOVED,
+    CHANGE_TYPE_MOVED,
+    CHANGE_TYPE_MINOR,
+    CHANGE_TYPE_MAJOR,
+)
+
+
+class SceneDiff:
+    """Names of changed objects per change type, as returned by diff_object_tables."""
+
+    def __init__(self, created, removed, moved, reshaped, topology, vertex_delta):
+        self.created = created
+        self.removed = removed
+        self.moved = moved
+        self.reshaped = reshaped
+        self.topology = topology
+        self.vertex_delta = vertex_delta  # aligned with `topology`
+
+    def by_change_type(self) -> dict[str, np.ndarray]:
+        return {
+            CHANGE_TYPE_CREATED: self.created,
+            CHANGE_TYPE_REMOVED: self.removed,
+            CHANGE_TYPE_MOVED: self.moved,
+            CHANGE_TYPE_MINOR: self.reshaped,
+            CHANGE_TYPE_MAJOR: self.topology,
+        }
+
+    def counts(self) -> dict[str, int]:
+        return {k: len(v) for k, v in self.by_change_type().items()}
+
+    def changed_names(self) -> np.ndarray:
+        return np.concatenate([self.created, self.removed, self.moved, self.reshaped, self.topology])
+
+    def is_empty(self) -> bool:
+        return not any(self.counts().values())
+
+    def entries(self, limit: int | None = None) -> list[dict]:
+        """
+        Flattens the diff into UI entries, using the same change-type vocabulary as Object History.
+        """
+        entries = []
+        for change_type, names in self.by_change_type().items():
+            for i, name in enumerate(names):
+                if limit is not None and len(entries) >= limit:
+                    return entries
+                entries.append({
+                    'object_name': str(name),
+                    'change_type': change_type,
+                    'details': _details(change_type, self.vertex_delta[i] if change_type == CHANGE_TYPE_MAJOR else 0),
+                })
+        return entries
+
+
+def _details(change_type, vertex_delta):
+    if change_type == CHANGE_TYPE_MAJOR:
+        sign = "+" if vertex_delta > 0 else ""
+        return f"{sign}{vertex_delta} verts"
+    if change_type == CHANGE_TYPE_MINOR:
+        return "Shape Modified"
+    if change_type == CHANGE_TYPE_MOVED:
+        return "Moved / Transformed"
+    if change_type == CHANGE_TYPE_CREATED:
+        return "Added"
+    return "Removed"
+
+
+def diff_object_tables(old: ObjectTable, new: ObjectTable) -> SceneDiff:
+    """
+    Compares two metadata tables with vectorized set and array operations.
+    Each common object falls into exactly one category, with the same precedence as
+    compare_object_history: vertex count > bounding box > matrix.
+    """
+    common, old_idx, new_idx = np.intersect1d(old.names, new.names, assume_unique=True, return_indices=True)
+
+    created = np.setdiff1d(new.names, common, assume_unique=True)
+    removed = np.setdiff1d(old.names, common, assume_unique=True)
+
+    v_delta = new.v_counts[new_idx] - old.v_counts[old_idx]
+    topology_mask = v_delta != 0
+    reshaped_mask = ~topology_mask & np.any(old.bboxes[old_idx] != new.bboxes[new_idx], axis=1)
+    moved_mask = ~topology_mask & ~reshaped_mask & np.any(old.matrices[old_idx] != new.matrices[new_idx], axis=1)
+
+    return SceneDiff(
+        created=created,
+        removed=removed,
+        moved=common[moved_mask],
+        reshaped=common[reshaped_mask],
+        topology=common[topology_mask],
+        vertex_delta=v_delta[topology_mask],
+    )
+
+
+def load_live_object_table(objects) -> ObjectTable:
+    """Builds a table from the current scene using the same extraction as commits."""
+    return ObjectTable.from_object_data(collect_object_data(objects, fingerprint_meshes=False))
+
+
+def diff_versions(base_version_id: str, target_version_id: str | None = None, live_objects=None) -> SceneDiff:
+    """
+    Diffs two stored versions, or a stored version against the live scene when
+    target_version_id is None (live_objects defaults to bpy.data.objects).
+    Only the stored metadata is read; neither .blend is opened.
+    """
+    base = load_object_table(base_version_id)
+
+    if target_version_id:
+        target = load_object_table(target_version_id)
+    else:
+        if live_objects is None:
+            live_objects = bpy.data.objects
+        target = load_live_object_table(live_objects)
+
+    return diff_object_tables(base, target)
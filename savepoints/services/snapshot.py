@@ -52,15 +52,23 @@ def create_snapshot(context, version_id, note, skip_thumbnail=False):
         if not skip_thumbnail:
             capture_thumbnail(context, str(thumb_path))
 
-        save_object_data(version_id, bpy.data.objects)
+        settings = getattr(context.scene, "savepoints_settings", None)
+        save_object_data(version_id, bpy.data.objects,
+                         fingerprint_meshes=bool(settings and settings.store_mesh_fingerprints))
 
         snapshot_path = version_dir / SNAPSHOT_FILENAME
 
         use_compress = False
-        settings = getattr(context.scene, "savepoints_settings", None)
         if settings:
             use_compress = settings.use_compression
 
+        if settings and settings.store_ghost_proxies:
+            try:
+                from .ghost_proxy import save_ghost_proxies
+                save_ghost_proxies(version_id, bpy.data.objects, settings.ghost_proxy_edge_budget)
+            except Exception as e:
+                print(f"[SavePoints] Failed to store ghost proxies: {e}")
+
         bpy.ops.wm.save_as_mainfile(copy=True, filepath=str(snapshot_path), compress=use_compress)
 
         file_size = 0
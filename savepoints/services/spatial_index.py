@@ -0,0 +1,233 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+from .manifest import load_manifest
+from .object_data import get_object_data_path
+from .object_history import (
+    CHANGE_TYPE_CREATED,
+    CHANGE_TYPE_MAJOR,
+    CHANGE_TYPE_MINOR,
+    CHANGE_TYPE_MOVED,
+    CHANGE_TYPE_REMOVED,
+)
+from .object_table import ObjectTable, load_object_table
+from .scene_diff import diff_object_tables
+from .storage import get_history_dir
+from .versioning import get_sorted_versions
+
+# Change type codes stored per index entry (index into this tuple)
+INDEX_CHANGE_TYPES = (
+    CHANGE_TYPE_CREATED,
+    CHANGE_TYPE_REMOVED,
+    CHANGE_TYPE_MOVED,
+    CHANGE_TYPE_MINOR,
+    CHANGE_TYPE_MAJOR,
+)
+
+GRID_CELLS_PER_AXIS = 64
+# Boxes covering more cells than this are kept in a separate list and tested linearly,
+# so one huge ground plane does not flood the grid.
+MAX_CELLS_PER_BOX = 64
+
+_cached_index: "SpatialChangeIndex | None" = None
+_cached_key: tuple | None = None
+
+
+class SpatialChangeIndex:
+    """
+    Uniform grid over the world-space AABBs of every change recorded in the history.
+    Each entry is one (version, object, change type, box); moves and reshapes store both the
+    previous and the new box, so a query hits the region an object left as well as where it went.
+    """
+
+    def __init__(self, version_ids, boxes, version_idx, change_codes, names):
+        self.version_ids = list(version_ids)
+        self.boxes = boxes  # (M, 6)
+        self.version_idx = version_idx  # (M,)
+        self.change_codes = change_codes  # (M,)
+        self.names = names  # (M,)
+
+        self._build_grid()
+
+    def __len__(self):
+        return len(self.boxes)
+
+    def _build_grid(self):
+        if len(self.boxes) == 0:
+            self.origin = np.zeros(3)
+            self.cell_size = np.ones(3)
+            self.dims = np.ones(3, dtype=np.int64)
+            self.cell_keys = np.empty(0, dtype=np.int64)
+            self.cell_offsets = np.zeros(1, dtype=np.int64)
+            self.cell_entries = np.empty(0, dtype=np.int64)
+            self.oversized = np.empty(0, dtype=np.int64)
+            return
+
+        # Cubic cells sized from the largest axis, so flat levels do not get needle-thin cells
+        self.origin = self.boxes[:, :3].min(axis=0)
+        extent = np.maximum(self.boxes[:, 3:].max(axis=0) - self.origin, 1e-6)
+        self.cell_size = np.full(3, extent.max() / GRID_CELLS_PER_AXIS)
+        self.dims = np.clip(np.ceil(extent / self.cell_size).astype(np.int64), 1, GRID_CELLS_PER_AXIS)
+
+        lo, hi = self._cell_range(self.boxes)
+        spans = hi - lo + 1
+        cell_counts = spans.prod(axis=1)
+
+        oversized_mask = cell_counts > MAX_CELLS_PER_BOX
+        self.oversized = np.flatnonzero(oversized_mask)
+
+        # Expand every remaining box into the cells it covers, without a Python loop:
+        # each box contributes cell_counts[i] rows, decoded from a running local index.
+        indexed = np.flatnonzero(~oversized_mask)
+        counts = cell_counts[indexed]
+        all_entries = np.repeat(indexed, counts)
+        local = np.arange(len(all_entries)) - np.repeat(np.cumsum(counts) - counts, counts)
+        span = spans[all_entries]
+        offsets = np.stack([
+            local // (span[:, 1] * span[:, 2]),
+            (local // span[:, 2]) % span[:, 1],
+            local % span[:, 2],
+        ], axis=1)
+        all_keys = self._linear_key(lo[all_entries] + offsets)
+
+        order = np.argsort(all_keys, kind='stable')
+        all_keys = all_keys[order]
+
+        # CSR layout: unique cell keys with offsets into the sorted entry list
+        self.cell_keys, starts = np.unique(all_keys, return_index=True)
+        self.cell_offsets = np.append(starts, len(all_keys))
+        self.cell_entries = all_entries[order]
+
+    def _cell_range(self, boxes):
+        lo = np.floor((boxes[:, :3] - self.origin) / self.cell_size).astype(np.int64)
+        hi = np.floor((boxes[:, 3:] - self.origin) / self.cell_size).astype(np.int64)
+        return np.clip(lo, 0, self.dims - 1), np.clip(hi, 0, self.dims - 1)
+
+    def _linear_key(self, cells):
+        return (cells[:, 0] * self.dims[1] + cells[:, 1]) * self.dims[2] + cells[:, 2]
+
+    def _candidates(self, region):
+        region = np.asarray(region, dtype=np.float64).reshape(1, 6)
+        lo, hi = self._cell_range(region)
+        lo, hi = lo[0], hi[0]
+
+        grid = np.stack(np.meshgrid(*[np.arange(lo[a], hi[a] + 1) for a in range(3)], indexing='ij'), -1)
+        query_keys = self._linear_key(grid.reshape(-1, 3))
+
+        pos = np.searchsorted(self.cell_keys, query_keys)
+        in_range = pos < len(self.cell_keys)
+        pos, query_keys = pos[in_range], query_keys[in_range]
+        hit_cells = pos[self.cell_keys[pos] == query_keys]
+
+        # Gather the CSR slices of every hit cell in one go
+        starts = self.cell_offsets[hit_cells]
+        lengths = self.cell_offsets[hit_cells + 1] - starts
+        slots = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths) + np.arange(lengths.sum())
+        return np.unique(np.concatenate([self.cell_entries[slots], self.oversized]))
+
+    def query(self, region_min, region_max) -> list[dict]:
+        """
+        Returns the versions in which anything overlapping the region changed, newest first:
+        [{'version_id', 'counts': {change_type: n}, 'objects': [names]}]
+        """
+        if len(self.boxes) == 0:
+            return []
+
+        region = np.concatenate([np.asarray(region_min, dtype=np.float64), np.asarray(region_max, dtype=np.float64)])
+        candidates = self._candidates(region)
+        if len(candidates) == 0:
+            return []
+
+        boxes = self.boxes[candidates]
+        overlap = np.all(boxes[:, :3] <= region[3:], axis=1) & np.all(boxes[:, 3:] >= region[:3], axis=1)
+        hits = candidates[overlap]
+
+        results = []
+        hit_versions = self.version_idx[hits]
+        for v_idx in np.unique(hit_versions)[::-1]:
+            version_hits = hits[hit_versions == v_idx]
+            codes = self.change_codes[version_hits]
+            counts = {INDEX_CHANGE_TYPES[c]: int(n) for c, n in zip(*np.unique(codes, return_counts=True))}
+            results.append({
+                'version_id': self.version_ids[v_idx],
+                'counts': counts,
+                'objects': sorted(set(self.names[version_hits].tolist())),
+            })
+        return results
+
+
+def build_spatial_change_index(version_ids: list[str], tables: list[ObjectTable]) -> SpatialChangeIndex:
+    """Builds the index from per-version tables ordered oldest -> newest."""
+    boxes, version_idx, codes, names = [], [], [], []
+
+    def add(v_idx, code, table, changed_names):
+        if len(changed_names) == 0:
+            return
+        rows = table.index_of(changed_names)
+        boxes.append(table.world_aabbs(rows))
+        version_idx.append(np.full(len(rows), v_idx, dtype=np.int64))
+        codes.append(np.full(len(rows), INDEX_CHANGE_TYPES.index(code), dtype=np.int8))
+        names.append(np.asarray(changed_names))
+
+    prev = ObjectTable.empty()
+    for v_idx, table in enumerate(tables):
+        diff = diff_object_tables(prev, table)
+        add(v_idx, CHANGE_TYPE_CREATED, table, diff.created)
+        add(v_idx, CHANGE_TYPE_REMOVED, prev, diff.removed)
+        for code, changed in ((CHANGE_TYPE_MOVED, diff.moved), (CHANGE_TYPE_MINOR, diff.reshaped),
+                              (CHANGE_TYPE_MAJOR, diff.topology)):
+            add(v_idx, code, prev, changed)
+            add(v_idx, code, table, changed)
+        prev = table
+
+    if not boxes:
+        return SpatialChangeIndex(version_ids, np.empty((0, 6)), np.empty(0, dtype=np.int64),
+                                  np.empty(0, dtype=np.int8), np.empty(0, dtype=str))
+
+    return SpatialChangeIndex(
+        version_ids,
+        np.concatenate(boxes),
+        np.concatenate(version_idx),
+        np.concatenate(codes),
+        np.concatenate(names),
+    )
+
+
+def get_spatial_change_index() -> SpatialChangeIndex | None:
+    """
+    Returns the index for the current project, rebuilding it only when the history changed
+    (a new version, or a rewritten metadata file).
+    """
+    global _cached_index, _cached_key
+
+    history_dir = get_history_dir()
+    if not history_dir or not Path(history_dir).exists():
+        return None
+
+    manifest = load_manifest(create_if_missing=False)
+    version_ids = [v["id"] for v in get_sorted_versions(manifest, newest_first=False) if v.get("id")]
+
+    key_parts = [history_dir]
+    for vid in version_ids:
+        try:
+            key_parts.append((vid, os.stat(get_object_data_path(history_dir, vid)).st_mtime_ns))
+        except OSError:
+            key_parts.append((vid, 0))
+    key = tuple(key_parts)
+
+    if _cached_index is None or _cached_key != key:
+        tables = [load_object_table(vid, history_dir) for vid in version_ids]
+        _cached_index = build_spatial_change_index(version_ids, tables)
+        _cached_key = key
+
+    return _cached_index
+
+
+def clear_spatial_change_index() -> None:
+    global _cached_index, _cached_key
+    _cached_index = None
+    _cached_key = None
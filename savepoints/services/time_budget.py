@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import math
+import statistics
+import time
+
+# Calibration renders: a few versions spread over the batch, rendered small and with few samples
+CALIBRATION_VERSIONS = 3
+CALIBRATION_RESOLUTION = 25
+CALIBRATION_SAMPLES = 16
+
+MIN_RESOLUTION = 10
+RESOLUTION_STEP = 5
+MIN_SAMPLES = 1
+# Cycles stops sampling at its time limit; the margin leaves room for the estimate to be off
+TIME_LIMIT_MARGIN = 1.25
+MIN_TIME_LIMIT = 1.0
+
+
+def pick_calibration_versions(version_ids: list[str], count: int = CALIBRATION_VERSIONS) -> list[str]:
+    """Up to count versions evenly spread over the batch (first and last included), so calibration sees its range."""
+    if count <= 0 or not version_ids:
+        return []
+    if len(version_ids) <= count:
+        return list(version_ids)
+    if count == 1:
+        return [version_ids[len(version_ids) // 2]]
+    step = (len(version_ids) - 1) / (count - 1)
+    return [version_ids[round(i * step)] for i in range(count)]
+
+
+def get_render_units(resolution_percentage: float, samples: int) -> float:
+    """Relative render work: pixels (as a fraction of the full resolution) times samples."""
+    return (resolution_percentage / 100.0) ** 2 * max(samples, 1)
+
+
+def fit_cost_model(observations: list[tuple[float, float]]) -> tuple[float, float] | None:
+    """
+    Fits render_time = fixed + per_unit * units to (units, render_time) observations.
+    Until the observations cover two different quality levels, everything is treated as per-unit cost.
+    Returns (fixed, per_unit), or None without observations.
+    """
+    observations = [(u, t) for u, t in observations if u > 0 and t is not None and t >= 0]
+    if not observations:
+        return None
+
+    if len({u for u, _t in observations}) >= 2:
+        mean_u = statistics.fmean(u for u, _t in observations)
+        mean_t = statistics.fmean(t for _u, t in observations)
+        variance = sum((u - mean_u) ** 2 for u, _t in observations)
+        per_unit = sum((u - mean_u) * (t - mean_t) for u, t in observations) / variance
+        fixed = mean_t - per_unit * mean_u
+        # Noise can produce a negative slope or intercept; fall back to the proportional model then
+        if per_unit > 0 and fixed >= 0:
+            return fixed, per_unit
+
+    return 0.0, statistics.median(t / u for u, t in observations)
+
+
+class TimeBudgetPlanner:
+    """
+    Picks the quality of each render so the whole batch fits a wall-clock budget.
+    Quality starts from the scene's resolution and samples and is lowered evenly in samples and pixels.
+    Every finished render (calibration renders included) refines the cost model, and every task is planned
+    against the time actually left, so the batch corrects itself when renders run slower or faster than estimated.
+    """
+
+    def __init__(self, budget_seconds: float, resolution_percentage: int, samples: int, max_workers: int = 1,
+                 started_at: float | None = None, clock=time.monotonic):
+        self.budget_seconds = budget_seconds
+        self.full_resolution = resolution_percentage
+        self.full_samples = max(samples, 1)
+        self.max_workers = max(1, max_workers)
+        self.clock = clock
+        self.started_at = clock() if started_at is None else started_at
+        # (render units, render seconds) and the wall-clock seconds spent outside the render
+        self.observations: list[tuple[float, float]] = []
+        self.overheads: list[float] = []
+
+    @property
+    def calibrated(self) -> bool:
+        return bool(self.observations)
+
+    @property
+    def remaining_seconds(self) -> float:
+        return self.budget_seconds - (self.clock() - self.started_at)
+
+    def calibration_quality(self) -> dict:
+        return {
+            "resolution_percentage": min(CALIBRATION_RESOLUTION, self.full_resolution),
+            "samples": min(CALIBRATION_SAMPLES, self.full_samples),
+        }
+
+    def add_observation(self, quality: dict | None, wall_time: float, render_time: float | None) -> None:
+        """Records a finished render made at quality (None for the scene's own settings)."""
+        if render_time is None:
+            # Without the worker's render time, the wall time is the best estimate of both
+            render_time = wall_time
+        else:
+            self.overheads.append(max(wall_time - render_time, 0.0))
+        quality = quality or {}
+        units = get_render_units(quality.get("resolution_percentage", self.full_resolution),
+                                 quality.get("samples", self.full_samples))
+        self.observations.append((units, render_time))
+
+    def plan(self, tasks_left: int) -> dict:
+        """
+        Quality for the next render, given the tasks still to start (this one included):
+        {"resolution_percentage", "samples", "time_limit"}. Before calibration, the scene's settings.
+        """
+        full = {"resolution_percentage": self.full_resolution, "samples": self.full_samples}
+        model = fit_cost_model(self.observations)
+        if model is None:
+            return full
+        fixed, per_unit = model
+
+        overhead = statistics.median(self.overheads) if self.overheads else 0.0
+        wall_per_task = self.remaining_seconds * self.max_workers / max(tasks_left, 1)
+        render_budget = wall_per_task - overhead
+        time_limit = round(max(render_budget * TIME_LIMIT_MARGIN, MIN_TIME_LIMIT), 1)
+
+        full_units = get_render_units(self.full_resolution, self.full_samples)
+        scale = (render_budget - fixed) / (per_unit * full_units) if per_unit > 0 else 1.0
+        if scale >= 1.0:
+            return {**full, "time_limit": time_limit}
+
+        scale = max(scale, 0.0)
+        # Half of the reduction in samples, half in pixels
+        samples = max(MIN_SAMPLES, math.floor(self.full_samples * math.sqrt(scale)))
+        pixel_scale = scale * self.full_samples / samples
+        resolution = math.floor(self.full_resolution * math.sqrt(pixel_scale) / RESOLUTION_STEP) * RESOLUTION_STEP
+        resolution = min(max(resolution, min(MIN_RESOLUTION, self.full_resolution)), self.full_resolution)
+        return {"resolution_percentage": resolution, "samples": samples, "time_limit": time_limit}
+
+
+def format_quality(quality: dict | None) -> str:
+    if not quality:
+        return "scene settings"
+    text = f"{quality['resolution_percentage']}%, {quality['samples']} samples"
+    if quality.get("time_limit"):
+        text += f", limit {quality['time_limit']:.0f}s"
+    return text
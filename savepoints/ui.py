@@ -5,10 +5,17 @@ import os
 import bpy
 
 from . import ui_utils
+from .operators_diff import draw_compare_buttons
+from .services.batch_report import BATCH_REPORT_TEXT_NAME, get_last_batch_summary
+from .services.ghost import get_parked_ghost_ids, is_ghost_active, is_onion_skin_active
+from .services.live_render import get_live_render_status
+from .services.perf_sweep import PERF_METRICS, format_metric, get_last_sweep
 from .services.selection import get_selected_versions
 from .services.storage import get_parent_path_from_snapshot, get_history_dir, get_free_disk_space, format_file_size
 
 LOW_DISK_SPACE_THRESHOLD = 10 * 1024 * 1024 * 1024  # 10 GB
+# Most recent versions shown in the performance sweep chart
+MAX_SWEEP_ROWS = 30
 
 
 def _draw_disk_space_alert(layout, check_dir: str | None):
@@ -93,12 +100,11 @@ class SAVEPOINTS_UL_version_list(bpy.types.UIList):
             retrieve_op = layout.operator("savepoints.retrieve_objects", text="", icon='IMPORT', emboss=False)
             retrieve_op.version_id = item.version_id
 
-            ghost_col_name = f"Ghost_Reference_{item.version_id}"
-            is_ghost_active = bool(bpy.data.collections.get(ghost_col_name))
-            ghost_icon = 'ONIONSKIN_ON' if is_ghost_active else 'ONIONSKIN_OFF'
+            ghost_active = is_ghost_active(item.version_id)
+            ghost_icon = 'ONIONSKIN_ON' if ghost_active else 'ONIONSKIN_OFF'
 
             ghost_op = layout.operator("savepoints.toggle_ghost", text="", icon=ghost_icon, emboss=False,
-                                       depress=is_ghost_active)
+                                       depress=ghost_active)
             ghost_op.version_id = item.version_id
 
             lock_icon = 'LOCKED' if item.is_protected else 'UNLOCKED'
@@ -187,6 +193,8 @@ def _draw_history_list(layout, settings):
     col = row.column(align=True)
     col.operator("savepoints.refresh", text="", icon='FILE_REFRESH')
     col.operator("savepoints.delete", text="", icon='TRASH')
+    col.separator()
+    col.operator("savepoints.bisect", text="", icon='VIEWZOOM')
 
     if settings.is_batch_mode:
         layout.separator()
@@ -196,6 +204,81 @@ def _draw_history_list(layout, settings):
         count = len(get_selected_versions(settings))
 
         row.operator("savepoints.batch_render", text=f"Batch Render Selected ({count})", icon='RENDER_STILL')
+        layout.operator("savepoints.resume_batch_render", icon='PLAY')
+        _draw_live_timelapse(layout, settings)
+        _draw_batch_summary(layout)
+        _draw_performance_sweep(layout)
+
+
+def _draw_live_timelapse(layout, settings):
+    box = layout.box()
+    row = box.row()
+    row.prop(settings, "batch_live_render")
+    if not settings.batch_live_render:
+        return
+    row.operator("savepoints.export_live_timelapse", text="", icon='FILE_MOVIE')
+
+    status = get_live_render_status()
+    if status:
+        col = box.column(align=True)
+        col.scale_y = 0.8
+        col.label(text=f"Rendered: {status['rendered']}, Waiting: {status['pending']}")
+        if status['running']:
+            col.label(text=f"Rendering {status['running']} (low priority)", icon='RENDER_STILL')
+        elif status['pending']:
+            col.label(text="Starts when you pause editing", icon='TIME')
+
+
+def _draw_batch_summary(layout):
+    summary = get_last_batch_summary()
+    if not summary:
+        return
+
+    box = layout.box()
+    box.label(text="Last Batch", icon='INFO')
+    col = box.column(align=True)
+    col.scale_y = 0.8
+    col.label(text=f"Rendered: {summary['rendered']} ({summary['failed']} failed), "
+                   f"Not rendered: {summary['not_rendered']}")
+    if summary.get('batch_wall_time') is not None:
+        col.label(text=f"Elapsed: {summary['batch_wall_time']:.1f}s with {summary['max_workers']} workers")
+    if summary['rendered']:
+        col.label(text=f"Median: {summary['median_wall_time']:.1f}s, "
+                       f"Slowest: {summary['slowest_version']} ({summary['slowest_wall_time']:.1f}s)")
+        if summary.get('total_overhead') is not None:
+            col.label(text=f"Start-up/Load Overhead: {summary['total_overhead']:.1f}s")
+        if summary.get('max_peak_rss_mb'):
+            col.label(text=f"Peak Memory: {summary['max_peak_rss_mb']:.0f} MB")
+    for outlier in summary['outliers'][:3]:
+        col.label(text=f"{outlier['version_id']}: {outlier['factor']}x median", icon='ERROR')
+    col.label(text=f"Details: Text Editor '{BATCH_REPORT_TEXT_NAME}'")
+
+
+def _draw_performance_sweep(layout):
+    sweep = get_last_sweep()
+    if not sweep or not sweep.points:
+        return
+
+    worst = sweep.worst_jump
+    box = layout.box()
+    box.label(text="Performance Sweep", icon='SORTTIME')
+    if worst:
+        unit = next(u for key, _label, u in PERF_METRICS if key == worst.metric)
+        box.label(text=f"Jump at {worst.version_id}: {worst.metric} {format_metric(worst.before, unit)} -> "
+                       f"{format_metric(worst.after, unit)}", icon='ERROR')
+
+    jump_versions = {j.version_id for j in sweep.jumps}
+    peak = sweep.peak('render_time')
+    col = box.column(align=True)
+    col.scale_y = 0.8
+    for point in sweep.points[-MAX_SWEEP_ROWS:]:
+        row = col.row(align=True)
+        row.alert = point['version_id'] in jump_versions
+        row.label(text=point['version_id'])
+        value = point.get('render_time')
+        row.progress(factor=value / peak if value and peak else 0.0, text=format_metric(value, "s"))
+        # Memory, triangles and textures next to the bar
+        row.label(text=", ".join(format_metric(point.get(key), unit) for key, _label, unit in PERF_METRICS[1:]))
 
 
 def _draw_version_details(layout, settings, context):
@@ -225,6 +308,7 @@ def _draw_version_details(layout, settings, context):
         box.label(text=f"Date: {item.timestamp}")
         box.label(text=f"Note: {item.note}")
         box.label(text=f"Objects: {item.object_count} | Size: {item.file_size_display}")
+        draw_compare_buttons(box, settings, item.version_id)
 
         layout.operator("savepoints.checkout", text="Checkout (Restore)", icon='RECOVER_LAST')
 
@@ -249,6 +333,33 @@ def _draw_general_settings(layout, settings):
     box.prop(settings, "show_save_dialog")
     box.prop(settings, "show_preview")
     box.prop(settings, "use_compression")
+    box.prop(settings, "use_metadata_prefetch")
+
+
+def _draw_ghost_settings(layout, settings):
+    box = layout.box()
+    box.label(text="Ghost Reference", icon='ONIONSKIN_ON')
+    box.prop(settings, "ghost_mode")
+    box.prop(settings, "store_ghost_proxies")
+    if settings.store_ghost_proxies:
+        box.prop(settings, "ghost_proxy_edge_budget")
+    if settings.ghost_mode == 'PROXY':
+        box.prop(settings, "ghost_proxy_detail")
+    box.prop(settings, "ghost_filter")
+    if settings.ghost_filter == 'COLLECTION':
+        box.prop_search(settings, "ghost_filter_collection", bpy.data, "collections", text="Collection")
+    box.prop(settings, "ghost_cache_size")
+    if settings.ghost_cache_size > 0:
+        box.prop(settings, "ghost_cache_max_vertices", text="Vertex Budget")
+        cached = len(get_parked_ghost_ids())
+        box.operator("savepoints.clear_ghost_cache", text=f"Clear Ghost Cache ({cached})", icon='TRASH')
+
+    box.separator()
+    box.prop(settings, "store_mesh_fingerprints")
+    box.prop(settings, "onion_skin_count")
+    box.prop(settings, "onion_skin_tag")
+    box.prop(settings, "onion_skin_max_vertices", text="Onion Skin Vertex Budget")
+    box.operator("savepoints.toggle_onion_skin", icon='ONIONSKIN_ON', depress=is_onion_skin_active())
 
 
 def _draw_auto_save_settings(layout, settings):
@@ -302,6 +413,9 @@ class SAVEPOINTS_PT_main(bpy.types.Panel):
         layout.separator()
         _draw_general_settings(layout, settings)
 
+        layout.separator()
+        _draw_ghost_settings(layout, settings)
+
         layout.separator()
         _draw_auto_save_settings(layout, settings)
 
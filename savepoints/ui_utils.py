@@ -88,6 +88,17 @@ def sync_history_to_props(context: bpy.types.Context) -> None:
         settings.active_version_index = new_active_index
 
 
+def set_active_version(settings, version_id: str) -> bool:
+    """
+    Select version_id in the history list. Returns False if it is not listed.
+    """
+    for i, v in enumerate(settings.versions):
+        if v.version_id == version_id:
+            settings.active_version_index = i
+            return True
+    return False
+
+
 def force_redraw_areas(context: bpy.types.Context, area_types: set[str] | None = None) -> None:
     """
     Force redraw of specific area types to update UI/HUD.
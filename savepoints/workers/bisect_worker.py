@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Runs a user check script against the snapshot opened by this Blender process.
+# The script runs with `bpy` available and must set a variable named `result`:
+# truthy when the condition being searched for holds in this version.
+#
+# Exit codes (mirrored in services/bisect.py):
+#   10 - condition does not hold, 11 - condition holds, 2 - the check itself failed
+# Blender exits with 0 or 1 on its own, so neither may stand for a verdict.
+
+import runpy
+import sys
+import traceback
+
+EXIT_CONDITION_FALSE = 10
+EXIT_CONDITION_TRUE = 11
+EXIT_ERROR = 2
+
+
+def run_check(script_path):
+    namespace = runpy.run_path(script_path, run_name="__savepoints_bisect__")
+    if "result" not in namespace:
+        print("Bisect Worker Error: the check script did not set `result`.")
+        return EXIT_ERROR
+
+    result = bool(namespace["result"])
+    print(f"Bisect Result: {result}")
+    return EXIT_CONDITION_TRUE if result else EXIT_CONDITION_FALSE
+
+
+if __name__ == "__main__":
+    exit_code = EXIT_ERROR
+    try:
+        argv = sys.argv
+        if "--" in argv:
+            args = argv[argv.index("--") + 1:]
+            if args:
+                exit_code = run_check(args[0])
+            else:
+                print("Worker Error: Missing arguments.")
+        else:
+            print("Worker Error: No arguments separator '--' found.")
+    except SystemExit as e:
+        # A script calling sys.exit() is treated as a failed check, not a verdict
+        print(f"Bisect Worker Error: the check script exited ({e.code}).")
+    except Exception:
+        print("Bisect Worker Global Error:")
+        traceback.print_exc()
+    sys.exit(exit_code)
@@ -0,0 +1,33 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Probes the Cycles compute devices once for a whole batch:
+#   blender -b --factory-startup -P gpu_probe_worker.py -- <output.json>
+# Writes the result of gpu_utils.probe_devices() to output.json; render workers apply it
+# with gpu_utils.apply_devices() instead of probing every backend themselves.
+
+import json
+import os
+import sys
+
+# Add current directory to sys.path to allow importing sibling modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import gpu_utils  # noqa: E402
+
+if __name__ == "__main__":
+    try:
+        argv = sys.argv
+        if "--" not in argv or len(argv) <= argv.index("--") + 1:
+            print("Worker Error: Missing arguments.")
+            sys.exit(1)
+
+        output_path = argv[argv.index("--") + 1]
+        result = gpu_utils.probe_devices()
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        print(f"GPU Probe: {result}")
+    except Exception as e:
+        print(f"Worker Global Error: {e}")
+        sys.exit(1)
@@ -1,24 +1,35 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import os
+
 import addon_utils
 import bpy
 
+DEVICE_TYPES = ['METAL', 'OPTIX', 'CUDA', 'HIP', 'ONEAPI']
+# Set by the batch executor for each concurrent worker (mirrored in services/gpu_probe.py)
+WORKER_SLOT_ENV = "SAVEPOINTS_WORKER_SLOT"
+
+
+def _get_cycles_preferences():
+    preferences = bpy.context.preferences
+    if "cycles" not in preferences.addons:
+        print("Worker: Cycles addon not loaded. Attempting to enable...")
+        addon_utils.enable("cycles", default_set=False)
+    cycles_addon = preferences.addons.get('cycles')
+    if not cycles_addon:
+        print("Worker: Cycles addon not found in preferences (Factory Startup?). Skipping GPU.")
+        return None
+    return cycles_addon.preferences
+
 
 def enable_gpu():
+    """Probes every backend and enables all devices of the first one that has any."""
     try:
-        preferences = bpy.context.preferences
-        if "cycles" not in preferences.addons:
-            print("Worker: Cycles addon not loaded. Attempting to enable...")
-            addon_utils.enable("cycles", default_set=False)
-        cycles_addon = preferences.addons.get('cycles')
-        if not cycles_addon:
-            print("Worker: Cycles addon not found in preferences (Factory Startup?). Skipping GPU.")
+        cycles_prefs = _get_cycles_preferences()
+        if not cycles_prefs:
             return False
 
-        cycles_prefs = cycles_addon.preferences
-        device_types = ['METAL', 'OPTIX', 'CUDA', 'HIP', 'ONEAPI']
-
-        for dtype in device_types:
+        for dtype in DEVICE_TYPES:
             try:
                 cycles_prefs.compute_device_type = dtype
                 cycles_prefs.get_devices()
@@ -37,3 +48,76 @@ def enable_gpu():
     except Exception as e:
         print(f"Worker: GPU setup warning: {e}")
         return False
+
+
+def probe_devices():
+    """
+    The first backend with a GPU device and its GPU devices:
+    {"device_type": "OPTIX", "devices": [{"id", "name"}]}, or device_type "NONE" for CPU rendering.
+    """
+    result = {"device_type": "NONE", "devices": []}
+    try:
+        cycles_prefs = _get_cycles_preferences()
+        if not cycles_prefs:
+            return result
+
+        for dtype in DEVICE_TYPES:
+            try:
+                cycles_prefs.compute_device_type = dtype
+                devices = [d for d in cycles_prefs.get_devices_for_type(dtype) if d.type != 'CPU']
+            except Exception:
+                continue
+            if devices:
+                return {"device_type": dtype, "devices": [{"id": d.id, "name": d.name} for d in devices]}
+    except Exception as e:
+        print(f"Worker: GPU probe warning: {e}")
+    return result
+
+
+def apply_devices(gpu, slot=0):
+    """
+    Enables the devices a probe found, without probing other backends. With several partitions
+    (one per concurrent worker), only the devices of this worker's slot are used.
+    """
+    device_type = gpu.get("device_type")
+    if not device_type or device_type == 'NONE':
+        print("Worker: No GPU found by the batch probe. Using CPU.")
+        return False
+
+    try:
+        cycles_prefs = _get_cycles_preferences()
+        if not cycles_prefs:
+            return False
+
+        partitions = gpu.get("partitions") or [[d["id"] for d in gpu.get("devices", [])]]
+        selected = set(partitions[slot % len(partitions)])
+        # The CPU joins in only when this worker has the whole machine to itself
+        use_cpu = len(partitions) == 1
+
+        cycles_prefs.compute_device_type = device_type
+        active_devices = []
+        for device in cycles_prefs.get_devices_for_type(device_type):
+            device.use = device.id in selected or (use_cpu and device.type == 'CPU')
+            if device.use:
+                active_devices.append(device.name)
+
+        print(f"Worker: Activated GPU ({device_type}, slot {slot}): {active_devices}")
+        return bool(active_devices)
+    except Exception as e:
+        print(f"Worker: GPU setup warning: {e}")
+        return False
+
+
+def get_worker_slot():
+    try:
+        return int(os.environ.get(WORKER_SLOT_ENV, "0"))
+    except ValueError:
+        return 0
+
+
+def setup_devices(settings):
+    """Applies the batch's GPU probe result, or probes here when the config has none."""
+    gpu = settings.get("gpu")
+    if gpu is None:
+        return enable_gpu()
+    return apply_devices(gpu, get_worker_slot())
@@ -85,20 +85,46 @@ def apply_render_settings(scene, render, settings):
     except Exception as e:
         print(f"Worker Warning: Failed to set render engine: {e}")
 
-    if render.engine == 'CYCLES' and "samples" in settings:
+    if "samples" in settings:
+        apply_samples(scene, render, settings["samples"])
+
+
+def apply_samples(scene, render, samples):
+    if render.engine == 'CYCLES':
         try:
-            scene.cycles.samples = settings["samples"]
+            scene.cycles.samples = samples
         except Exception as e:
             print(f"Worker Warning: Failed to set Cycles samples: {e}")
 
-    elif render.engine in ['BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT'] and "samples" in settings:
+    elif render.engine in ['BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT']:
         try:
             if hasattr(scene.eevee, "taa_render_samples"):
-                scene.eevee.taa_render_samples = settings["samples"]
+                scene.eevee.taa_render_samples = samples
         except Exception as e:
             print(f"Worker Warning: Failed to set Eevee samples: {e}")
 
 
+def apply_quality_overrides(scene, render, overrides):
+    """
+    Per-task quality chosen by a time-budgeted batch, applied on top of the batch settings.
+    time_limit caps Cycles path tracing (in seconds); other engines ignore it.
+    """
+    if not overrides:
+        return
+
+    if "resolution_percentage" in overrides:
+        render.resolution_percentage = overrides["resolution_percentage"]
+
+    if "samples" in overrides:
+        apply_samples(scene, render, overrides["samples"])
+
+    if render.engine == 'CYCLES' and overrides.get("time_limit"):
+        try:
+            scene.cycles.time_limit = overrides["time_limit"]
+        except Exception as e:
+            print(f"Worker Warning: Failed to set Cycles time limit: {e}")
+
+
 def apply_ffmpeg_settings(render, settings):
     """
     Applies FFMPEG settings.
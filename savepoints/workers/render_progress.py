@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Turns the status lines Blender passes to render_stats handlers into progress events.
+# Pure Python so the parsing can be tested without Blender.
+
+import re
+import time
+
+# Cycles: "... | Sample 12/64"; EEVEE: "Rendering 12 / 64 samples"; tiled Cycles: "Rendered 3/16 Tiles"
+_SAMPLE_PATTERNS = (
+    re.compile(r"Sample (\d+)\s*/\s*(\d+)"),
+    re.compile(r"Rendering (\d+)\s*/\s*(\d+) samples"),
+)
+_TILE_PATTERN = re.compile(r"Rendered (\d+)\s*/\s*(\d+) Tiles")
+# Leading "Fra:1 | Mem:... | Time:..." fields carry no phase information
+_STAT_FIELD = re.compile(r"^(Fra|Mem|Time|Remaining|Peak|Frame)\b")
+
+MIN_INTERVAL = 0.25
+
+
+def parse_render_stats(stats: str) -> dict:
+    """
+    Extracts {"phase", "samples_done", "samples_total", "tiles_done", "tiles_total", "percent"}
+    from a render_stats line; keys without information are omitted.
+    """
+    result = {}
+    fields = [f.strip() for f in stats.split("|") if f.strip()]
+    phases = [f for f in fields if not _STAT_FIELD.match(f)]
+    # "Scene, ViewLayer" comes first; what follows the phase is the object or image being processed
+    if phases and ", " in phases[0]:
+        phases = phases[1:]
+    if phases:
+        result["phase"] = phases[0]
+
+    for pattern in _SAMPLE_PATTERNS:
+        match = pattern.search(stats)
+        if match:
+            result["phase"] = "Rendering"
+            result["samples_done"], result["samples_total"] = int(match.group(1)), int(match.group(2))
+            break
+
+    match = _TILE_PATTERN.search(stats)
+    if match:
+        result["tiles_done"], result["tiles_total"] = int(match.group(1)), int(match.group(2))
+
+    # With tiles, samples restart per tile, so tiles give the overall fraction
+    if result.get("tiles_total"):
+        tile_fraction = result["tiles_done"] / result["tiles_total"]
+        if result.get("samples_total"):
+            tile_fraction += result["samples_done"] / result["samples_total"] / result["tiles_total"]
+        result["percent"] = min(100.0, 100.0 * tile_fraction)
+    elif result.get("samples_total"):
+        result["percent"] = min(100.0, 100.0 * result["samples_done"] / result["samples_total"])
+
+    return result
+
+
+class ProgressThrottle:
+    """Lets a progress event through when the phase or whole percent changes, at most every MIN_INTERVAL."""
+
+    def __init__(self, min_interval=MIN_INTERVAL, clock=time.monotonic):
+        self.min_interval = min_interval
+        self.clock = clock
+        self._last_time = None
+        self._last_key = None
+
+    def should_send(self, progress: dict) -> bool:
+        key = (progress.get("phase"), int(progress.get("percent", -1)))
+        if key == self._last_key:
+            return False
+        now = self.clock()
+        if self._last_time is not None and now - self._last_time < self.min_interval:
+            return False
+        self._last_time = now
+        self._last_key = key
+        return True
@@ -1,8 +1,21 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Renders snapshots for batch rendering. Two modes:
+#   blender -b <snapshot> -P render_worker.py -- <config.json> <output_dir> <file_prefix> [overrides.json]
+#       renders the opened snapshot once and exits (non-zero on failure). overrides is a JSON object
+#       of per-task quality (resolution_percentage, samples, time_limit), see render_config.apply_quality_overrides.
+#   blender -b -P render_worker.py -- --serve <config.json> [max_jobs] [memory_limit_mb]
+#       stays alive and renders one snapshot per job read from stdin (see worker_protocol.py),
+#       paying Blender startup and GPU setup once. Exits after max_jobs jobs or once its peak
+#       memory exceeds memory_limit_mb (0 disables either limit), so the add-on can recycle it.
+# Both modes report render progress on stdout as protocol messages (see render_progress.py).
+# With "views" in the config, every view is rendered from the one loaded snapshot into
+# <output_dir>/<view name>/<file_prefix>, giving one image sequence per view.
 
 import json
 import os
 import sys
+import time
 
 import bpy
 
@@ -13,45 +26,144 @@ if current_dir not in sys.path:
 
 import gpu_utils  # noqa: E402
 import render_config  # noqa: E402
+import render_progress  # noqa: E402
 import scene_utils  # noqa: E402
+import worker_protocol  # noqa: E402
 
 
-def run_render(json_path, output_dir, file_prefix):
-    # 1. Load Settings
+def load_settings(json_path):
     with open(json_path, 'r') as f:
-        settings = json.load(f)
+        return json.load(f)
 
+
+def render_current_file(settings, output_dir, file_prefix, setup_gpu=True, overrides=None):
+    """
+    Applies the batch settings to the open file and renders it. Raises on render failure.
+    Returns the seconds spent in the render itself.
+    """
     scene = bpy.context.scene
     render = scene.render
 
-    # 2. Apply Settings
+    # 1. Apply Settings
     render_config.apply_image_settings(render, settings)
 
-    # 3. Setup GPU
-    if settings.get("engine") == 'CYCLES':
-        gpu_utils.enable_gpu()
+    # 2. Setup GPU
+    if setup_gpu and settings.get("engine") == 'CYCLES':
+        gpu_utils.setup_devices(settings)
 
-    # 4. Apply Render Config
+    # 3. Apply Render Config
     render_config.apply_render_settings(scene, render, settings)
+    render_config.apply_quality_overrides(scene, render, overrides)
 
-    render.filepath = os.path.join(output_dir, file_prefix)
-
-    # 5. Apply Scene Context (World & ViewLayer)
+    # 4. Apply Scene Context (World & ViewLayer)
     scene_utils.setup_world(scene, settings)
     scene_utils.setup_view_layer(scene, settings)
 
-    # 6. Camera & Execution
+    # 5. Camera & Execution
     scene.frame_current = settings.get("frame_current", 1)
-    scene_utils.setup_camera(scene, settings)
     scene_utils.setup_view_settings(scene, settings)
 
-    print(f"Rendering frame {scene.frame_current} to {render.filepath}...")
+    views = settings.get("views")
+    if not views:
+        scene_utils.setup_camera(scene, settings)
+        return _render_still(output_dir, file_prefix)
+
+    render_time = 0.0
+    for index, view in enumerate(views):
+        # A view carries its own camera_matrix_world and camera_data
+        scene_utils.setup_camera(scene, view)
+        view_dir = os.path.join(output_dir, view["name"])
+        os.makedirs(view_dir, exist_ok=True)
+        render_time += _render_still(view_dir, file_prefix, index, len(views))
+    return render_time
+
+
+def _render_still(output_dir, file_prefix, view_index=0, view_count=1):
+    render = bpy.context.scene.render
+    render.filepath = os.path.join(output_dir, file_prefix)
+    print(f"Rendering frame {bpy.context.scene.frame_current} to {render.filepath}...")
+    handler = _make_progress_handler(view_index, view_count)
+    bpy.app.handlers.render_stats.append(handler)
+    start = time.monotonic()
     try:
         bpy.ops.render.render(write_still=True)
-        print("Render Finished Successfully.")
+    finally:
+        bpy.app.handlers.render_stats.remove(handler)
+    print("Render Finished Successfully.")
+    return time.monotonic() - start
+
+
+def _get_scene_stats(settings):
+    if not settings.get("collect_scene_stats"):
+        return None
+    try:
+        return scene_utils.get_scene_cost_stats()
+    except Exception as e:
+        print(f"Worker Warning: Failed to collect scene stats: {e}")
+        return None
+
+
+def _make_progress_handler(view_index=0, view_count=1):
+    throttle = render_progress.ProgressThrottle()
+
+    def on_render_stats(stats, *_args):
+        progress = render_progress.parse_render_stats(stats)
+        # Progress of the whole version: every view is an equal share
+        if "percent" in progress:
+            progress["percent"] = (view_index * 100.0 + progress["percent"]) / view_count
+        if progress and throttle.should_send(progress):
+            worker_protocol.send_message("progress", peak_mb=worker_protocol.get_peak_rss_mb(), **progress)
+
+    return on_render_stats
+
+
+def run_render(json_path, output_dir, file_prefix, overrides_json=None):
+    settings = load_settings(json_path)
+    try:
+        overrides = json.loads(overrides_json) if overrides_json else None
+        render_time = render_current_file(settings, output_dir, file_prefix, overrides=overrides)
     except Exception as e:
         print(f"Render Failed: {e}")
         sys.exit(1)
+    # CPU time and peak memory of this process are measured by the add-on when it reaps it
+    worker_protocol.send_message("result", ok=True, render_time=render_time, scene_stats=_get_scene_stats(settings))
+
+
+def serve(json_path, max_jobs=0, memory_limit_mb=0):
+    settings = load_settings(json_path)
+    # Preferences survive open_mainfile, so devices are set up once for every job
+    if settings.get("engine") == 'CYCLES':
+        gpu_utils.setup_devices(settings)
+
+    worker_protocol.send_message("ready", pid=os.getpid())
+
+    jobs_done = 0
+    for job in worker_protocol.read_jobs():
+        version_id = job.get("version_id")
+        start = time.monotonic()
+        cpu_start = time.process_time()
+        worker_protocol.send_message("progress", phase="Loading", percent=0.0)
+        try:
+            bpy.ops.wm.open_mainfile(filepath=job["snapshot_path"], load_ui=False)
+            render_time = render_current_file(settings, job["output_dir"], job["file_prefix"], setup_gpu=False,
+                                              overrides=job.get("overrides"))
+            result = {"ok": True, "render_time": render_time, "scene_stats": _get_scene_stats(settings)}
+        except Exception as e:
+            print(f"Render Failed: {e}")
+            result = {"ok": False, "error": str(e)}
+
+        # Peak memory is that of the whole process so far, not of this job alone
+        peak_mb = worker_protocol.get_peak_rss_mb()
+        worker_protocol.send_message("result", version_id=version_id, duration=time.monotonic() - start,
+                                     cpu_time=time.process_time() - cpu_start, peak_mb=peak_mb, **result)
+
+        jobs_done += 1
+        if max_jobs and jobs_done >= max_jobs:
+            worker_protocol.send_message("recycle", reason="max_jobs", jobs=jobs_done)
+            return
+        if memory_limit_mb and peak_mb and peak_mb > memory_limit_mb:
+            worker_protocol.send_message("recycle", reason="memory", jobs=jobs_done, peak_mb=peak_mb)
+            return
 
 
 if __name__ == "__main__":
@@ -59,8 +171,14 @@ if __name__ == "__main__":
         argv = sys.argv
         if "--" in argv:
             args = argv[argv.index("--") + 1:]
-            if len(args) >= 3:
-                run_render(args[0], args[1], args[2])
+            if args and args[0] == "--serve" and len(args) >= 2:
+                serve(
+                    args[1],
+                    int(args[2]) if len(args) > 2 else 0,
+                    int(args[3]) if len(args) > 3 else 0,
+                )
+            elif len(args) >= 3:
+                run_render(args[0], args[1], args[2], args[3] if len(args) > 3 else None)
             else:
                 print("Worker Error: Missing arguments.")
                 sys.exit(1)
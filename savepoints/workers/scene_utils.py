@@ -8,21 +8,30 @@ from mathutils import Matrix
 
 def setup_world(scene, settings):
     world_name = settings.get("world_name")
-    main_blend_path = settings.get("main_blend_path")
 
     if world_name:
-        if world_name not in bpy.data.worlds and main_blend_path and os.path.exists(main_blend_path):
-            try:
-                with bpy.data.libraries.load(main_blend_path, link=False) as (data_from, data_to):
-                    if world_name in data_from.worlds:
-                        data_to.worlds = [world_name]
-            except Exception as e:
-                print(f"Worker Warning: Failed to append world: {e}")
+        if world_name not in bpy.data.worlds:
+            # The world library holds just the world; the main file is the fallback for older configs
+            for library_path in (settings.get("world_blend_path"), settings.get("main_blend_path")):
+                if library_path and os.path.exists(library_path) and _append_world(library_path, world_name):
+                    break
 
         if world_name in bpy.data.worlds:
             scene.world = bpy.data.worlds[world_name]
 
 
+def _append_world(library_path, world_name):
+    try:
+        with bpy.data.libraries.load(library_path, link=False) as (data_from, data_to):
+            if world_name not in data_from.worlds:
+                return False
+            data_to.worlds = [world_name]
+    except Exception as e:
+        print(f"Worker Warning: Failed to append world from {library_path}: {e}")
+        return False
+    return True
+
+
 def setup_view_layer(scene, settings):
     target_layer_name = settings.get("active_view_layer", "View Layer")
     current_layer = bpy.context.view_layer
@@ -65,6 +74,34 @@ def setup_camera(scene, settings):
                 print(f"Worker Warning: Failed to apply camera lens settings: {e}")
 
 
+def get_scene_cost_stats():
+    """
+    Render cost indicators of the open file for performance sweeps: evaluated triangles (instances
+    counted once per instance) and the memory of the loaded images in MB.
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    triangles = 0
+    mesh_triangles = {}
+    for instance in depsgraph.object_instances:
+        obj = instance.object
+        if obj.type != 'MESH' or obj.data is None:
+            continue
+        key = obj.data.name_full
+        if key not in mesh_triangles:
+            mesh_triangles[key] = len(obj.data.loop_triangles)
+        triangles += mesh_triangles[key]
+
+    texture_bytes = 0
+    for image in bpy.data.images:
+        if image.users == 0 or not image.has_data:
+            continue
+        width, height = image.size
+        bytes_per_channel = 4 if image.is_float else 1
+        texture_bytes += width * height * image.channels * bytes_per_channel
+
+    return {"triangles": triangles, "texture_mb": texture_bytes / (1024 * 1024)}
+
+
 def setup_view_settings(scene, settings):
     vs_data = settings.get("view_settings")
     if vs_data:
@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Line protocol between a persistent render worker and the add-on (mirrored in services/batch_executor.py).
+# Jobs arrive on stdin as one JSON object per line. Results go to stdout as JSON lines starting with
+# MESSAGE_PREFIX, so they can be told apart from Blender's own output on the same stream.
+
+import json
+import sys
+
+MESSAGE_PREFIX = "@@SAVEPOINTS@@ "
+
+
+def send_message(event, **data):
+    sys.stdout.write(MESSAGE_PREFIX + json.dumps({"event": event, **data}) + "\n")
+    sys.stdout.flush()
+
+
+def read_jobs(stream=None):
+    """Yields job dicts from stdin until it is closed. Malformed lines are reported and skipped."""
+    for line in stream or sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            send_message("error", message=f"Malformed job: {line[:200]}")
+
+
+def get_peak_rss_mb():
+    """Peak resident memory of this process in MB, or None where the resource module is unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
@@ -48,9 +48,12 @@ class SavePointsTestCase(unittest.TestCase):
 
     def tearDown(self):
         # 0. Clear LRU Cache to prevent cross-test contamination
-        # (e.g. load_object_data caches results by version_id)
-        from savepoints.services.object_data import load_object_data
-        load_object_data.cache_clear()
+        # (e.g. load_object_data caches parsed metadata files)
+        from savepoints.services.object_data import clear_object_data_cache
+        from savepoints.services.ghost import clear_parked_ghost_registry, clear_single_ghost_registry
+        clear_object_data_cache()
+        clear_parked_ghost_registry()
+        clear_single_ghost_registry()
 
         # 1. Unregister the addon
         try:
@@ -8,6 +8,7 @@ import unittest
 from pathlib import Path
 
 import bpy
+from mathutils import Vector
 
 # Add project root to path
 CURRENT_DIR = Path(__file__).resolve().parent
@@ -18,8 +19,9 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
 
 from savepoints_test_case import SavePointsTestCase
-from savepoints.services.batch_render import extract_render_settings
-from savepoints.services.post_process import create_vse_timelapse, FRAMES_PER_IMAGE
+from savepoints.services.batch_render import extract_render_settings, extract_view_settings
+from savepoints.services.batch_order import layout_timelapse
+from savepoints.services.post_process import create_vse_timelapse, update_vse_timelapse, FRAMES_PER_IMAGE
 
 
 class TestBatchRenderExtras(SavePointsTestCase):
@@ -69,6 +71,50 @@ class TestBatchRenderExtras(SavePointsTestCase):
 
         print("Settings Extraction Test: Completed")
 
+    def test_view_settings_extraction(self):
+        """
+        Scenario:
+        Extract the views of a multi-view batch: every camera of a collection, then a turntable
+        of the scene camera around a pivot.
+        """
+        print("\nStarting View Settings Extraction Test...")
+        scene = bpy.context.scene
+
+        with self.subTest(step="1. Camera Collection"):
+            collection = bpy.data.collections.new("Views")
+            scene.collection.children.link(collection)
+            for name, x in (("Side", 5.0), ("Front", 0.0)):
+                cam = bpy.data.objects.new(name, bpy.data.cameras.new(name))
+                cam.location = (x, -10.0, 0.0)
+                collection.objects.link(cam)
+            collection.objects.link(bpy.data.objects.new("NotACamera", None))
+            bpy.context.view_layer.update()
+
+            views = extract_view_settings(bpy.context, 'COLLECTION', collection=collection)
+
+            self.assertEqual([v["name"] for v in views], ["Front", "Side"])
+            self.assertAlmostEqual(views[1]["camera_matrix_world"][0][3], 5.0)
+            self.assertIn("lens", views[0]["camera_data"])
+
+        with self.subTest(step="2. Turntable"):
+            cam = bpy.data.objects.new("TurntableCam", bpy.data.cameras.new("TurntableCam"))
+            cam.location = (0.0, -10.0, 2.0)
+            scene.collection.objects.link(cam)
+            scene.camera = cam
+            bpy.context.view_layer.update()
+
+            views = extract_view_settings(bpy.context, 'TURNTABLE', steps=4, pivot=Vector((0.0, 0.0, 0.0)))
+
+            self.assertEqual([v["name"] for v in views],
+                             ["turntable_000", "turntable_090", "turntable_180", "turntable_270"])
+            # A quarter turn around Z moves the camera from -Y to +X, keeping its height
+            quarter = views[1]["camera_matrix_world"]
+            self.assertAlmostEqual(quarter[0][3], 10.0, places=4)
+            self.assertAlmostEqual(quarter[1][3], 0.0, places=4)
+            self.assertAlmostEqual(quarter[2][3], 2.0, places=4)
+
+        print("View Settings Extraction Test: Completed")
+
     def test_vse_timelapse_creation(self):
         """
         Scenario:
@@ -141,6 +187,64 @@ class TestBatchRenderExtras(SavePointsTestCase):
 
         print("VSE Timelapse Test: Completed")
 
+    def test_progressive_timelapse_update(self):
+        """
+        Scenario:
+        1. Lay out 2 of 4 rendered images with gaps held, as during a progressive batch.
+        2. Add a third image: existing strips stay, the one before it is shortened.
+        3. Final update packs the images without gaps in the same scene.
+        """
+        print("\nStarting Progressive Timelapse Test...")
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            with self.subTest(step="1. Create Dummy Files"):
+                dummy_img = bpy.data.images.new("TempDummy", width=4, height=4, alpha=True)
+                original_format = bpy.context.scene.render.image_settings.file_format
+                bpy.context.scene.render.image_settings.file_format = 'PNG'
+                paths = {}
+                for vid in ("v001", "v002", "v003", "v004"):
+                    paths[vid] = os.path.join(temp_dir, f"{vid}_render.png")
+                    dummy_img.filepath_raw = paths[vid]
+                    dummy_img.save()
+                bpy.data.images.remove(dummy_img)
+                bpy.context.scene.render.image_settings.file_format = original_format
+
+            slots = ["v001", "v002", "v003", "v004"]
+            rendered = {"v001": paths["v001"], "v004": paths["v004"]}
+
+            def strips_of(name):
+                editor = bpy.data.scenes[name].sequence_editor
+                strips = editor.strips if hasattr(editor, 'strips') else editor.sequences
+                return {s.name: (s.frame_final_start, s.frame_final_duration) for s in strips}
+
+            with self.subTest(step="2. Partial Layout"):
+                scene_name = update_vse_timelapse("Progressive_TestTL",
+                                                  layout_timelapse(slots, rendered, FRAMES_PER_IMAGE))
+                self.assertIsNotNone(scene_name)
+                self.assertEqual(strips_of(scene_name), {
+                    "Timelapse_v001": (1, 3 * FRAMES_PER_IMAGE),
+                    "Timelapse_v004": (1 + 3 * FRAMES_PER_IMAGE, FRAMES_PER_IMAGE),
+                })
+
+            with self.subTest(step="3. Incremental Update"):
+                rendered["v002"] = paths["v002"]
+                self.assertEqual(update_vse_timelapse(scene_name, layout_timelapse(slots, rendered, FRAMES_PER_IMAGE)),
+                                 scene_name)
+                strips = strips_of(scene_name)
+                self.assertEqual(strips["Timelapse_v001"], (1, FRAMES_PER_IMAGE))
+                self.assertEqual(strips["Timelapse_v002"], (1 + FRAMES_PER_IMAGE, 2 * FRAMES_PER_IMAGE))
+
+            with self.subTest(step="4. Final Layout"):
+                update_vse_timelapse(scene_name, layout_timelapse(slots, rendered, FRAMES_PER_IMAGE, hold_gaps=False))
+                strips = strips_of(scene_name)
+                self.assertEqual(strips["Timelapse_v004"], (1 + 2 * FRAMES_PER_IMAGE, FRAMES_PER_IMAGE))
+                self.assertEqual(bpy.data.scenes[scene_name].frame_end, 3 * FRAMES_PER_IMAGE)
+        finally:
+            shutil.rmtree(temp_dir)
+
+        print("Progressive Timelapse Test: Completed")
+
     def test_partial_failure_resilience(self):
         """
         Scenario:
@@ -0,0 +1,90 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import bpy
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parents[1]
+if str(CURRENT_DIR) not in sys.path:
+    sys.path.append(str(CURRENT_DIR))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from savepoints_test_case import SavePointsTestCase
+
+from savepoints.services.batch_executor import BatchRenderExecutor
+from savepoints.services.batch_render import extract_render_settings, get_worker_script_path, \
+    get_batch_render_output_dir
+
+
+class TestBatchRenderPersistent(SavePointsTestCase):
+    def test_persistent_worker_scenario(self):
+        """
+        Scenario:
+        1. Create 3 versions of a tiny scene.
+        2. Render them with one persistent worker recycled after 2 jobs.
+        3. Every version is rendered and two worker processes were used.
+        """
+        scene = bpy.context.scene
+        scene.render.resolution_x = 32
+        scene.render.resolution_y = 32
+        scene.render.image_settings.file_format = 'PNG'
+        scene.render.engine = 'CYCLES'
+        scene.cycles.device = 'CPU'
+        scene.cycles.samples = 1
+
+        bpy.ops.object.camera_add(location=(0, -10, 5), rotation=(1.1, 0, 0))
+        scene.camera = bpy.context.active_object
+
+        for i in range(3):
+            bpy.ops.mesh.primitive_cube_add(location=(i * 2, 0, 0))
+            bpy.ops.savepoints.commit('EXEC_DEFAULT', note=f"Step {i}")
+        bpy.ops.wm.save_mainfile()
+
+        output_dir = get_batch_render_output_dir()
+        os.makedirs(output_dir, exist_ok=True)
+        temp_dir = tempfile.mkdtemp()
+        try:
+            settings_path = os.path.join(temp_dir, "render_config.json")
+            with open(settings_path, 'w') as f:
+                json.dump(extract_render_settings(bpy.context), f)
+
+            executor = BatchRenderExecutor(
+                tasks=["v001", "v002", "v003"], temp_dir=temp_dir, output_dir=output_dir,
+                settings_path=settings_path, worker_script_path=get_worker_script_path(),
+                blender_bin=bpy.app.binary_path, persistent=True, jobs_per_worker=2
+            )
+
+            events = []
+            deadline = time.monotonic() + 300
+            while not executor.finished and time.monotonic() < deadline:
+                events.extend(executor.update())
+                time.sleep(0.2)
+
+            with self.subTest(step="Results"):
+                self.assertTrue(executor.finished)
+                codes = {e['version_id']: e['return_code'] for e in events if e['status'] == 'TASK_FINISHED'}
+                self.assertEqual(codes, {"v001": 0, "v002": 0, "v003": 0})
+                self.assertEqual(executor._workers_started, 2)
+
+            with self.subTest(step="Outputs"):
+                files = os.listdir(output_dir)
+                for vid in ("v001", "v002", "v003"):
+                    self.assertTrue(any(f.startswith(f"{vid}_render") for f in files), f"Missing render for {vid}")
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    result = unittest.main(argv=['first-arg-is-ignored'], exit=False).result
+    if not result.wasSuccessful():
+        print("\n❌ Tests Failed!")
+        sys.exit(1)
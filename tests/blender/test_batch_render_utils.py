@@ -1,6 +1,7 @@
 import os
 import re
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -14,7 +15,8 @@ if str(CURRENT_DIR) not in sys.path:
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
 
-from savepoints.services.batch_render import get_batch_render_output_dir
+from savepoints.services.batch_render import get_batch_render_output_dir, write_world_library
+from savepoints.workers.scene_utils import setup_world
 from savepoints_test_case import SavePointsTestCase
 
 
@@ -64,6 +66,33 @@ class TestBatchRenderUtils(SavePointsTestCase):
         pattern = r"^untitled_\d{8}_\d{6}$"
         self.assertRegex(folder_name, pattern)
 
+    def test_write_world_library(self):
+        """
+        The world library holds the scene world and its node tree, not the rest of the main file,
+        and a worker can append the world from it.
+        """
+        world = bpy.data.worlds.new("BatchWorld")
+        world.use_nodes = True
+        bpy.ops.mesh.primitive_cube_add()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = write_world_library(world, temp_dir)
+
+            with self.subTest(step="Contents"):
+                self.assertTrue(path and os.path.exists(path))
+                with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
+                    self.assertEqual(list(data_from.worlds), ["BatchWorld"])
+                    self.assertEqual(list(data_from.objects), [])
+
+            with self.subTest(step="Worker append"):
+                bpy.data.worlds.remove(world)
+                scene = bpy.context.scene
+                setup_world(scene, {"world_name": "BatchWorld", "world_blend_path": path})
+                self.assertEqual(scene.world.name, "BatchWorld")
+                self.assertTrue(scene.world.use_nodes)
+
+        self.assertIsNone(write_world_library(None, str(self.test_dir)))
+
 
 if __name__ == "__main__":
     result = unittest.main(argv=['first-arg-is-ignored'], exit=False).result
@@ -0,0 +1,76 @@
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import bpy
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parents[1]
+if str(CURRENT_DIR) not in sys.path:
+    sys.path.append(str(CURRENT_DIR))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from savepoints_test_case import SavePointsTestCase
+from savepoints.services.bisect import EXIT_CONDITION_FALSE, EXIT_CONDITION_TRUE, BisectExecutor, bisect_versions
+
+
+class TestBisect(SavePointsTestCase):
+    def test_bisect_scenario(self):
+        """
+        Scenario:
+        1. Create 6 versions; the Cube is subdivided before v004.
+        2. Bisect on metadata (vertex count) via the operator.
+        3. Bisect with a headless script check in a background Blender.
+        """
+        bpy.ops.mesh.primitive_cube_add()
+        cube = bpy.context.active_object
+        cube.name = "BisectCube"
+
+        for i in range(1, 7):
+            if i == 4:
+                bpy.context.view_layer.objects.active = cube
+                bpy.ops.object.mode_set(mode='EDIT')
+                bpy.ops.mesh.select_all(action='SELECT')
+                bpy.ops.mesh.subdivide(number_cuts=4)
+                bpy.ops.object.mode_set(mode='OBJECT')
+            bpy.ops.savepoints.commit('EXEC_DEFAULT', note=f"Step {i}")
+
+        settings = bpy.context.scene.savepoints_settings
+
+        with self.subTest(step="Metadata Bisect"):
+            res = bpy.ops.savepoints.bisect('EXEC_DEFAULT', condition='VERTEX_COUNT',
+                                            object_name="BisectCube", threshold=8)
+            self.assertIn('FINISHED', res)
+            self.assertEqual(settings.versions[settings.active_version_index].version_id, "v004")
+
+        with self.subTest(step="Script Bisect"):
+            temp_dir = tempfile.mkdtemp()
+            script_path = Path(temp_dir) / "check.py"
+            script_path.write_text(
+                "import bpy\n"
+                "result = len(bpy.data.objects['BisectCube'].data.vertices) > 8\n"
+            )
+            executor = BisectExecutor(str(script_path), temp_dir, bpy.app.binary_path)
+
+            def run_check(version_id):
+                self.assertTrue(executor.start(version_id))
+                while (code := executor.poll()) is None:
+                    time.sleep(0.1)
+                self.assertIn(code, (EXIT_CONDITION_FALSE, EXIT_CONDITION_TRUE))
+                return code == EXIT_CONDITION_TRUE
+
+            ids = [f"v{i:03d}" for i in range(1, 7)]
+            first, evaluated = bisect_versions(ids, run_check)
+            self.assertEqual(first, "v004")
+            self.assertLessEqual(len(evaluated), 3)
+
+
+if __name__ == "__main__":
+    result = unittest.main(argv=['first-arg-is-ignored'], exit=False).result
+    if not result.wasSuccessful():
+        print("\n❌ Tests Failed!")
+        sys.exit(1)
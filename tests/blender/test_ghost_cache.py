@@ -0,0 +1,96 @@
+import sys
+import unittest
+from pathlib import Path
+
+import bpy
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parents[1]
+if str(CURRENT_DIR) not in sys.path:
+    sys.path.append(str(CURRENT_DIR))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from savepoints_test_case import SavePointsTestCase
+from savepoints.services.ghost import (
+    get_ghost_collection_name,
+    get_parked_ghost_collection_name,
+    get_parked_ghost_ids,
+    is_ghost_active,
+)
+
+
+def _snapshot_libs(version_id):
+    return [lib for lib in bpy.data.libraries if f"/{version_id}/" in lib.filepath.replace("\\", "/")]
+
+
+class TestGhostCache(SavePointsTestCase):
+    def test_ghost_cache_scenario(self):
+        """
+        Scenario:
+        1. Create v001, v002, v003.
+        2. Toggle v001 on and off: it is parked (hidden, library kept).
+        3. Toggle v001 on again: the same collection is relinked without a new library load.
+        4. With a cache size of 1, parking a second ghost evicts the least recently used one.
+        5. A cache size of 0 unloads immediately.
+        """
+        bpy.ops.mesh.primitive_cube_add()
+        bpy.context.active_object.name = "CacheCube"
+        for i in range(1, 4):
+            bpy.ops.savepoints.commit('EXEC_DEFAULT', note=f"Version {i}")
+
+        settings = bpy.context.scene.savepoints_settings
+        settings.ghost_cache_size = 2
+
+        with self.subTest(step="Park"):
+            bpy.ops.savepoints.toggle_ghost(version_id="v001")
+            self.assertTrue(is_ghost_active("v001"))
+            ghost_col = bpy.data.collections[get_ghost_collection_name("v001")]
+
+            bpy.ops.savepoints.toggle_ghost(version_id="v001")
+            self.assertFalse(is_ghost_active("v001"))
+            self.assertEqual(get_parked_ghost_ids(), ["v001"])
+            self.assertIn(get_parked_ghost_collection_name("v001"), bpy.data.collections)
+            self.assertNotIn(ghost_col.name, bpy.context.scene.collection.children)
+            self.assertEqual(len(_snapshot_libs("v001")), 1)
+
+        with self.subTest(step="Restore"):
+            bpy.ops.savepoints.toggle_ghost(version_id="v001")
+            self.assertTrue(is_ghost_active("v001"))
+            restored = bpy.data.collections[get_ghost_collection_name("v001")]
+            self.assertEqual(restored, ghost_col)
+            self.assertIn(restored.name, bpy.context.scene.collection.children)
+            self.assertEqual(len(_snapshot_libs("v001")), 1, "Restoring must not link the snapshot again")
+            self.assertEqual(get_parked_ghost_ids(), [])
+
+        with self.subTest(step="LRU Eviction"):
+            settings.ghost_cache_size = 1
+            bpy.ops.savepoints.toggle_ghost(version_id="v001")
+            bpy.ops.savepoints.toggle_ghost(version_id="v002")
+            bpy.ops.savepoints.toggle_ghost(version_id="v002")
+
+            self.assertEqual(get_parked_ghost_ids(), ["v002"])
+            self.assertEqual(len(_snapshot_libs("v001")), 0, "Evicted ghost library should be purged")
+            self.assertNotIn(get_parked_ghost_collection_name("v001"), bpy.data.collections)
+
+        with self.subTest(step="Vertex Budget"):
+            settings.ghost_cache_size = 4
+            settings.ghost_cache_max_vertices = 0
+            bpy.ops.savepoints.toggle_ghost(version_id="v003")
+            bpy.ops.savepoints.toggle_ghost(version_id="v003")
+            self.assertEqual(get_parked_ghost_ids(), [])
+
+        with self.subTest(step="Cache Disabled"):
+            settings.ghost_cache_size = 0
+            bpy.ops.savepoints.toggle_ghost(version_id="v003")
+            bpy.ops.savepoints.toggle_ghost(version_id="v003")
+            self.assertEqual(get_parked_ghost_ids(), [])
+            self.assertEqual(len(_snapshot_libs("v003")), 0)
+
+
+if __name__ == "__main__":
+    result = unittest.main(argv=['first-arg-is-ignored'], exit=False).result
+    if not result.wasSuccessful():
+        print("\n❌ Tests Failed!")
+        sys.exit(1)
@@ -84,7 +84,7 @@ class TestGhostComplex(SavePointsTestCase):
         with self.subTest(step="3. Selective Removal"):
             print("Removing Ghost v1...")
 
-            # Toggle off v1
+            # Toggle off v1 (parked in the ghost cache, library kept)
             bpy.ops.savepoints.toggle_ghost(version_id=v1_id)
 
             # Verify v1 is gone
@@ -93,6 +93,9 @@ class TestGhostComplex(SavePointsTestCase):
             # Verify v2 is STILL there
             self.assertIn(col_name_v2, bpy.data.collections, "Ghost v2 collection should still exist")
 
+            # Evict the cache to purge the parked v1 library
+            bpy.ops.savepoints.clear_ghost_cache()
+
             # Verify Library Cleanup
             libs_v1 = [l for l in bpy.data.libraries if f"/{v1_id}/" in l.filepath.replace("\\", "/")]
             libs_v2 = [l for l in bpy.data.libraries if f"/{v2_id}/" in l.filepath.replace("\\", "/")]
@@ -0,0 +1,96 @@
+import sys
+import unittest
+from pathlib import Path
+
+import bpy
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parents[1]
+if str(CURRENT_DIR) not in sys.path:
+    sys.path.append(str(CURRENT_DIR))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from savepoints_test_case import SavePointsTestCase
+from savepoints.services.ghost import get_ghost_collection_name
+
+
+def _ghost_names(version_id):
+    col = bpy.data.collections.get(get_ghost_collection_name(version_id))
+    return sorted(obj.name for obj in col.objects) if col else []
+
+
+class TestGhostFilter(SavePointsTestCase):
+    def test_ghost_filter_scenario(self):
+        """
+        Scenario:
+        1. v001: "Props" collection with two cubes, plus a sphere in front of the camera
+           and a cone far behind it.
+        2. Load ghosts with each filter and check only the matching objects were linked.
+        """
+        scene = bpy.context.scene
+        props = bpy.data.collections.new("Props")
+        scene.collection.children.link(props)
+
+        for name, location in (("PropA", (0, 0, 0)), ("PropB", (2, 0, 0))):
+            bpy.ops.mesh.primitive_cube_add(location=location)
+            obj = bpy.context.active_object
+            obj.name = name
+            for col in obj.users_collection:
+                col.objects.unlink(obj)
+            props.objects.link(obj)
+
+        bpy.ops.mesh.primitive_uv_sphere_add(location=(0, 10, 0))
+        bpy.context.active_object.name = "InView"
+        bpy.ops.mesh.primitive_cone_add(location=(0, -50, 0))
+        bpy.context.active_object.name = "OutOfView"
+
+        bpy.ops.object.camera_add(location=(0, -10, 0), rotation=(1.5708, 0, 0))
+        scene.camera = bpy.context.active_object
+        scene.camera.name = "FilterCam"
+        bpy.context.view_layer.update()
+
+        bpy.ops.savepoints.commit('EXEC_DEFAULT', note="Filter Base")
+        settings = scene.savepoints_settings
+        settings.ghost_cache_size = 0
+
+        with self.subTest(step="Selected Objects"):
+            bpy.ops.object.select_all(action='DESELECT')
+            bpy.data.objects["PropA"].select_set(True)
+            settings.ghost_filter = 'SELECTED'
+            bpy.ops.savepoints.toggle_ghost(version_id="v001")
+            self.assertEqual(_ghost_names("v001"), ["PropA"])
+            bpy.ops.savepoints.toggle_ghost(version_id="v001")
+
+        with self.subTest(step="Collection"):
+            settings.ghost_filter = 'COLLECTION'
+            settings.ghost_filter_collection = "Props"
+            bpy.ops.savepoints.toggle_ghost(version_id="v001")
+            self.assertEqual(_ghost_names("v001"), ["PropA", "PropB"])
+            bpy.ops.savepoints.toggle_ghost(version_id="v001")
+
+        with self.subTest(step="Camera Frustum"):
+            settings.ghost_filter = 'CAMERA'
+            bpy.ops.savepoints.toggle_ghost(version_id="v001")
+            names = _ghost_names("v001")
+            self.assertIn("InView", names)
+            self.assertNotIn("OutOfView", names)
+            bpy.ops.savepoints.toggle_ghost(version_id="v001")
+
+        with self.subTest(step="Cached Ghost Respects Filter"):
+            settings.ghost_cache_size = 2
+            settings.ghost_filter = 'SELECTED'
+            bpy.ops.savepoints.toggle_ghost(version_id="v001")
+            bpy.ops.savepoints.toggle_ghost(version_id="v001")
+
+            settings.ghost_filter = 'ALL'
+            bpy.ops.savepoints.toggle_ghost(version_id="v001")
+            self.assertIn("OutOfView", _ghost_names("v001"))
+
+
+if __name__ == "__main__":
+    result = unittest.main(argv=['first-arg-is-ignored'], exit=False).result
+    if not result.wasSuccessful():
+        print("\n❌ Tests Failed!")
+        sys.exit(1)
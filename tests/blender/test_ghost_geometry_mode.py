@@ -0,0 +1,82 @@
+import sys
+import unittest
+from pathlib import Path
+
+import bpy
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parents[1]
+if str(CURRENT_DIR) not in sys.path:
+    sys.path.append(str(CURRENT_DIR))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from savepoints_test_case import SavePointsTestCase
+from savepoints.services.ghost import get_ghost_collection_name
+
+
+class TestGhostGeometryMode(SavePointsTestCase):
+    def test_geometry_only_ghost_scenario(self):
+        """
+        Scenario:
+        1. v001: two cubes sharing one mesh, with an image-textured material.
+        2. Load a Geometry Only ghost.
+        3. Ghost objects are local, placed by the stored matrices, and share one linked mesh.
+        4. No material or image was linked from the snapshot.
+        """
+        image = bpy.data.images.new("GhostTexture", 64, 64)
+        mat = bpy.data.materials.new("TexturedMat")
+        mat.use_nodes = True
+        tex_node = mat.node_tree.nodes.new('ShaderNodeTexImage')
+        tex_node.image = image
+
+        bpy.ops.mesh.primitive_cube_add(location=(1, 2, 3))
+        cube_a = bpy.context.active_object
+        cube_a.name = "GeoCubeA"
+        cube_a.data.materials.append(mat)
+
+        cube_b = cube_a.copy()
+        cube_b.name = "GeoCubeB"
+        cube_b.location = (-4, 0, 0)
+        bpy.context.scene.collection.objects.link(cube_b)
+        bpy.context.view_layer.update()
+
+        image.pack()
+        bpy.ops.savepoints.commit('EXEC_DEFAULT', note="Textured")
+
+        settings = bpy.context.scene.savepoints_settings
+        settings.ghost_mode = 'GEOMETRY'
+        settings.ghost_cache_size = 0
+
+        res = bpy.ops.savepoints.toggle_ghost(version_id="v001")
+        self.assertIn('FINISHED', res)
+
+        ghost_col = bpy.data.collections[get_ghost_collection_name("v001")]
+        ghosts = {obj.name: obj for obj in ghost_col.objects}
+
+        with self.subTest(step="Local Objects"):
+            self.assertIn("Ghost_GeoCubeA", ghosts)
+            self.assertIn("Ghost_GeoCubeB", ghosts)
+            ghost_a = ghosts["Ghost_GeoCubeA"]
+            self.assertIsNone(ghost_a.library)
+            self.assertIsNotNone(ghost_a.data.library)
+            self.assertEqual(ghost_a.display_type, 'WIRE')
+            self.assertAlmostEqual(ghost_a.matrix_world.translation.z, 3.0, places=3)
+            self.assertEqual(ghost_a.data, ghosts["Ghost_GeoCubeB"].data, "Shared mesh should be linked once")
+
+        with self.subTest(step="No Shading Data"):
+            self.assertFalse([m for m in bpy.data.materials if m.library])
+            self.assertFalse([i for i in bpy.data.images if i.library])
+
+        with self.subTest(step="Unload"):
+            bpy.ops.savepoints.toggle_ghost(version_id="v001")
+            self.assertNotIn("Ghost_GeoCubeA", bpy.data.objects)
+            self.assertFalse([m for m in bpy.data.meshes if m.library])
+
+
+if __name__ == "__main__":
+    result = unittest.main(argv=['first-arg-is-ignored'], exit=False).result
+    if not result.wasSuccessful():
+        print("\n❌ Tests Failed!")
+        sys.exit(1)
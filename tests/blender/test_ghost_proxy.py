@@ -0,0 +1,90 @@
+import sys
+import unittest
+from pathlib import Path
+
+import bpy
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parents[1]
+if str(CURRENT_DIR) not in sys.path:
+    sys.path.append(str(CURRENT_DIR))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from savepoints_test_case import SavePointsTestCase
+from savepoints.services.ghost import get_ghost_collection_name
+from savepoints.services.ghost_proxy import get_ghost_proxy_path
+from savepoints.services.storage import get_history_dir
+
+
+class TestGhostProxy(SavePointsTestCase):
+    def test_proxy_ghost_scenario(self):
+        """
+        Scenario:
+        1. v001 is saved with ghost proxies; v002 without.
+        2. A Proxy ghost of v001 is one local wire mesh and links no library.
+        3. Bounds detail draws 12 edges per object.
+        4. Unloading removes the proxy mesh.
+        5. v002 has no proxies and falls back to a full (linked) ghost.
+        """
+        settings = bpy.context.scene.savepoints_settings
+        settings.store_ghost_proxies = True
+        settings.ghost_proxy_edge_budget = 5
+        settings.ghost_cache_size = 0
+
+        bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0))
+        bpy.context.active_object.name = "ProxyCube"
+        bpy.ops.mesh.primitive_uv_sphere_add(location=(5, 0, 0))
+        bpy.context.active_object.name = "ProxySphere"
+        bpy.ops.savepoints.commit('EXEC_DEFAULT', note="With Proxies")
+
+        with self.subTest(step="Proxy File"):
+            self.assertTrue(get_ghost_proxy_path(get_history_dir(), "v001").exists())
+
+        settings.ghost_mode = 'PROXY'
+        settings.ghost_proxy_detail = 'EDGES'
+        res = bpy.ops.savepoints.toggle_ghost(version_id="v001")
+        self.assertIn('FINISHED', res)
+
+        with self.subTest(step="Edges Proxy"):
+            ghost_col = bpy.data.collections[get_ghost_collection_name("v001")]
+            self.assertEqual(len(ghost_col.objects), 1)
+            proxy_obj = ghost_col.objects[0]
+            self.assertEqual(proxy_obj.display_type, 'WIRE')
+            self.assertIsNone(proxy_obj.data.library)
+            self.assertEqual(len(proxy_obj.data.edges), 10, "Each object is capped at the edge budget")
+            self.assertEqual(len(bpy.data.libraries), 0, "The snapshot must not be opened")
+
+        mesh_name = proxy_obj.data.name
+        bpy.ops.savepoints.toggle_ghost(version_id="v001")
+
+        with self.subTest(step="Unload"):
+            self.assertNotIn(mesh_name, bpy.data.meshes)
+
+        settings.ghost_proxy_detail = 'BOUNDS'
+        bpy.ops.savepoints.toggle_ghost(version_id="v001")
+
+        with self.subTest(step="Bounds Proxy"):
+            proxy_obj = bpy.data.collections[get_ghost_collection_name("v001")].objects[0]
+            self.assertEqual(len(proxy_obj.data.edges), 24)
+            self.assertEqual(len(proxy_obj.data.vertices), 16)
+
+        bpy.ops.savepoints.toggle_ghost(version_id="v001")
+
+        settings.store_ghost_proxies = False
+        bpy.ops.savepoints.commit('EXEC_DEFAULT', note="Without Proxies")
+        res = bpy.ops.savepoints.toggle_ghost(version_id="v002")
+        self.assertIn('FINISHED', res)
+
+        with self.subTest(step="Fallback"):
+            ghost_col = bpy.data.collections[get_ghost_collection_name("v002")]
+            self.assertIn("ProxyCube", ghost_col.objects)
+            self.assertGreater(len(bpy.data.libraries), 0)
+
+
+if __name__ == "__main__":
+    result = unittest.main(argv=['first-arg-is-ignored'], exit=False).result
+    if not result.wasSuccessful():
+        print("\n❌ Tests Failed!")
+        sys.exit(1)
@@ -0,0 +1,108 @@
+import os
+import sys
+import time
+import unittest
+from pathlib import Path
+
+import bpy
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parents[1]
+if str(CURRENT_DIR) not in sys.path:
+    sys.path.append(str(CURRENT_DIR))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from savepoints_test_case import SavePointsTestCase
+from savepoints.services.ghost import _LINKED_DATA_COLLECTIONS, load_ghost, unload_ghost
+
+# Opt-in timing run: SAVEPOINTS_BENCHMARK=1
+BENCHMARK = bool(os.environ.get("SAVEPOINTS_BENCHMARK"))
+BENCHMARK_GHOST_OBJECTS = 2000
+BENCHMARK_LOCAL_IDS = 100000
+
+
+def _snapshot_libs(version_id):
+    return [lib for lib in bpy.data.libraries if f"/{version_id}/" in lib.filepath.replace("\\", "/")]
+
+
+def _linked_ids():
+    return [item for attr in _LINKED_DATA_COLLECTIONS for item in getattr(bpy.data, attr, [])
+            if getattr(item, "library", None)]
+
+
+def _purge_one_by_one(lib):
+    """The previous implementation: scan every collection per library and remove IDs individually."""
+    for attr in _LINKED_DATA_COLLECTIONS:
+        collection = getattr(bpy.data, attr, None)
+        if not collection:
+            continue
+        for item in [item for item in collection if getattr(item, "library", None) == lib]:
+            collection.remove(item, do_unlink=True)
+    bpy.data.libraries.remove(lib)
+
+
+class TestGhostPurge(SavePointsTestCase):
+    def _commit_scene(self, object_count):
+        mesh = bpy.data.meshes.new("PurgeMesh")
+        mat = bpy.data.materials.new("PurgeMat")
+        mesh.materials.append(mat)
+        for i in range(object_count):
+            bpy.context.scene.collection.objects.link(bpy.data.objects.new(f"Purge_{i}", mesh))
+        bpy.ops.savepoints.commit('EXEC_DEFAULT', note="Purge")
+        bpy.context.scene.savepoints_settings.ghost_cache_size = 0
+
+    def test_unload_removes_linked_data_only(self):
+        """
+        Scenario:
+        1. Snapshot a small scene, then add local IDs that are not in the snapshot.
+        2. Load and unload the ghost.
+        3. No /v001/ library and no linked ID is left; every local ID is untouched.
+        """
+        self._commit_scene(20)
+        for i in range(50):
+            bpy.data.materials.new(f"LocalMat_{i}")
+        local_ids = {attr: sorted(item.name for item in getattr(bpy.data, attr))
+                     for attr in ("objects", "meshes", "materials", "collections")}
+
+        with self.subTest(step="Load Ghost"):
+            load_ghost("v001", bpy.context)
+            self.assertEqual(len(_snapshot_libs("v001")), 1)
+            self.assertTrue(_linked_ids())
+
+        with self.subTest(step="Unload Ghost"):
+            unload_ghost("v001", bpy.context)
+            self.assertEqual(_snapshot_libs("v001"), [])
+            self.assertEqual(_linked_ids(), [])
+            for attr, names in local_ids.items():
+                self.assertEqual(sorted(item.name for item in getattr(bpy.data, attr)), names, attr)
+
+    @unittest.skipUnless(BENCHMARK, "set SAVEPOINTS_BENCHMARK=1 to time the purge")
+    def test_purge_benchmark(self):
+        """Times per-ID removal against unload_ghost with many linked objects and local IDs."""
+        self._commit_scene(BENCHMARK_GHOST_OBJECTS)
+        for i in range(BENCHMARK_LOCAL_IDS):
+            bpy.data.materials.new(f"LocalMat_{i}")
+
+        load_ghost("v001", bpy.context)
+        bpy.data.collections.remove(bpy.data.collections["Ghost_Reference_v001"])
+        start = time.perf_counter()
+        _purge_one_by_one(_snapshot_libs("v001")[0])
+        legacy_time = time.perf_counter() - start
+
+        load_ghost("v001", bpy.context)
+        start = time.perf_counter()
+        unload_ghost("v001", bpy.context)
+        batch_time = time.perf_counter() - start
+        self.assertEqual(_snapshot_libs("v001"), [])
+
+        print(f"Ghost purge ({BENCHMARK_GHOST_OBJECTS} linked objects, {BENCHMARK_LOCAL_IDS} local IDs): "
+              f"one-by-one {legacy_time:.3f}s, batch_remove {batch_time:.3f}s")
+
+
+if __name__ == "__main__":
+    result = unittest.main(argv=['first-arg-is-ignored'], exit=False).result
+    if not result.wasSuccessful():
+        print("\n❌ Tests Failed!")
+        sys.exit(1)
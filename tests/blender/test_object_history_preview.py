@@ -0,0 +1,128 @@
+import sys
+import unittest
+from pathlib import Path
+
+import bpy
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parents[1]
+if str(CURRENT_DIR) not in sys.path:
+    sys.path.append(str(CURRENT_DIR))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from savepoints_test_case import SavePointsTestCase
+from savepoints import operators_object_history
+from savepoints.services.ghost import (
+    cleanup_single_object_ghost,
+    get_cached_single_ghost_collection_name,
+    get_cached_single_ghost_keys,
+    get_ghost_collection_name,
+    get_single_ghost_collection_name,
+    load_ghost,
+    park_ghost,
+    prefetch_single_object_ghost,
+    unload_ghost,
+)
+
+
+class TestObjectHistoryPreview(SavePointsTestCase):
+    def test_debounced_preview_scenario(self):
+        """
+        Scenario:
+        1. v001-v004: a cube edited in every version.
+        2. Changing the history index does not link anything until the debounce settles.
+        3. Once applied, the preview shows and neighbours are prefetched.
+        4. Stepping to a prefetched neighbour relinks it without loading a library.
+        5. Closing the history removes the preview and the cache.
+        """
+        bpy.ops.mesh.primitive_cube_add()
+        cube = bpy.context.active_object
+        cube.name = "HistoryCube"
+        for i in range(4):
+            cube.scale.x = 1.0 + i
+            bpy.context.view_layer.update()
+            bpy.ops.savepoints.commit('EXEC_DEFAULT', note=f"Edit {i}")
+
+        wm = bpy.context.window_manager
+        operators_object_history.populate_history_list(bpy.context)
+        self.assertGreaterEqual(len(wm.savepoints_object_history), 4)
+        col_name = get_single_ghost_collection_name("HistoryCube")
+
+        wm.savepoints_object_history_index = 1
+        with self.subTest(step="Debounced"):
+            self.assertNotIn(col_name, bpy.data.collections)
+
+        operators_object_history.flush_ghost_preview()
+        shown_version = wm.savepoints_object_history[1].version_id
+        with self.subTest(step="Applied"):
+            col = bpy.data.collections[col_name]
+            self.assertEqual(col["savepoints_single_version"], shown_version)
+            self.assertIn(col_name, bpy.context.scene.collection.children)
+
+        # Drain the idle prefetch synchronously
+        while operators_object_history._prefetch_next_ghost() is not None:
+            pass
+        neighbour_version = wm.savepoints_object_history[2].version_id
+        with self.subTest(step="Prefetched"):
+            self.assertIn((neighbour_version, "HistoryCube"), get_cached_single_ghost_keys())
+
+        libraries_before = len(bpy.data.libraries)
+        wm.savepoints_object_history_index = 2
+        with self.subTest(step="Instant Neighbour"):
+            col = bpy.data.collections[col_name]
+            self.assertEqual(col["savepoints_single_version"], neighbour_version)
+            self.assertEqual(len(bpy.data.libraries), libraries_before)
+            self.assertIn((shown_version, "HistoryCube"), get_cached_single_ghost_keys())
+
+        operators_object_history.cancel_ghost_preview_timers()
+        wm.savepoints_object_history_index = -1
+        with self.subTest(step="Cleanup"):
+            self.assertNotIn(col_name, bpy.data.collections)
+            self.assertEqual(get_cached_single_ghost_keys(), [])
+            self.assertFalse([o for o in bpy.data.objects if o.library])
+
+    def test_full_and_single_ghosts_share_a_version(self):
+        """
+        Scenario:
+        1. A single-object ghost of v001 is cached, then a full ghost of v001 is loaded.
+        2. Parking and unloading the full ghost leaves the cached single ghost intact.
+        3. A single ghost evicted while the full ghost is shown does not take its object with it.
+        """
+        bpy.ops.mesh.primitive_cube_add()
+        cube = bpy.context.active_object
+        cube.name = "SharedCube"
+        bpy.ops.savepoints.commit('EXEC_DEFAULT', note="First")
+        version_id = "v001"
+        cached_name = get_cached_single_ghost_collection_name(version_id, "SharedCube")
+
+        prefetch_single_object_ghost(version_id, "SharedCube", bpy.context)
+        load_ghost(version_id, bpy.context)
+
+        with self.subTest(step="Park Full Ghost"):
+            park_ghost(version_id, bpy.context, max_count=4, max_vertices=1_000_000)
+            self.assertEqual(len(bpy.data.collections[cached_name].objects), 1)
+
+        with self.subTest(step="Unload Full Ghost"):
+            unload_ghost(version_id, bpy.context)
+            self.assertEqual(len(bpy.data.collections[cached_name].objects), 1)
+            self.assertIn((version_id, "SharedCube"), get_cached_single_ghost_keys())
+
+        with self.subTest(step="Evict Single Ghost"):
+            load_ghost(version_id, bpy.context)
+            cleanup_single_object_ghost("SharedCube", bpy.context)
+            full = bpy.data.collections[get_ghost_collection_name(version_id)]
+            self.assertIn("SharedCube", [obj.name for obj in full.objects])
+            self.assertTrue(full.objects["SharedCube"].data)
+
+        with self.subTest(step="Cleanup"):
+            unload_ghost(version_id, bpy.context)
+            self.assertFalse([o for o in bpy.data.objects if o.library])
+
+
+if __name__ == "__main__":
+    result = unittest.main(argv=['first-arg-is-ignored'], exit=False).result
+    if not result.wasSuccessful():
+        print("\n❌ Tests Failed!")
+        sys.exit(1)
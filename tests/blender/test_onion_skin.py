@@ -0,0 +1,79 @@
+import sys
+import unittest
+from pathlib import Path
+
+import bpy
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parents[1]
+if str(CURRENT_DIR) not in sys.path:
+    sys.path.append(str(CURRENT_DIR))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from savepoints_test_case import SavePointsTestCase
+from savepoints.services.object_data import load_object_data
+from savepoints.services.onion_skin import ONION_SKIN_COLLECTION_NAME, get_onion_layer_collection_name
+
+
+class TestOnionSkin(SavePointsTestCase):
+    def test_onion_skin_scenario(self):
+        """
+        Scenario:
+        1. v001-v003 (with Store Mesh Fingerprints): a cube moved each version, its mesh never edited.
+        2. Metadata records the same geometry fingerprint in every version.
+        3. The onion skin draws 3 layers but links the cube mesh only once.
+        4. Layers fade with age.
+        5. Toggling off removes objects and libraries.
+        6. With Store Mesh Fingerprints off, commits record no fingerprint.
+        """
+        bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0))
+        cube = bpy.context.active_object
+        cube.name = "OnionCube"
+        settings = bpy.context.scene.savepoints_settings
+        settings.store_mesh_fingerprints = True
+
+        for i in range(3):
+            cube.location.x = float(i * 3)
+            bpy.context.view_layer.update()
+            bpy.ops.savepoints.commit('EXEC_DEFAULT', note=f"Step {i}")
+
+        with self.subTest(step="Fingerprints"):
+            hashes = {load_object_data(vid)["OnionCube"]["geo_hash"] for vid in ("v001", "v002", "v003")}
+            self.assertEqual(len(hashes), 1)
+
+        settings.onion_skin_count = 3
+        res = bpy.ops.savepoints.toggle_onion_skin()
+        self.assertIn('FINISHED', res)
+
+        with self.subTest(step="Layers"):
+            parent = bpy.data.collections[ONION_SKIN_COLLECTION_NAME]
+            self.assertEqual(len(parent.children), 3)
+            objs = [bpy.data.collections[get_onion_layer_collection_name(vid)].objects[0]
+                    for vid in ("v003", "v002", "v001")]
+            self.assertEqual(len({obj.data.name_full for obj in objs}), 1, "Unchanged mesh should be linked once")
+            self.assertEqual(len(bpy.data.libraries), 1)
+            self.assertAlmostEqual(objs[0].matrix_world.translation.x, 6.0, places=3)
+            self.assertAlmostEqual(objs[2].matrix_world.translation.x, 0.0, places=3)
+            self.assertGreater(objs[0].color[3], objs[2].color[3])
+
+        res = bpy.ops.savepoints.toggle_onion_skin()
+        self.assertIn('FINISHED', res)
+
+        with self.subTest(step="Unload"):
+            self.assertNotIn(ONION_SKIN_COLLECTION_NAME, bpy.data.collections)
+            self.assertFalse([o for o in bpy.data.objects if o.name.startswith("Onion_")])
+            self.assertEqual(len(bpy.data.libraries), 0)
+
+        with self.subTest(step="Fingerprints Off"):
+            settings.store_mesh_fingerprints = False
+            bpy.ops.savepoints.commit('EXEC_DEFAULT', note="Without fingerprints")
+            self.assertNotIn("geo_hash", load_object_data("v004")["OnionCube"])
+
+
+if __name__ == "__main__":
+    result = unittest.main(argv=['first-arg-is-ignored'], exit=False).result
+    if not result.wasSuccessful():
+        print("\n❌ Tests Failed!")
+        sys.exit(1)
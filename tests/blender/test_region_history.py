@@ -0,0 +1,82 @@
+import sys
+import unittest
+from pathlib import Path
+
+import bpy
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parents[1]
+if str(CURRENT_DIR) not in sys.path:
+    sys.path.append(str(CURRENT_DIR))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from savepoints_test_case import SavePointsTestCase
+from savepoints.services.snapshot import create_snapshot
+from savepoints.services.spatial_index import get_spatial_change_index
+
+
+class TestRegionHistory(SavePointsTestCase):
+    def test_region_history_scenario(self):
+        """
+        Scenario:
+        1. v001: Cube at the origin, Sphere far away.
+        2. v002: Sphere moved (far away).
+        3. v003: Cube scaled.
+        4. Query the Cube's region: only v003 and v001 touched it.
+        5. v004: Sphere deleted. A box around the 3D cursor at its old place finds v004 and v002.
+        """
+        bpy.ops.mesh.primitive_cube_add(location=(0.0, 0.0, 0.0))
+        cube = bpy.context.active_object
+        cube.name = "RegionCube"
+        bpy.ops.mesh.primitive_uv_sphere_add(location=(100.0, 0.0, 0.0))
+        sphere = bpy.context.active_object
+        sphere.name = "RegionSphere"
+        create_snapshot(bpy.context, "v001", "Base", skip_thumbnail=True)
+
+        sphere.location.x = 120.0
+        bpy.context.view_layer.update()
+        create_snapshot(bpy.context, "v002", "Sphere moved", skip_thumbnail=True)
+
+        cube.scale = (2.0, 2.0, 2.0)
+        bpy.context.view_layer.update()
+        create_snapshot(bpy.context, "v003", "Cube scaled", skip_thumbnail=True)
+
+        with self.subTest(step="Query"):
+            index = get_spatial_change_index()
+            results = index.query((-1.0, -1.0, -1.0), (1.0, 1.0, 1.0))
+            self.assertEqual([r['version_id'] for r in results], ["v003", "v001"])
+            self.assertEqual(results[0]['objects'], ["RegionCube"])
+
+        with self.subTest(step="Operator"):
+            bpy.ops.object.select_all(action='DESELECT')
+            cube.select_set(True)
+            bpy.context.view_layer.objects.active = cube
+
+            res = bpy.ops.savepoints.region_history('EXEC_DEFAULT')
+            self.assertIn('FINISHED', res)
+            wm = bpy.context.window_manager
+            self.assertEqual([item.version_id for item in wm.savepoints_region_results], ["v003", "v001"])
+
+            wm.savepoints_region_results_index = 1
+            settings = bpy.context.scene.savepoints_settings
+            self.assertEqual(settings.versions[settings.active_version_index].version_id, "v001")
+
+        with self.subTest(step="Cursor Box"):
+            # Deleting the sphere leaves an empty area that only a cursor box can query
+            bpy.data.objects.remove(sphere, do_unlink=True)
+            create_snapshot(bpy.context, "v004", "Sphere deleted", skip_thumbnail=True)
+            bpy.context.scene.cursor.location = (120.0, 0.0, 0.0)
+            wm.savepoints_region_size = 4.0
+
+            res = bpy.ops.savepoints.region_history('EXEC_DEFAULT', source='CURSOR')
+            self.assertIn('FINISHED', res)
+            self.assertEqual([item.version_id for item in wm.savepoints_region_results], ["v004", "v002"])
+
+
+if __name__ == "__main__":
+    result = unittest.main(argv=['first-arg-is-ignored'], exit=False).result
+    if not result.wasSuccessful():
+        print("\n❌ Tests Failed!")
+        sys.exit(1)
@@ -0,0 +1,75 @@
+import sys
+import unittest
+from pathlib import Path
+
+import bpy
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parents[1]
+if str(CURRENT_DIR) not in sys.path:
+    sys.path.append(str(CURRENT_DIR))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from savepoints_test_case import SavePointsTestCase
+from savepoints.services.scene_diff import diff_versions
+from savepoints.services.snapshot import create_snapshot
+
+
+class TestVersionDiff(SavePointsTestCase):
+    def test_version_diff_scenario(self):
+        """
+        Scenario:
+        1. v001: Cube + Plane.
+        2. v002: Cube moved, Plane removed, Sphere added.
+        3. Diff v001 -> v002 from metadata, then v002 -> live scene after subdividing the sphere.
+        """
+        bpy.ops.mesh.primitive_cube_add()
+        cube = bpy.context.active_object
+        cube.name = "DiffCube"
+        bpy.ops.mesh.primitive_plane_add()
+        bpy.context.active_object.name = "DiffPlane"
+        create_snapshot(bpy.context, "v001", "Base", skip_thumbnail=True)
+
+        cube.location.x += 3.0
+        bpy.data.objects.remove(bpy.data.objects["DiffPlane"])
+        bpy.ops.mesh.primitive_uv_sphere_add()
+        sphere = bpy.context.active_object
+        sphere.name = "DiffSphere"
+        bpy.context.view_layer.update()
+        create_snapshot(bpy.context, "v002", "Changes", skip_thumbnail=True)
+
+        with self.subTest(step="Version vs Version"):
+            diff = diff_versions("v001", "v002")
+            self.assertIn("DiffSphere", list(diff.created))
+            self.assertIn("DiffPlane", list(diff.removed))
+            self.assertIn("DiffCube", list(diff.moved))
+            self.assertEqual(len(diff.topology), 0)
+
+        with self.subTest(step="Version vs Live Scene"):
+            bpy.context.view_layer.objects.active = sphere
+            bpy.ops.object.mode_set(mode='EDIT')
+            bpy.ops.mesh.select_all(action='SELECT')
+            bpy.ops.mesh.subdivide()
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+            diff = diff_versions("v002")
+            self.assertEqual(list(diff.topology), ["DiffSphere"])
+            self.assertTrue(diff.vertex_delta[0] > 0)
+            self.assertEqual(len(diff.created) + len(diff.removed) + len(diff.moved), 0)
+
+        with self.subTest(step="Operator"):
+            res = bpy.ops.savepoints.compare_versions('EXEC_DEFAULT', base_version_id="v001", target_version_id="v002")
+            self.assertIn('FINISHED', res)
+            results = bpy.context.window_manager.savepoints_diff_results
+            change_types = {item.object_name: item.change_type for item in results}
+            self.assertEqual(change_types.get("DiffPlane"), 'REMOVED')
+            self.assertEqual(change_types.get("DiffSphere"), 'CREATED')
+
+
+if __name__ == "__main__":
+    result = unittest.main(argv=['first-arg-is-ignored'], exit=False).result
+    if not result.wasSuccessful():
+        print("\n❌ Tests Failed!")
+        sys.exit(1)
@@ -0,0 +1,372 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+import json
+import os
+import shutil
+import stat
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Stands in for the Blender binary: records its argv and worker slot, then sleeps for the seconds given in the
+# output prefix's version id (e.g. "v2" sleeps 0.2s) and exits with 3 for ids ending in "x".
+# It reports 50% progress halfway through and its render time at the end, like render_worker.py does.
+FAKE_BLENDER = """#!{python}
+import os, sys, time
+args = sys.argv[sys.argv.index("--") + 1:]
+version = args[2].removesuffix("_render")
+print("Blender: rendering " + version, flush=True)
+with open(args[1] + "/" + version + ".argv", "w") as f:
+    f.write(" ".join(sys.argv[1:]))
+with open(args[1] + "/" + version + ".slot", "w") as f:
+    f.write(os.environ.get("SAVEPOINTS_WORKER_SLOT", ""))
+delay = int(version[1:].rstrip("x") or 0) / 10
+time.sleep(delay / 2)
+print('@@SAVEPOINTS@@ {{"event": "progress", "phase": "Rendering", "percent": 50.0}}', flush=True)
+time.sleep(delay / 2)
+print('@@SAVEPOINTS@@ {{"event": "result", "ok": true, "render_time": %s}}' % (delay / 2), flush=True)
+sys.exit(3 if version.endswith("x") else 0)
+"""
+
+# Stands in for `blender -P render_worker.py -- --serve ...`, speaking the real worker protocol.
+# Version ids ending in "x" fail to render; "vcrash" kills the process mid-job; "vhang" never exits after its job.
+FAKE_SERVE_BLENDER = """#!{python}
+import os, sys, time
+sys.path.insert(0, {workers_dir!r})
+import worker_protocol
+args = sys.argv[sys.argv.index("--") + 1:]
+max_jobs = int(args[2])
+worker_protocol.send_message("ready", pid=os.getpid())
+done = 0
+for job in worker_protocol.read_jobs():
+    print("Blender: loading " + job["snapshot_path"], flush=True)
+    if job["version_id"] == "vcrash":
+        sys.exit(7)
+    time.sleep(0.05)
+    with open(os.path.join(job["output_dir"], job["file_prefix"] + ".pid"), "w") as f:
+        f.write(str(os.getpid()))
+    worker_protocol.send_message("result", version_id=job["version_id"], ok=not job["version_id"].endswith("x"))
+    if job["version_id"] == "vhang":
+        time.sleep(30)
+    done += 1
+    if max_jobs and done >= max_jobs:
+        worker_protocol.send_message("recycle", reason="max_jobs", jobs=done)
+        break
+"""
+
+
+class TestBatchRenderExecutor(unittest.TestCase):
+    def setUp(self):
+        from savepoints.services import batch_executor
+        self.module = batch_executor
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.temp_dir, "out")
+        os.makedirs(self.output_dir)
+
+        self.blender_bin = os.path.join(self.temp_dir, "fake_blender")
+        with open(self.blender_bin, 'w') as f:
+            f.write(FAKE_BLENDER.format(python=sys.executable))
+        os.chmod(self.blender_bin, os.stat(self.blender_bin).st_mode | stat.S_IEXEC)
+
+        self.snapshot = Path(self.temp_dir) / "snapshot.blend"
+        self.snapshot.write_text("")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _executor(self, tasks, **kwargs):
+        return self.module.BatchRenderExecutor(
+            tasks=tasks, temp_dir=self.temp_dir, output_dir=self.output_dir,
+            settings_path="config.json", worker_script_path="worker.py", blender_bin=self.blender_bin, **kwargs
+        )
+
+    def _run(self, executor, timeout=20.0):
+        events, peak = [], 0
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            tick = executor.update()
+            peak = max(peak, len(executor.running_version_ids))
+            events.extend(tick)
+            if any(e['status'] in {'FINISHED', 'CANCELLED'} for e in tick):
+                return events, peak
+            time.sleep(0.02)
+        self.fail("Executor did not finish")
+
+    @unittest.skipIf(os.name == 'nt', "Fake Blender relies on a shebang script")
+    def test_parallel_workers(self):
+        snapshots = {"v3": self.snapshot, "v1": self.snapshot, "v2x": self.snapshot, "v1b": None}
+
+        def find(version_id):
+            return snapshots.get(version_id)
+
+        with patch.object(self.module, "find_snapshot_path", side_effect=find):
+            executor = self._executor(["v3", "v1", "v2x", "v1b"], max_workers=2, threads_per_worker=4)
+            events, peak = self._run(executor)
+
+        self.assertEqual(peak, 2)
+        finished = {e['version_id']: e for e in events if e['status'] == 'TASK_FINISHED'}
+        self.assertEqual(finished['v3']['return_code'], 0)
+        self.assertEqual(finished['v2x']['return_code'], 3)
+        self.assertEqual([e['version_id'] for e in events if e['status'] == 'SKIPPED'], ["v1b"])
+        self.assertEqual(events[-1]['status'], 'FINISHED')
+        self.assertEqual(executor.progress, (4, 4))
+
+        # Concurrent workers get distinct device partition slots
+        slots = {Path(self.output_dir, f"{vid}.slot").read_text() for vid in ("v3", "v1", "v2x")}
+        self.assertEqual(slots, {"0", "1"})
+
+        # v1 started after v3 but finished first
+        order = [e['version_id'] for e in events if e['status'] == 'TASK_FINISHED']
+        self.assertLess(order.index("v1"), order.index("v3"))
+
+        argv = Path(self.output_dir, "v1.argv").read_text().split()
+        self.assertEqual(argv[argv.index("-t") + 1], "4")
+
+    @unittest.skipIf(os.name == 'nt', "Fake Blender relies on a shebang script")
+    def test_cancel_kills_all_workers(self):
+        with patch.object(self.module, "find_snapshot_path", return_value=self.snapshot):
+            executor = self._executor(["v50", "v51", "v52"], max_workers=3)
+            executor.update()
+            processes = [task.process for task in executor.running.values()]
+            self.assertEqual(len(processes), 3)
+
+            executor.cancel()
+
+        self.assertTrue(all(p.poll() is not None for p in processes))
+        self.assertEqual(executor.running, {})
+        self.assertEqual(executor.update(), [{'status': 'CANCELLED'}])
+
+    @unittest.skipIf(os.name == 'nt', "Fake Blender relies on a shebang script")
+    def test_progress_and_eta(self):
+        with patch.object(self.module, "find_snapshot_path", return_value=self.snapshot):
+            executor = self._executor(["v4", "v6"])
+            seen_progress, etas, events = [], [], []
+            deadline = time.monotonic() + 20
+            while not executor.finished and time.monotonic() < deadline:
+                events.extend(executor.update())
+                seen_progress.extend(p.get('percent') for p in executor.task_progress.values())
+                etas.append(executor.get_eta())
+                time.sleep(0.02)
+
+        self.assertTrue(executor.finished)
+        self.assertIn(50.0, seen_progress)
+        self.assertIsNone(etas[0])
+        self.assertTrue(any(eta is not None and eta > 0 for eta in etas))
+        self.assertEqual(len(executor.durations), 2)
+
+        # Telemetry: render time from the worker, CPU time and peak memory from reaping the process
+        finished = {e['version_id']: e for e in events if e['status'] == 'TASK_FINISHED'}
+        self.assertAlmostEqual(finished['v4']['render_time'], 0.2)
+        self.assertGreater(finished['v4']['duration'], finished['v4']['render_time'])
+        if hasattr(os, 'wait4'):
+            self.assertGreater(finished['v4']['cpu_time'], 0.0)
+            self.assertGreater(finished['v4']['peak_rss_mb'], 1.0)
+
+        # Output still lands in the log, without the protocol messages
+        log = Path(self.temp_dir, "render_log_v4.txt").read_text()
+        self.assertIn("Blender: rendering v4", log)
+        self.assertNotIn(self.module.WORKER_MESSAGE_PREFIX, log)
+
+    @unittest.skipIf(os.name == 'nt', "Fake Blender relies on a shebang script")
+    def test_quality_provider_overrides_each_task(self):
+        asked = []
+
+        def provider(version_id):
+            asked.append(version_id)
+            return {"resolution_percentage": 50, "samples": 8} if version_id == "v1" else None
+
+        with patch.object(self.module, "find_snapshot_path", return_value=self.snapshot):
+            executor = self._executor(["v1", "v2"], quality_provider=provider)
+            self._run(executor)
+
+        self.assertEqual(asked, ["v1", "v2"])
+        argv = Path(self.output_dir, "v1.argv").read_text().split(" ")
+        self.assertEqual(json.loads(" ".join(argv[argv.index("v1_render") + 1:])),
+                         {"resolution_percentage": 50, "samples": 8})
+        self.assertTrue(Path(self.output_dir, "v2.argv").read_text().endswith("v2_render"))
+
+    @unittest.skipIf(os.name == 'nt', "Fake Blender relies on a shebang script")
+    def test_low_priority_workers_are_niced(self):
+        with patch.object(self.module, "find_snapshot_path", return_value=self.snapshot):
+            executor = self._executor(["v1"], low_priority=True)
+            events, _ = self._run(executor)
+
+        self.assertEqual([e['return_code'] for e in events if e['status'] == 'TASK_FINISHED'], [0])
+        prefix = self.module.get_low_priority_prefix()
+        self.assertEqual(executor.build_command("v1", self.snapshot)[:len(prefix) + 1], [*prefix, self.blender_bin])
+        if prefix:
+            self.assertEqual(prefix[1:], ["-n", str(self.module.LOW_PRIORITY_NICENESS)])
+
+    def test_estimate_remaining_seconds(self):
+        estimate = self.module.estimate_remaining_seconds
+        self.assertIsNone(estimate([], 5, [], 1))
+        # 2 queued + half of one in flight, at 10s each on one worker
+        self.assertAlmostEqual(estimate([8.0, 12.0], 2, [0.5], 1), 25.0)
+        # The same work shared by two workers
+        self.assertAlmostEqual(estimate([10.0], 2, [0.5, 0.5], 2), 15.0)
+
+    def _write_serve_blender(self):
+        path = os.path.join(self.temp_dir, "fake_serve_blender")
+        workers_dir = str(Path(__file__).resolve().parents[1] / "savepoints" / "workers")
+        with open(path, 'w') as f:
+            f.write(FAKE_SERVE_BLENDER.format(python=sys.executable, workers_dir=workers_dir))
+        os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+        return path
+
+    @unittest.skipIf(os.name == 'nt', "Fake Blender relies on a shebang script")
+    def test_persistent_workers_are_reused_and_recycled(self):
+        self.blender_bin = self._write_serve_blender()
+        versions = ["v1", "v2", "v3x", "v4", "v5"]
+        with patch.object(self.module, "find_snapshot_path", return_value=self.snapshot):
+            executor = self._executor(versions, max_workers=2, persistent=True, jobs_per_worker=2)
+            events, peak = self._run(executor)
+
+        self.assertEqual(peak, 2)
+        finished = {e['version_id']: e['return_code'] for e in events if e['status'] == 'TASK_FINISHED'}
+        self.assertEqual(finished, {"v1": 0, "v2": 0, "v3x": 1, "v4": 0, "v5": 0})
+        self.assertEqual(executor.workers, [])
+
+        # 5 jobs with 2 jobs per process: at least 3 processes, none rendering more than 2 versions
+        pids = [Path(self.output_dir, f"{v}_render.pid").read_text() for v in versions if not v.endswith("x")]
+        self.assertGreaterEqual(executor._workers_started, 3)
+        self.assertLessEqual(max(pids.count(pid) for pid in pids), 2)
+
+        # Blender's own output goes to the worker log, protocol messages do not
+        log = Path(self.temp_dir, "render_worker_1.txt").read_text()
+        self.assertIn("Blender: loading", log)
+        self.assertNotIn(self.module.WORKER_MESSAGE_PREFIX, log)
+
+    @unittest.skipIf(os.name == 'nt', "Fake Blender relies on a shebang script")
+    def test_persistent_worker_crash_fails_only_its_job(self):
+        self.blender_bin = self._write_serve_blender()
+        with patch.object(self.module, "find_snapshot_path", return_value=self.snapshot):
+            executor = self._executor(["vcrash", "v1", "v2"], persistent=True)
+            events, _ = self._run(executor)
+
+        finished = {e['version_id']: e['return_code'] for e in events if e['status'] == 'TASK_FINISHED'}
+        self.assertEqual(finished, {"vcrash": 7, "v1": 0, "v2": 0})
+
+    @unittest.skipIf(os.name == 'nt', "Fake Blender relies on a shebang script")
+    def test_retiring_workers_count_against_max_workers(self):
+        self.blender_bin = self._write_serve_blender()
+        with patch.object(self.module, "find_snapshot_path", return_value=self.snapshot):
+            executor = self._executor([f"v{i}" for i in range(6)], max_workers=2, persistent=True, jobs_per_worker=1)
+            peak_workers = 0
+            deadline = time.monotonic() + 20.0
+            while not executor.finished and time.monotonic() < deadline:
+                executor.update()
+                peak_workers = max(peak_workers, len(executor.workers))
+                time.sleep(0.01)
+
+        self.assertTrue(executor.finished)
+        self.assertEqual(peak_workers, 2)
+        self.assertGreaterEqual(executor._workers_started, 6)
+
+    @unittest.skipIf(os.name == 'nt', "Fake Blender relies on a shebang script")
+    def test_finish_does_not_wait_for_workers(self):
+        self.blender_bin = self._write_serve_blender()
+        with patch.object(self.module, "find_snapshot_path", return_value=self.snapshot), \
+                patch.object(self.module, "WORKER_EXIT_TIMEOUT", 0.3):
+            executor = self._executor(["vhang", "v1"], max_workers=2, persistent=True)
+            slowest_tick = 0.0
+            deadline = time.monotonic() + 20.0
+            while not executor.finished and time.monotonic() < deadline:
+                started = time.monotonic()
+                executor.update()
+                slowest_tick = max(slowest_tick, time.monotonic() - started)
+                time.sleep(0.02)
+
+        # The hanging worker is killed once overdue instead of being waited for on the UI thread
+        self.assertTrue(executor.finished)
+        self.assertEqual(executor.workers, [])
+        self.assertLess(slowest_tick, 1.0)
+
+    def test_parse_worker_message(self):
+        self.assertIsNone(self.module.parse_worker_message("Fra:1 Mem:12M\n"))
+        self.assertEqual(self.module.parse_worker_message('@@SAVEPOINTS@@ {"event": "ready"}\n'), {"event": "ready"})
+        self.assertIsNone(self.module.parse_worker_message("@@SAVEPOINTS@@ {broken\n"))
+
+    def test_threads_per_worker(self):
+        self.assertEqual(self.module.get_threads_per_worker(1), 0)
+        self.assertEqual(self.module.get_threads_per_worker(4, 3), 3)
+        with patch.object(self.module.os, "cpu_count", return_value=32):
+            self.assertEqual(self.module.get_threads_per_worker(8), 4)
+            self.assertEqual(self.module.get_threads_per_worker(64), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
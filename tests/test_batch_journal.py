@@ -0,0 +1,174 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+
+import json
+import os
+import shutil
+import tempfile
+
+
+class TestBatchJournal(unittest.TestCase):
+    def setUp(self):
+        from savepoints.services import batch_journal
+        self.module = batch_journal
+        self.root = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.root, "project_20260101_120000")
+        os.makedirs(self.output_dir)
+        self.settings = {"main_blend_path": "/work/project.blend", "engine": "CYCLES",
+                         "world_blend_path": "/tmp/sp_batch_x/world.blend", "gpu": {"device_type": "NONE"}}
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _render(self, version_id):
+        path = os.path.join(self.output_dir, f"{version_id}_render.png")
+        with open(path, 'wb') as f:
+            f.write(b"png")
+        return path
+
+    def test_incomplete_tasks_survive_reload(self):
+        journal = self.module.BatchJournal.create(self.output_dir, ["v005", "v004", "v003", "v002", "v001"],
+                                                  self.settings)
+        journal.mark("v005", self.module.TASK_DONE, self._render("v005"), 0)
+        journal.mark("v004", self.module.TASK_FAILED, return_code=1)
+        journal.mark("v003", self.module.TASK_CACHED, self._render("v003"))
+        journal.mark("v002", self.module.TASK_MISSING)
+
+        reloaded = self.module.BatchJournal.load(self.output_dir)
+
+        self.assertEqual(reloaded.incomplete_version_ids(), ["v004", "v001"])
+        self.assertEqual(reloaded.get_state("v005"), self.module.TASK_DONE)
+        self.assertFalse(reloaded.finished)
+
+        # A render deleted since it finished is dispatched again
+        os.remove(os.path.join(self.output_dir, "v005_render.png"))
+        self.assertEqual(reloaded.incomplete_version_ids(), ["v005", "v004", "v001"])
+
+    def test_per_run_settings_are_not_stored(self):
+        self.module.BatchJournal.create(self.output_dir, ["v001"], self.settings, dry_run=True)
+
+        with open(os.path.join(self.output_dir, self.module.JOURNAL_FILENAME), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data["render_settings"], {"main_blend_path": "/work/project.blend", "engine": "CYCLES"})
+        self.assertTrue(data["dry_run"])
+        self.assertFalse(os.path.exists(os.path.join(self.output_dir, self.module.JOURNAL_FILENAME + ".tmp")))
+
+    def test_find_resumable_batches(self):
+        older = self.module.BatchJournal.create(self.output_dir, ["v001"], self.settings)
+        older.data["created"] = "2026-01-01T12:00:00"
+        older.save()
+
+        newer_dir = os.path.join(self.root, "project_20260102_120000")
+        os.makedirs(newer_dir)
+        newer = self.module.BatchJournal.create(newer_dir, ["v001"], self.settings)
+        newer.data["created"] = "2026-01-02T12:00:00"
+        newer.save()
+
+        done_dir = os.path.join(self.root, "project_20260103_120000")
+        os.makedirs(done_dir)
+        self.module.BatchJournal.create(done_dir, ["v001"], self.settings).mark_finished()
+
+        other_dir = os.path.join(self.root, "other_20260104_120000")
+        os.makedirs(other_dir)
+        self.module.BatchJournal.create(other_dir, ["v001"], {"main_blend_path": "/work/other.blend"})
+
+        # The live timelapse folder is never finished but is not an interrupted batch
+        live_dir = os.path.join(self.root, "project_live")
+        os.makedirs(live_dir)
+        live = self.module.BatchJournal.create(live_dir, ["v001"], self.settings)
+        live.data["live"] = True
+        live.save()
+
+        # Finished, but a version failed: resuming retries it
+        failed_dir = os.path.join(self.root, "project_20260105_120000")
+        os.makedirs(failed_dir)
+        failed = self.module.BatchJournal.create(failed_dir, ["v001", "v002"], self.settings)
+        failed.data["created"] = "2026-01-05T12:00:00"
+        failed.mark("v001", self.module.TASK_FAILED, return_code=1)
+        failed.mark_finished()
+
+        found = self.module.find_resumable_batches(self.root, "/work/project.blend")
+        self.assertEqual([j.output_dir for j in found], [failed_dir, newer_dir, self.output_dir])
+        self.assertEqual(found[0].failed_version_ids(), ["v001"])
+        self.assertEqual(found[0].incomplete_version_ids(), ["v001", "v002"])
+
+    def test_load_rejects_broken_journal(self):
+        with open(os.path.join(self.output_dir, self.module.JOURNAL_FILENAME), 'w') as f:
+            f.write("{broken")
+        self.assertIsNone(self.module.BatchJournal.load(self.output_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+
+
+class TestBatchOrder(unittest.TestCase):
+    def setUp(self):
+        from savepoints.services import batch_order
+        self.module = batch_order
+
+    def test_progressive_order_bisects_the_timeline(self):
+        versions = [f"v{i}" for i in range(9)]
+
+        order = self.module.progressive_order(versions)
+
+        # Ends, middle, quarters, then the rest
+        self.assertEqual(order[:5], ["v0", "v8", "v4", "v2", "v6"])
+        self.assertEqual(sorted(order), sorted(versions))
+
+    def test_progressive_order_puts_priority_first(self):
+        versions = ["v0", "v1", "v2", "v3"]
+        order = self.module.progressive_order(versions, ["v2", "v9", "v2"])
+        self.assertEqual(order, ["v2", "v0", "v3", "v1"])
+        self.assertEqual(self.module.progressive_order([]), [])
+        self.assertEqual(self.module.progressive_order(["v0"]), ["v0"])
+
+    def test_layout_timelapse_holds_gaps_until_final(self):
+        slots = ["v0", "v1", "v2", "v3"]
+        rendered = {"v0": "/r/v0.png", "v2": "/r/v2.png"}
+
+        partial = self.module.layout_timelapse(slots, rendered, 6)
+        self.assertEqual(partial, [("v0", "/r/v0.png", 1, 12), ("v2", "/r/v2.png", 13, 6)])
+
+        packed = self.module.layout_timelapse(slots, rendered, 6, hold_gaps=False)
+        self.assertEqual(packed, [("v0", "/r/v0.png", 1, 6), ("v2", "/r/v2.png", 7, 6)])
+
+        # Another render only shortens the strip before it
+        rendered["v1"] = "/r/v1.png"
+        self.assertEqual(self.module.layout_timelapse(slots, rendered, 6)[:2],
+                         [("v0", "/r/v0.png", 1, 6), ("v1", "/r/v1.png", 7, 6)])
+
+
+if __name__ == '__main__':
+    unittest.main()
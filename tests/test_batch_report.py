@@ -0,0 +1,141 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+
+import json
+import os
+import shutil
+import tempfile
+
+
+def _event(version_id, duration, return_code=0, render_time=None, cpu_time=None, peak_rss_mb=None):
+    return {'status': 'TASK_FINISHED', 'version_id': version_id, 'return_code': return_code, 'duration': duration,
+            'render_time': render_time, 'cpu_time': cpu_time, 'peak_rss_mb': peak_rss_mb}
+
+
+class TestBatchReport(unittest.TestCase):
+    def setUp(self):
+        from savepoints.services import batch_report
+        self.module = batch_report
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_task_record(self):
+        output_file = os.path.join(self.temp_dir, "v001_render.png")
+        with open(output_file, 'wb') as f:
+            f.write(b"x" * 2048)
+
+        record = self.module.build_task_record(
+            _event("v001", 12.5, render_time=10.0, cpu_time=40.0, peak_rss_mb=900.0), output_file
+        )
+
+        self.assertEqual(record['state'], 'DONE')
+        self.assertEqual(record['overhead'], 2.5)
+        self.assertEqual(record['output_bytes'], 2048)
+        self.assertIsNone(self.module.build_task_record(_event("v002", 1.0, return_code=3))['overhead'])
+
+    def test_summary_flags_outliers(self):
+        records = [self.module.build_task_record(_event(f"v00{i}", 2.0, render_time=1.5)) for i in range(1, 5)]
+        records.append(self.module.build_task_record(_event("v005", 80.0, render_time=79.5, peak_rss_mb=4000.0)))
+        records.append(self.module.build_task_record(_event("v006", 1.0, return_code=1)))
+        records.append(self.module.build_static_record("v007", 'CACHED'))
+
+        summary = self.module.summarize(records, batch_wall_time=60.0, max_workers=2)
+
+        self.assertEqual(summary['rendered'], 6)
+        self.assertEqual(summary['failed'], 1)
+        self.assertEqual(summary['not_rendered'], 1)
+        self.assertEqual(summary['slowest_version'], "v005")
+        self.assertEqual(summary['max_peak_rss_mb'], 4000.0)
+        self.assertEqual(summary['total_overhead'], 2.5)
+        self.assertEqual(summary['outliers'], [{'version_id': "v005", 'factor': 40.0}])
+
+    def test_write_report(self):
+        records = [self.module.build_task_record(_event("v001", 2.0)), self.module.build_static_record("v002", 'MISSING')]
+        summary = self.module.summarize(records)
+
+        path = self.module.write_batch_report(self.temp_dir, records, summary)
+
+        with open(path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        self.assertEqual([t['version_id'] for t in report['tasks']], ["v001", "v002"])
+        self.assertIs(self.module.get_last_batch_summary(), summary)
+        text = self.module.format_batch_report(records, summary)
+        self.assertIn("v002      MISSING", text)
+
+
+if __name__ == '__main__':
+    unittest.main()
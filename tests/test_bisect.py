@@ -0,0 +1,160 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+
+class TestBisect(unittest.TestCase):
+    def setUp(self):
+        from savepoints.services import bisect
+        self.bisect = bisect
+        self.ids = [f"v{i:03d}" for i in range(1, 101)]
+
+    def test_finds_first_matching_version(self):
+        calls = []
+
+        def predicate(vid):
+            calls.append(vid)
+            return int(vid[1:]) >= 37
+
+        first, evaluated = self.bisect.bisect_versions(self.ids, predicate)
+
+        self.assertEqual(first, "v037")
+        self.assertLessEqual(len(calls), 7)  # ceil(log2(100))
+        self.assertEqual([vid for vid, _ in evaluated], calls)
+
+    def test_edges(self):
+        self.assertEqual(self.bisect.bisect_versions(self.ids, lambda vid: True)[0], "v001")
+        self.assertIsNone(self.bisect.bisect_versions(self.ids, lambda vid: False)[0])
+        self.assertEqual(self.bisect.bisect_versions([], lambda vid: True), (None, []))
+        self.assertEqual(self.bisect.bisect_versions(["v001"], lambda vid: True)[0], "v001")
+
+    def test_stepwise_bisector(self):
+        bisector = self.bisect.VersionBisector(self.ids)
+        self.assertEqual(bisector.remaining_steps, 7)
+        while not bisector.finished:
+            bisector.record(int(bisector.next_candidate()[1:]) >= 90)
+        self.assertIsNone(bisector.next_candidate())
+        self.assertEqual(bisector.first_match, "v090")
+
+    def test_metadata_predicates(self):
+        data = {
+            "v001": {"Rock": {"v_count": 100}},
+            "v002": {"Rock": {"v_count": 5000}},
+            "v003": {},
+        }
+        ids = list(data)
+        with patch.object(self.bisect, "load_object_data", side_effect=lambda vid: data[vid]):
+            first, _ = self.bisect.bisect_versions(ids, self.bisect.vertex_count_exceeds("Rock", 1000))
+            self.assertEqual(first, "v002")
+            first, _ = self.bisect.bisect_versions(ids, self.bisect.object_missing("Rock"))
+            self.assertEqual(first, "v003")
+
+    def test_object_missing_after_late_creation(self):
+        # Created in v007, deleted in v009: older versions lack it too
+        data = {f"v{i:03d}": ({"Rock": {}} if 7 <= i <= 8 else {}) for i in range(1, 11)}
+        ids = list(data)
+        with patch.object(self.bisect, "load_object_data", side_effect=lambda vid: data[vid]):
+            first, _ = self.bisect.bisect_versions(ids, self.bisect.object_missing("Rock"))
+            self.assertEqual(first, "v001")  # what an unrestricted bisect reports
+
+            since = self.bisect.get_versions_since_first_presence(ids, "Rock")
+            self.assertEqual(since[0], "v007")
+            first, _ = self.bisect.bisect_versions(since, self.bisect.object_missing("Rock"))
+            self.assertEqual(first, "v009")
+
+            self.assertIsNone(self.bisect.get_versions_since_first_presence(ids, "Tree"))
+
+    def test_executor_maps_exit_codes(self):
+        executor = self.bisect.BisectExecutor("check.py", "unused", "blender", worker_script_path="unused")
+        expected = {
+            self.bisect.EXIT_CONDITION_FALSE: self.bisect.EXIT_CONDITION_FALSE,
+            self.bisect.EXIT_CONDITION_TRUE: self.bisect.EXIT_CONDITION_TRUE,
+            0: self.bisect.EXIT_ERROR,  # Blender exits cleanly without the worker reaching sys.exit
+            1: self.bisect.EXIT_ERROR,  # Blender's own failure code, e.g. a snapshot that fails to load
+            2: self.bisect.EXIT_ERROR,
+            -11: self.bisect.EXIT_ERROR,  # killed by a signal
+        }
+        for return_code, mapped in expected.items():
+            with self.subTest(return_code=return_code):
+                executor.current_process = MagicMock()
+                executor.current_process.poll.return_value = return_code
+                self.assertEqual(executor.poll(), mapped)
+                self.assertEqual(executor.last_return_code, return_code)
+
+        executor.current_process = MagicMock()
+        executor.current_process.poll.return_value = None
+        self.assertIsNone(executor.poll())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _perspective(fov_deg=90.0, near=0.1, far=100.0):
+    """OpenGL-style projection looking down -Z (the Blender camera convention)."""
+    f = 1.0 / np.tan(np.radians(fov_deg) / 2.0)
+    return np.array([
+        [f, 0.0, 0.0, 0.0],
+        [0.0, f, 0.0, 0.0],
+        [0.0, 0.0, (far + near) / (near - far), 2.0 * far * near / (near - far)],
+        [0.0, 0.0, -1.0, 0.0],
+    ])
+
+
+def _box(center, half=0.5):
+    c = np.asarray(center, dtype=np.float64)
+    return np.concatenate([c - half, c + half])
+
+
+@unittest.skipIf(np is None, "NumPy not available")
+class TestFrustum(unittest.TestCase):
+    def setUp(self):
+        from savepoints.services.frustum import aabbs_in_frustum, frustum_planes
+        self.aabbs_in_frustum = aabbs_in_frustum
+        self.planes = frustum_planes(_perspective())
+
+    def test_visibility(self):
+        boxes = np.stack([
+            _box((0.0, 0.0, -10.0)),  # straight ahead
+            _box((0.0, 0.0, 10.0)),  # behind the camera
+            _box((50.0, 0.0, -10.0)),  # far to the right
+            _box((0.0, 0.0, -500.0)),  # beyond the far plane
+            _box((10.4, 0.0, -10.0)),  # straddles the right plane
+        ])
+        self.assertEqual(self.aabbs_in_frustum(boxes, self.planes).tolist(), [True, False, False, False, True])
+
+    def test_view_transform(self):
+        # Camera at x=100 looking down -Z: the view matrix translates the world by -100 on X
+        view = np.identity(4)
+        view[0, 3] = -100.0
+        from savepoints.services.frustum import frustum_planes
+        planes = frustum_planes(_perspective() @ view)
+
+        boxes = np.stack([_box((100.0, 0.0, -10.0)), _box((0.0, 0.0, -10.0))])
+        self.assertEqual(self.aabbs_in_frustum(boxes, planes).tolist(), [True, False])
+
+    def test_empty(self):
+        self.assertEqual(len(self.aabbs_in_frustum(np.empty((0, 6)), self.planes)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _proxies(gp, translations, edge_lists):
+    """One object per translation; object i has a chain of edge_lists[i] edges along X."""
+    names, matrices, vert_parts, edge_parts = [], [], [], []
+    vert_offsets, edge_offsets = [0], [0]
+    for i, (t, n_edges) in enumerate(zip(translations, edge_lists)):
+        m = np.identity(4, dtype=np.float32)
+        m[:3, 3] = t
+        verts = np.array([[x, 0.0, 0.0] for x in range(n_edges + 1)], dtype=np.float32) if n_edges else \
+            np.empty((0, 3), dtype=np.float32)
+        edges = np.array([[k, k + 1] for k in range(n_edges)], dtype=np.uint32).reshape(-1, 2)
+        names.append(f"Obj{i}")
+        matrices.append(m.reshape(-1))
+        vert_parts.append(verts)
+        edge_parts.append(edges)
+        vert_offsets.append(vert_offsets[-1] + len(verts))
+        edge_offsets.append(edge_offsets[-1] + len(edges))
+
+    return gp.GhostProxies(
+        np.array(names, dtype=str),
+        np.array(matrices, dtype=np.float32),
+        np.tile(np.array([0, 0, 0, 1, 1, 1], dtype=np.float32), (len(names), 1)),
+        np.array(vert_offsets, dtype=np.int64),
+        np.concatenate(vert_parts),
+        np.array(edge_offsets, dtype=np.int64),
+        np.concatenate(edge_parts),
+    )
+
+
+@unittest.skipIf(np is None, "NumPy not available")
+class TestGhostProxy(unittest.TestCase):
+    def setUp(self):
+        from savepoints.services import ghost_proxy
+        self.gp = ghost_proxy
+
+    def test_decimate_edges(self):
+        verts = np.arange(300, dtype=np.float32).reshape(-1, 3)
+        edges = np.array([[i, i + 1] for i in range(99)], dtype=np.int64)
+
+        d_verts, d_edges = self.gp.decimate_edges(verts, edges, 10)
+        self.assertEqual(len(d_edges), 10)
+        # Only referenced vertices survive and the edges still point at the same positions
+        self.assertEqual(len(d_verts), len(np.unique(d_edges)))
+        self.assertLess(int(d_edges.max()), len(d_verts))
+        np.testing.assert_array_equal(d_verts[d_edges[0]], verts[edges[0]])
+        np.testing.assert_array_equal(d_verts[d_edges[-1]], verts[edges[-1]])
+
+        # Under budget: untouched apart from compaction
+        _, kept = self.gp.decimate_edges(verts, edges, 1000)
+        self.assertEqual(len(kept), 99)
+
+    def test_build_wire_edges(self):
+        proxies = _proxies(self.gp, [(0, 0, 0), (10, 0, 0)], [3, 2])
+        verts, edges = proxies.build_wire(self.gp.PROXY_DETAIL_EDGES)
+
+        self.assertEqual(verts.shape, (7, 3))
+        self.assertEqual(edges.shape, (5, 2))
+        # Second object's vertices are translated and its edges re-based after the first object's 4 vertices
+        np.testing.assert_allclose(verts[4], [10, 0, 0])
+        self.assertEqual(edges[3].tolist(), [4, 5])
+
+    def test_build_wire_bounds_and_fallback(self):
+        proxies = _proxies(self.gp, [(0, 0, 0), (5, 0, 0)], [3, 0])
+
+        verts, edges = proxies.build_wire(self.gp.PROXY_DETAIL_BOUNDS)
+        self.assertEqual(verts.shape, (16, 3))
+        self.assertEqual(edges.shape, (24, 2))
+        np.testing.assert_allclose(verts.min(axis=0), [0, 0, 0])
+        np.testing.assert_allclose(verts.max(axis=0), [6, 1, 1])
+
+        # An object with no stored edges is drawn as its box even at EDGES detail
+        verts, edges = proxies.build_wire(self.gp.PROXY_DETAIL_EDGES)
+        self.assertEqual(verts.shape, (4 + 8, 3))
+        self.assertEqual(edges.shape, (3 + 12, 2))
+        self.assertLess(int(edges.max()), len(verts))
+
+    def test_build_wire_object_filter(self):
+        proxies = _proxies(self.gp, [(0, 0, 0), (10, 0, 0)], [3, 2])
+        verts, edges = proxies.build_wire(self.gp.PROXY_DETAIL_EDGES, ["Obj1"])
+        self.assertEqual(verts.shape, (3, 3))
+        self.assertEqual(edges.tolist(), [[0, 1], [1, 2]])
+
+        verts, edges = proxies.build_wire(self.gp.PROXY_DETAIL_EDGES, ["Missing"])
+        self.assertEqual(len(verts), 0)
+        self.assertEqual(len(edges), 0)
+
+    def test_save_load_roundtrip(self):
+        import tempfile
+        from pathlib import Path
+
+        proxies = _proxies(self.gp, [(0, 0, 0), (10, 0, 0)], [3, 2])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "v001_proxies.npz"
+            proxies.save(path)
+            loaded = self.gp.GhostProxies.load(path)
+
+        self.assertEqual(loaded.names.tolist(), ["Obj0", "Obj1"])
+        for a, b in zip(proxies.build_wire(), loaded.build_wire()):
+            np.testing.assert_array_equal(a, b)
+
+
+if __name__ == '__main__':
+    unittest.main()
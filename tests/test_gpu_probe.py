@@ -0,0 +1,162 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+
+import os
+import shutil
+import stat
+import tempfile
+import time
+
+# Stands in for `blender -P gpu_probe_worker.py -- <output.json>` and counts its launches.
+FAKE_PROBE_BLENDER = """#!{python}
+import json, os, sys
+output = sys.argv[sys.argv.index("--") + 1]
+with open(os.path.join(os.path.dirname(output), "launches"), "a") as f:
+    f.write("x")
+devices = [{{"id": "GPU_0", "name": "A"}}, {{"id": "GPU_1", "name": "B"}}]
+with open(output, "w") as f:
+    json.dump({{"device_type": "OPTIX", "devices": devices}}, f)
+"""
+
+
+class TestGpuProbe(unittest.TestCase):
+    def setUp(self):
+        from savepoints.services import gpu_probe
+        self.module = gpu_probe
+        self.module.clear_gpu_probe_cache()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.module.clear_gpu_probe_cache()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_partition_devices(self):
+        partition = self.module.partition_devices
+        self.assertEqual(partition(["a", "b", "c"], 1), [["a", "b", "c"]])
+        self.assertEqual(partition(["a", "b", "c", "d"], 2), [["a", "c"], ["b", "d"]])
+        self.assertEqual(partition(["a", "b"], 3), [["a"], ["b"], ["a"]])
+        self.assertEqual(partition([], 4), [[]])
+
+    def test_build_gpu_config(self):
+        probe = {"device_type": "CUDA", "devices": [{"id": "a", "name": "A"}, {"id": "b", "name": "B"}]}
+        self.assertEqual(self.module.build_gpu_config(probe, 2, True)["partitions"], [["a"], ["b"]])
+        self.assertNotIn("partitions", self.module.build_gpu_config(probe, 2, False))
+
+    def _write_fake_blender(self, script):
+        blender_bin = os.path.join(self.temp_dir, "fake_blender")
+        with open(blender_bin, 'w') as f:
+            f.write(script.format(python=sys.executable))
+        os.chmod(blender_bin, os.stat(blender_bin).st_mode | stat.S_IEXEC)
+        return blender_bin
+
+    def _run_probe(self, blender_bin, timeout=30):
+        probe = self.module.GpuProbe(blender_bin, self.temp_dir, timeout=timeout)
+        probe.start()
+        while not probe.poll():
+            time.sleep(0.01)
+        return probe.result
+
+    @unittest.skipIf(os.name == 'nt', "Fake Blender relies on a shebang script")
+    def test_probe_runs_once_per_session(self):
+        blender_bin = self._write_fake_blender(FAKE_PROBE_BLENDER)
+
+        first = self._run_probe(blender_bin)
+        second = self._run_probe(blender_bin)
+
+        self.assertEqual(first["device_type"], "OPTIX")
+        self.assertIs(first, second)
+        with open(os.path.join(self.temp_dir, "launches")) as f:
+            self.assertEqual(f.read(), "x")
+
+    @unittest.skipIf(os.name == 'nt', "Fake Blender relies on a shebang script")
+    def test_probe_does_not_block_and_times_out(self):
+        blender_bin = self._write_fake_blender("#!{python}\nimport time\ntime.sleep(30)\n")
+        probe = self.module.GpuProbe(blender_bin, self.temp_dir, timeout=0.2)
+
+        started = time.monotonic()
+        probe.start()
+        self.assertFalse(probe.poll())
+        self.assertLess(time.monotonic() - started, 5)
+
+        time.sleep(0.3)
+        self.assertTrue(probe.poll())
+        self.assertIsNone(probe.result)
+        self.assertIsNone(probe.process)
+
+    def test_failed_probe_returns_none(self):
+        self.assertIsNone(self._run_probe(os.path.join(self.temp_dir, "missing_blender")))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+import json
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+
+class TestLiveRender(unittest.TestCase):
+    def setUp(self):
+        from savepoints.services import batch_journal, live_render
+        self.module = live_render
+        self.temp_dir = tempfile.mkdtemp()
+        self.module._live.reset()
+        self.module._live.settings_path = os.path.join(self.temp_dir, "render_config.json")
+        self.module._live.output_dir = self.temp_dir
+        self.module._live.journal = batch_journal.BatchJournal.create(self.temp_dir, [], {})
+
+    def tearDown(self):
+        self.module._live.reset()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _read_config(self):
+        with open(self.module._live.settings_path) as f:
+            return json.load(f)
+
+    def test_render_settings_follow_the_scene(self):
+        scene_settings = {"resolution_x": 640, "camera_matrix_world": [[1, 0, 0, 0]]}
+        with patch.object(self.module, "extract_render_settings", side_effect=lambda _ctx: dict(scene_settings)):
+            self.module._update_render_settings(None)
+            self.assertEqual(self._read_config()["resolution_x"], 640)
+
+            # Unchanged settings do not rewrite the config
+            with patch("builtins.open", side_effect=AssertionError("config was rewritten")):
+                self.module._update_render_settings(None)
+
+            scene_settings["resolution_x"] = 1920
+            self.module._update_render_settings(None)
+
+        self.assertEqual(self._read_config()["resolution_x"], 1920)
+        self.assertEqual(self.module._live.journal.render_settings["resolution_x"], 1920)
+        self.assertIsNone(self._read_config()["world_blend_path"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+from savepoints.services import prefetch
+from savepoints.services.object_data import (
+    OBJECT_DATA_SUFFIX,
+    clear_object_data_cache,
+    get_object_data_cache_usage,
+    load_object_data,
+)
+
+
+class TestObjectDataPrefetch(unittest.TestCase):
+    def setUp(self):
+        clear_object_data_cache()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.history_dir = Path(self.tmp.name) / ".project_history"
+        self.manifest = {"versions": []}
+        for i in range(1, 6):
+            vid = f"v{i:03d}"
+            version_dir = self.history_dir / vid
+            version_dir.mkdir(parents=True)
+            with open(version_dir / f"{vid}{OBJECT_DATA_SUFFIX}", 'w', encoding='utf-8') as f:
+                json.dump({"Cube": {"v_count": i, "bbox": [[0, 0, 0], [1, 1, 1]], "matrix": [0.0] * 16}}, f)
+            self.manifest["versions"].append({"id": vid})
+
+        self.patches = [
+            patch('savepoints.services.prefetch.get_history_dir', return_value=str(self.history_dir)),
+            patch('savepoints.services.object_data.get_history_dir', return_value=str(self.history_dir)),
+            patch('savepoints.services.prefetch.load_manifest', return_value=self.manifest),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        prefetch.stop_object_data_prefetch()
+        for p in self.patches:
+            p.stop()
+        clear_object_data_cache()
+        self.tmp.cleanup()
+
+    def _wait_for_prefetch(self):
+        thread = prefetch._prefetch_thread
+        self.assertIsNotNone(thread)
+        thread.join(5)
+        self.assertFalse(thread.is_alive(), "Prefetch thread should finish")
+
+    def test_prefetch_warms_cache(self):
+        self.assertTrue(prefetch.start_object_data_prefetch())
+        self._wait_for_prefetch()
+
+        used, _capacity = get_object_data_cache_usage()
+        self.assertEqual(used, 5)
+
+        # Subsequent loads are served from the cache and return the parsed data
+        self.assertEqual(load_object_data("v003")["Cube"]["v_count"], 3)
+        self.assertEqual(get_object_data_cache_usage()[0], 5)
+
+    def test_prefetch_respects_cache_budget(self):
+        with patch('savepoints.services.prefetch.get_object_data_cache_usage', side_effect=[(0, 2), (1, 2), (2, 2)]):
+            prefetch.start_object_data_prefetch()
+            self._wait_for_prefetch()
+
+        # Only the two newest versions fit into the budget
+        self.assertEqual(get_object_data_cache_usage()[0], 2)
+
+    def test_stop_prevents_further_reads(self):
+        with patch('savepoints.services.prefetch.read_object_data_file') as mock_read:
+            # Simulate a file switch while the first file is being read
+            mock_read.side_effect = lambda _path: prefetch._stop_event.set()
+            prefetch.start_object_data_prefetch()
+            thread = prefetch._prefetch_thread
+            thread.join(5)
+
+        self.assertEqual(mock_read.call_count, 1)
+
+    def test_no_history_does_not_start(self):
+        with patch('savepoints.services.prefetch.get_history_dir', return_value=None):
+            self.assertFalse(prefetch.start_object_data_prefetch())
+        self.assertFalse(prefetch.is_prefetch_running())
+
+
+if __name__ == '__main__':
+    unittest.main()
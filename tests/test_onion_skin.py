@@ -0,0 +1,141 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+
+
+def _entry(mesh, geo_hash, v_count=100, x=0.0):
+    matrix = [1.0, 0.0, 0.0, x, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+    d = {'matrix': matrix, 'v_count': v_count, 'data_name': mesh}
+    if geo_hash:
+        d['geo_hash'] = geo_hash
+    return d
+
+
+class TestOnionSkinPlan(unittest.TestCase):
+    def setUp(self):
+        from savepoints.services import onion_skin
+        self.onion = onion_skin
+
+    def test_shared_geometry_is_linked_once(self):
+        # v3 moved the cube; v2 and v3 share the sphere geometry unchanged at the same spot
+        data_maps = {
+            'v003': {'Cube': _entry('CubeMesh', 'c1', x=2.0), 'Sphere': _entry('SphereMesh', 's1')},
+            'v002': {'Cube': _entry('CubeMesh', 'c1', x=1.0), 'Sphere': _entry('SphereMesh', 's1')},
+            'v001': {'Cube': _entry('CubeMesh.001', 'c0')},
+        }
+        plan = self.onion.plan_onion_skin(['v003', 'v002', 'v001'], data_maps, max_vertices=10_000)
+
+        self.assertEqual([layer.version_id for layer in plan.layers], ['v003', 'v002', 'v001'])
+        self.assertEqual(plan.layers[0].link_meshes, {'c1': 'CubeMesh', 's1': 'SphereMesh'})
+        # v002's cube reuses v003's mesh; its sphere is identical to v003's and is not drawn again
+        self.assertEqual(plan.layers[1].link_meshes, {})
+        self.assertEqual([inst[0] for inst in plan.layers[1].instances], ['Cube'])
+        self.assertEqual(plan.layers[2].link_meshes, {'c0': 'CubeMesh.001'})
+        self.assertEqual(plan.mesh_count, 3)
+        self.assertEqual(plan.shared_instances, 1)
+        self.assertEqual(plan.vertex_count, 300)
+
+    def test_vertex_budget_stops_at_oldest_layers(self):
+        data_maps = {
+            'v003': {'A': _entry('A', 'a', v_count=400)},
+            'v002': {'A': _entry('A', 'a2', v_count=400)},
+            'v001': {'A': _entry('A', 'a1', v_count=400)},
+        }
+        plan = self.onion.plan_onion_skin(['v003', 'v002', 'v001'], data_maps, max_vertices=1000)
+        self.assertEqual([layer.version_id for layer in plan.layers], ['v003', 'v002'])
+        self.assertEqual(plan.skipped, ['v001'])
+        self.assertEqual(plan.vertex_count, 800)
+
+    def test_metadata_without_fingerprints(self):
+        data_maps = {
+            'v002': {'A': _entry('Mesh', None)},
+            'v001': {'A': _entry('Mesh', None, x=5.0)},
+            'v000': {'Empty': {'matrix': [], 'v_count': 0}},
+        }
+        plan = self.onion.plan_onion_skin(['v002', 'v001', 'v000'], data_maps, max_vertices=10_000)
+        # Same mesh name, but without a fingerprint each version links its own copy
+        self.assertEqual(plan.mesh_count, 2)
+        self.assertEqual(plan.shared_instances, 0)
+        self.assertEqual(plan.skipped, ['v000'])
+
+    def test_layer_colors_fade(self):
+        newest = self.onion.get_onion_layer_color(0, 4)
+        oldest = self.onion.get_onion_layer_color(3, 4)
+        self.assertEqual(newest[3], 1.0)
+        self.assertAlmostEqual(oldest[3], self.onion.ONION_SKIN_MIN_ALPHA)
+        self.assertEqual(self.onion.get_onion_layer_color(0, 1)[3], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+
+import json
+import shutil
+import tempfile
+from types import SimpleNamespace
+
+
+def _record(version_id, render_time, state='DONE', triangles=None, texture_mb=None, peak_rss_mb=None):
+    return {'version_id': version_id, 'state': state, 'render_time': render_time, 'peak_rss_mb': peak_rss_mb,
+            'triangles': triangles, 'texture_mb': texture_mb}
+
+
+class TestPerfSweep(unittest.TestCase):
+    def setUp(self):
+        from savepoints.services import perf_sweep
+        self.module = perf_sweep
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_find_cost_jumps_uses_median_baseline(self):
+        points = [{'version_id': f"v{i:03d}", 'render_time': t}
+                  for i, t in enumerate([2.0, 2.1, 9.0, 2.0, 2.2, 5.0, 5.1], start=1)]
+
+        jumps = self.module.find_cost_jumps(points, 'render_time')
+
+        # v003 is a spike against [2.0, 2.1]; v007 stays at the level v006 jumped to
+        self.assertEqual([j.version_id for j in jumps], ["v003", "v006"])
+        self.assertAlmostEqual(jumps[1].before, 2.2)
+        self.assertAlmostEqual(jumps[1].factor, 5.0 / 2.2)
+
+    def test_analyze_sweep_orders_points_and_picks_worst_jump(self):
+        records = [
+            _record("v004", 8.0, triangles=2_000_000),
+            _record("v003", 2.0, triangles=100_000),
+            _record("v002", None, state='FAILED'),
+            _record("v001", 2.0, triangles=100_000),
+        ]
+
+        sweep = self.module.analyze_sweep(records, ["v001", "v002", "v003", "v004"])
+
+        self.assertEqual([p['version_id'] for p in sweep.points], ["v001", "v003", "v004"])
+        self.assertEqual({j.metric for j in sweep.jumps}, {'render_time', 'triangles'})
+        self.assertEqual(sweep.worst_jump.metric, 'render_time')
+        self.assertEqual(sweep.worst_jump.version_id, "v004")
+        self.assertEqual(sweep.peak('triangles'), 2_000_000)
+
+    def test_write_sweep(self):
+        sweep = self.module.analyze_sweep([_record("v001", 1.0), _record("v002", 3.0)], ["v001", "v002"])
+
+        path = self.module.write_sweep(self.temp_dir, sweep)
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data['worst_jump'], "v002")
+        self.assertEqual(data['jumps'][0]['factor'], 3.0)
+        self.assertIs(self.module.get_last_sweep(), sweep)
+        self.assertEqual(self.module.format_metric(2_500_000, ""), "2.50M")
+        self.assertEqual(self.module.format_metric(None, "s"), "-")
+
+
+class TestPerfSweepExecutor(unittest.TestCase):
+    def _executor(self, performance_sweep):
+        from savepoints.operators_render import SAVEPOINTS_OT_batch_render
+        op = SAVEPOINTS_OT_batch_render()
+        op.performance_sweep = performance_sweep
+        op.settings = SimpleNamespace(
+            batch_max_workers=4, batch_threads_per_worker=2, batch_persistent_workers=True,
+            batch_jobs_per_worker=10, batch_worker_memory_limit=0,
+        )
+        op.temp_dir = op.settings_path = op.worker_script_path = "unused"
+        return op._create_executor(["v001", "v002"], "out")
+
+    def test_sweep_uses_one_process_per_version(self):
+        sweep = self._executor(performance_sweep=True)
+        self.assertFalse(sweep.persistent)
+        self.assertEqual(sweep.max_workers, 1)
+
+        self.assertTrue(self._executor(performance_sweep=False).persistent)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+
+class TestRenderCache(unittest.TestCase):
+    def setUp(self):
+        from savepoints.services import render_cache
+        self.cache = render_cache
+        self.cache.clear_snapshot_hash_cache()
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        self.output_dir = os.path.join(self.temp_dir, "out")
+        os.makedirs(self.output_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name, data):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_settings_fingerprint_is_canonical(self):
+        a = {"resolution_x": 32, "view_settings": {"look": "None", "gamma": 1.0}}
+        b = {"view_settings": {"gamma": 1.0, "look": "None"}, "resolution_x": 32}
+        fp = self.cache.get_settings_fingerprint
+        self.assertEqual(fp(a, "4.2.0"), fp(b, "4.2.0"))
+        self.assertNotEqual(fp(a, "4.2.0"), fp(a, "4.3.0"))
+        self.assertNotEqual(fp(a, "4.2.0"), fp({**a, "resolution_x": 64}, "4.2.0"))
+
+    def test_settings_fingerprint_ignores_temp_paths(self):
+        a = {"resolution_x": 32, "world_blend_path": "/tmp/sp_batch_1/world.blend"}
+        b = {"resolution_x": 32, "world_blend_path": "/tmp/sp_batch_2/world.blend"}
+        fp = self.cache.get_settings_fingerprint
+        self.assertEqual(fp(a, "4.2.0"), fp(b, "4.2.0"))
+
+    def test_settings_fingerprint_covers_world_contents(self):
+        settings = {"resolution_x": 32, "world_name": "World"}
+        fp = self.cache.get_settings_fingerprint
+        world = self._write("world.blend", b"world-data")
+        image = self._write("sky.hdr", b"hdr-data")
+        world_hash = self.cache.hash_world_library(world, [image])
+        self.assertEqual(world_hash, self.cache.hash_world_library(world, [image]))
+        self.assertNotEqual(fp(settings, "4.2.0", world_hash), fp(settings, "4.2.0"))
+
+        # Editing the world, or the HDRI it points to in place, gives a new key
+        self._write("world.blend", b"world-data-2")
+        edited_world_hash = self.cache.hash_world_library(world, [image])
+        self.assertNotEqual(fp(settings, "4.2.0", world_hash), fp(settings, "4.2.0", edited_world_hash))
+        os.utime(image, ns=(0, os.stat(image).st_mtime_ns + 1))
+        self.assertNotEqual(self.cache.hash_world_library(world, [image]), edited_world_hash)
+
+    def test_snapshot_hash_index(self):
+        path = self._write("snapshot.blend", b"blend-data" * 1000)
+        index = {}
+        digest = self.cache.hash_snapshot(path, index)
+        self.assertIn(path, index)
+
+        # Unchanged file: served from the index without reading it again
+        with patch("builtins.open", side_effect=AssertionError("file was re-read")):
+            self.assertEqual(self.cache.hash_snapshot(path, index), digest)
+
+        self._write("snapshot.blend", b"other-data")
+        os.utime(path, ns=(0, index[path][1] + 1))
+        self.assertNotEqual(self.cache.hash_snapshot(path, index), digest)
+
+        self.cache.save_snapshot_hash_index(self.cache_dir, index)
+        self.assertEqual(self.cache.load_snapshot_hash_index(self.cache_dir), index)
+
+        # Without an index (e.g. it could not be written), the session cache still avoids a second read
+        new_digest = self.cache.hash_snapshot(path)
+        with patch("builtins.open", side_effect=AssertionError("file was re-read")):
+            self.assertEqual(self.cache.hash_snapshot(path), new_digest)
+
+    def test_store_and_restore(self):
+        key = self.cache.get_render_cache_key("snap", "settings")
+        self.assertIsNone(self.cache.find_cached_render(self.cache_dir, key))
+
+        rendered = self._write(os.path.join("out", "v001_render0001.png"), b"png")
+        output = self.cache.find_render_output(self.output_dir, "v001_render")
+        self.assertEqual(str(output), rendered)
+
+        self.cache.store_render(self.cache_dir, key, output)
+        cached = self.cache.find_cached_render(self.cache_dir, key)
+        self.assertEqual(cached.suffix, ".png")
+
+        restored = self.cache.restore_render(cached, self.output_dir, "v002_render")
+        self.assertEqual(restored.name, "v002_render.png")
+        self.assertEqual(restored.read_bytes(), b"png")
+
+        # Editing a batch image must not change the cached render
+        self.assertFalse(os.path.samefile(restored, cached))
+        restored.write_bytes(b"edited")
+        output.write_bytes(b"edited too")
+        self.assertEqual(cached.read_bytes(), b"png")
+
+
+if __name__ == '__main__':
+    unittest.main()
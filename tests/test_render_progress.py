@@ -0,0 +1,119 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+
+# Worker scripts import their siblings as top-level modules
+WORKERS_DIR = str(PROJECT_ROOT / "savepoints" / "workers")
+if WORKERS_DIR not in sys.path:
+    sys.path.append(WORKERS_DIR)
+
+
+class TestRenderProgress(unittest.TestCase):
+    def setUp(self):
+        import render_progress
+        self.module = render_progress
+
+    def test_cycles_samples(self):
+        stats = ("Fra:1 | Mem:25.62M (Peak 26.12M) | Time:00:01.23 | Remaining:00:10.00 | "
+                 "Mem:1.00M, Peak:2.00M | Scene, View Layer | Sample 16/64")
+        self.assertEqual(self.module.parse_render_stats(stats), {
+            "phase": "Rendering", "samples_done": 16, "samples_total": 64, "percent": 25.0,
+        })
+
+    def test_eevee_samples(self):
+        progress = self.module.parse_render_stats("Fra:1 | Scene, ViewLayer | Rendering 32 / 64 samples")
+        self.assertEqual(progress["percent"], 50.0)
+
+    def test_tiles(self):
+        progress = self.module.parse_render_stats("Fra:1 | Scene, ViewLayer | Rendered 2/4 Tiles, Sample 32/64")
+        self.assertEqual(progress["percent"], 62.5)
+
+    def test_phase_without_percent(self):
+        stats = "Fra:1 | Mem:1.00M, Peak:2.00M | Scene, View Layer | Synchronizing object | Cube"
+        self.assertEqual(self.module.parse_render_stats(stats), {"phase": "Synchronizing object"})
+
+    def test_throttle(self):
+        now = [0.0]
+        throttle = self.module.ProgressThrottle(min_interval=0.25, clock=lambda: now[0])
+
+        self.assertTrue(throttle.should_send({"phase": "Rendering", "percent": 1.0}))
+        self.assertFalse(throttle.should_send({"phase": "Rendering", "percent": 1.5}))  # same whole percent
+        now[0] = 0.1
+        self.assertFalse(throttle.should_send({"phase": "Rendering", "percent": 2.0}))  # too soon
+        now[0] = 0.5
+        self.assertTrue(throttle.should_send({"phase": "Rendering", "percent": 2.0}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+
+import json
+import tempfile
+from pathlib import Path
+
+try:
+    import numpy  # noqa: F401  (bundled with Blender, optional in the unit-test environment)
+except ImportError:
+    numpy = None
+
+IDENTITY = [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+# An identity view-projection sees the clip-space cube [-1, 1]^3
+VIEW_PROJECTION = [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]]
+
+
+def _obj(x=0.0, v_count=8, size=0.1, geo_hash=None):
+    matrix = list(IDENTITY)
+    matrix[3] = x
+    data = {'matrix': matrix, 'bbox': [[-size] * 3, [size] * 3], 'v_count': v_count}
+    if geo_hash:
+        data['geo_hash'] = geo_hash
+    return data
+
+
+@unittest.skipIf(numpy is None, "NumPy not available")
+class TestRenderSkip(unittest.TestCase):
+    def setUp(self):
+        from savepoints.services.render_skip import find_redundant_versions, format_skip_report, write_skip_report
+        self.find_redundant_versions = find_redundant_versions
+        self.format_skip_report = format_skip_report
+        self.write_skip_report = write_skip_report
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.history_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, version_id, data_map):
+        version_dir = self.history_dir / version_id
+        version_dir.mkdir()
+        (version_dir / f"{version_id}_objects.json").write_text(json.dumps(data_map))
+
+    def _decide(self, version_ids, ignore_names=()):
+        decisions = self.find_redundant_versions(version_ids, VIEW_PROJECTION, ignore_names=ignore_names,
+                                                 history_dir=self.history_dir)
+        return {d.version_id: d for d in decisions}
+
+    def test_off_camera_changes_are_skipped(self):
+        self._write("v001", {"Hero": _obj(), "Prop": _obj(x=10.0)})
+        self._write("v002", {"Hero": _obj(), "Prop": _obj(x=12.0)})
+        self._write("v003", {"Hero": _obj(x=0.5), "Prop": _obj(x=12.0)})
+
+        decisions = self._decide(["v001", "v002", "v003"])
+
+        self.assertTrue(decisions["v001"].render)
+        self.assertFalse(decisions["v002"].render)
+        self.assertEqual(decisions["v002"].changed, 1)
+        self.assertTrue(decisions["v003"].render)
+        self.assertEqual(decisions["v003"].visible, 2)  # old and new boxes of Hero
+
+    def test_compares_with_last_rendered_version(self):
+        # An object that leaves the view is a visible change even though it ends up outside
+        self._write("v001", {"Prop": _obj(x=10.0)})
+        self._write("v002", {"Prop": _obj(x=11.0)})
+        self._write("v003", {"Prop": _obj(x=0.0)})
+        self._write("v004", {"Prop": _obj(x=0.0)})
+        self._write("v005", {"Prop": _obj(x=10.0)})
+
+        decisions = self._decide(["v001", "v002", "v003", "v004", "v005"])
+
+        self.assertEqual([d.render for d in decisions.values()], [True, False, True, False, True])
+        self.assertEqual(decisions["v003"].compared_to, "v001")
+        self.assertEqual(decisions["v004"].reason, "no changes")
+        self.assertEqual(decisions["v005"].compared_to, "v003")
+
+    def test_conservative_cases_render(self):
+        self._write("v001", {"Hero": _obj(geo_hash="a"), "Lamp": _obj(x=10.0, v_count=0)})
+        self._write("v002", {"Hero": _obj(geo_hash="b"), "Lamp": _obj(x=10.0, v_count=0)})
+        self._write("v003", {"Hero": _obj(geo_hash="b"), "Lamp": _obj(x=20.0, v_count=0)})
+        # v004 has no metadata
+
+        decisions = self._decide(["v001", "v002", "v003", "v004"])
+
+        self.assertTrue(decisions["v002"].render)  # sculpt that kept the bounds
+        self.assertEqual(decisions["v003"].reason, "non-mesh object changed")
+        self.assertEqual(decisions["v004"].reason, "no stored metadata")
+
+    def test_ignore_names(self):
+        self._write("v001", {"Camera": _obj(v_count=0)})
+        self._write("v002", {"Camera": _obj(x=0.5, v_count=0)})
+
+        decisions = self._decide(["v001", "v002"], ignore_names=["Camera"])
+
+        self.assertFalse(decisions["v002"].render)
+
+    def test_report(self):
+        self._write("v001", {"Prop": _obj(x=10.0)})
+        self._write("v002", {"Prop": _obj(x=11.0)})
+        decisions = self.find_redundant_versions(["v001", "v002"], VIEW_PROJECTION, history_dir=self.history_dir)
+
+        path = self.write_skip_report(self.tmp.name, decisions)
+
+        with open(path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        self.assertEqual(report["skipped"], ["v002"])
+        self.assertEqual(len(report["decisions"]), 2)
+        self.assertIn("Skipped 1 of 2", self.format_skip_report(decisions))
+
+
+if __name__ == '__main__':
+    unittest.main()
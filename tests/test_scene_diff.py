@@ -0,0 +1,149 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+try:
+    import numpy  # noqa: F401  (bundled with Blender, optional in the unit-test environment)
+except ImportError:
+    numpy = None
+
+IDENTITY = [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+
+
+def _obj(v_count=8, bbox=None, x=0.0):
+    matrix = list(IDENTITY)
+    matrix[3] = x
+    return {'matrix': matrix, 'bbox': bbox or [[-1.0, -1.0, -1.0], [1.0, 1.0, 1.0]], 'v_count': v_count}
+
+
+@unittest.skipIf(numpy is None, "NumPy not available")
+class TestSceneDiff(unittest.TestCase):
+    def setUp(self):
+        from savepoints.services.object_table import ObjectTable
+        from savepoints.services.scene_diff import diff_object_tables
+        self.ObjectTable = ObjectTable
+        self.diff_object_tables = diff_object_tables
+
+    def _diff(self, old, new):
+        return self.diff_object_tables(self.ObjectTable.from_object_data(old),
+                                       self.ObjectTable.from_object_data(new))
+
+    def test_categories(self):
+        old = {"Keep": _obj(), "Gone": _obj(), "Move": _obj(), "Shape": _obj(), "Topo": _obj()}
+        new = {
+            "Keep": _obj(),
+            "Move": _obj(x=2.0),
+            "Shape": _obj(bbox=[[0.0, 0.0, 0.0], [3.0, 1.0, 1.0]]),
+            "Topo": _obj(v_count=20),
+            "Added": _obj(),
+        }
+
+        diff = self._diff(old, new)
+
+        self.assertEqual(list(diff.created), ["Added"])
+        self.assertEqual(list(diff.removed), ["Gone"])
+        self.assertEqual(list(diff.moved), ["Move"])
+        self.assertEqual(list(diff.reshaped), ["Shape"])
+        self.assertEqual(list(diff.topology), ["Topo"])
+        self.assertEqual(list(diff.vertex_delta), [12])
+
+    def test_precedence_matches_object_history(self):
+        # Vertex count wins over bbox and matrix; bbox wins over matrix
+        old = {"A": _obj(), "B": _obj()}
+        new = {"A": _obj(v_count=4, x=5.0), "B": _obj(bbox=[[0.0, 0.0, 0.0], [2.0, 2.0, 2.0]], x=5.0)}
+
+        diff = self._diff(old, new)
+
+        self.assertEqual(list(diff.topology), ["A"])
+        self.assertEqual(list(diff.reshaped), ["B"])
+        self.assertEqual(len(diff.moved), 0)
+
+    def test_entries_and_counts(self):
+        diff = self._diff({"A": _obj()}, {"A": _obj(v_count=2), "B": _obj()})
+
+        self.assertEqual(diff.counts()["CREATED"], 1)
+        self.assertEqual(diff.counts()["MAJOR"], 1)
+        entries = diff.entries()
+        self.assertIn({'object_name': "A", 'change_type': "MAJOR", 'details': "-6 verts"}, entries)
+        self.assertEqual(len(diff.entries(limit=1)), 1)
+
+    def test_empty_tables(self):
+        diff = self._diff({}, {})
+        self.assertTrue(diff.is_empty())
+
+        diff = self._diff({}, {"A": _obj()})
+        self.assertEqual(list(diff.created), ["A"])
+
+
+if __name__ == '__main__':
+    unittest.main()
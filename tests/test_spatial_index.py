@@ -0,0 +1,150 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+try:
+    import numpy  # noqa: F401  (bundled with Blender, optional in the unit-test environment)
+except ImportError:
+    numpy = None
+
+IDENTITY = [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+
+
+def _obj(x=0.0, y=0.0, v_count=8, size=1.0):
+    matrix = list(IDENTITY)
+    matrix[3] = x
+    matrix[7] = y
+    return {'matrix': matrix, 'bbox': [[-size, -size, -size], [size, size, size]], 'v_count': v_count}
+
+
+@unittest.skipIf(numpy is None, "NumPy not available")
+class TestSpatialChangeIndex(unittest.TestCase):
+    def setUp(self):
+        from savepoints.services.object_table import ObjectTable
+        from savepoints.services.spatial_index import build_spatial_change_index
+        self.ObjectTable = ObjectTable
+        self.build = build_spatial_change_index
+
+    def _index(self, versions):
+        tables = [self.ObjectTable.from_object_data(data) for data in versions]
+        return self.build([f"v{i + 1:03d}" for i in range(len(versions))], tables)
+
+    def test_world_aabbs_apply_matrix(self):
+        table = self.ObjectTable.from_object_data({"A": _obj(x=10.0, y=-5.0)})
+        aabb = table.world_aabbs()[0]
+        self.assertEqual(list(aabb), [9.0, -6.0, -1.0, 11.0, -4.0, 1.0])
+
+    def test_query_returns_versions_touching_region(self):
+        index = self._index([
+            {"Left": _obj(x=-50.0), "Right": _obj(x=50.0)},
+            {"Left": _obj(x=-48.0), "Right": _obj(x=50.0)},
+            {"Left": _obj(x=-48.0), "Right": _obj(x=50.0, v_count=100)},
+            {"Left": _obj(x=-48.0), "Right": _obj(x=50.0, v_count=100), "New": _obj(x=-45.0)},
+        ])
+
+        left = index.query((-60.0, -5.0, -5.0), (-40.0, 5.0, 5.0))
+        self.assertEqual([r['version_id'] for r in left], ["v004", "v002", "v001"])
+        self.assertEqual(left[0]['objects'], ["New"])
+        self.assertEqual(left[0]['counts'], {"CREATED": 1})
+        self.assertEqual(left[1]['counts'], {"MOVED": 2})  # old and new position both overlap
+
+        right = index.query((45.0, -5.0, -5.0), (55.0, 5.0, 5.0))
+        self.assertEqual([r['version_id'] for r in right], ["v003", "v001"])
+
+        self.assertEqual(index.query((0.0, 100.0, 0.0), (1.0, 101.0, 1.0)), [])
+
+    def test_move_hits_old_location(self):
+        index = self._index([{"A": _obj(x=0.0)}, {"A": _obj(x=100.0)}])
+        results = index.query((-1.0, -1.0, -1.0), (1.0, 1.0, 1.0))
+        self.assertEqual([r['version_id'] for r in results], ["v002", "v001"])
+
+    def test_removed_and_oversized(self):
+        index = self._index([
+            {"Ground": _obj(size=1000.0), "Rock": _obj(x=20.0)},
+            {"Ground": _obj(size=1000.0)},
+        ])
+        self.assertTrue(len(index.oversized) > 0)
+
+        results = index.query((19.0, -1.0, -1.0), (21.0, 1.0, 1.0))
+        self.assertEqual(results[0]['version_id'], "v002")
+        self.assertEqual(results[0]['counts'], {"REMOVED": 1})
+        # The ground plane was created in v001 and spans every cell
+        self.assertEqual(results[1]['objects'], ["Ground", "Rock"])
+
+    def test_empty_history(self):
+        self.assertEqual(len(self._index([])), 0)
+        self.assertEqual(self._index([{}]).query((0, 0, 0), (1, 1, 1)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+CURRENT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# MOCK BPY
+mock_bpy = MagicMock()
+
+
+def persistent(func):
+    return func
+
+
+mock_bpy.app.handlers.persistent = persistent
+mock_bpy.app = mock_bpy.app
+mock_bpy.utils = MagicMock()
+mock_bpy.props = MagicMock()
+mock_bpy.types = MagicMock()
+mock_bpy.ops = MagicMock()
+mock_bpy.context = MagicMock()
+mock_bpy.utils.previews = MagicMock()
+mock_bpy.app.timers = MagicMock()
+
+
+# Define dummy base classes
+class MockOperator: pass
+
+
+class MockPanel: pass
+
+
+class MockMenu: pass
+
+
+class MockUIList: pass
+
+
+mock_bpy.types.Operator = MockOperator
+mock_bpy.types.Panel = MockPanel
+mock_bpy.types.Menu = MockMenu
+mock_bpy.types.UIList = MockUIList
+
+sys.modules['bpy'] = mock_bpy
+sys.modules['bpy.app'] = mock_bpy.app
+sys.modules['bpy.app.handlers'] = mock_bpy.app.handlers
+sys.modules['bpy.utils'] = mock_bpy.utils
+sys.modules['bpy.utils.previews'] = mock_bpy.utils.previews
+sys.modules['bpy.props'] = mock_bpy.props
+sys.modules['bpy.types'] = mock_bpy.types
+sys.modules['bpy.ops'] = mock_bpy.ops
+sys.modules['bpy.context'] = mock_bpy.context
+
+# Mock other blender modules
+sys.modules['blf'] = MagicMock()
+sys.modules['gpu'] = MagicMock()
+sys.modules['gpu_extras'] = MagicMock()
+sys.modules['gpu_extras.batch'] = MagicMock()
+sys.modules['bl_ui'] = MagicMock()
+sys.modules['bpy_extras'] = MagicMock()
+sys.modules['bpy_extras.io_utils'] = MagicMock()
+
+
+class MockImportHelper: pass
+
+
+sys.modules['bpy_extras.io_utils'].ImportHelper = MockImportHelper
+sys.modules['bpy_extras.io_utils'].ExportHelper = MockImportHelper  # Added this
+
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTimeBudget(unittest.TestCase):
+    def setUp(self):
+        from savepoints.services import time_budget
+        self.module = time_budget
+        self.clock = FakeClock()
+
+    def _planner(self, budget, resolution=100, samples=128, workers=1):
+        return self.module.TimeBudgetPlanner(budget, resolution, samples, workers, clock=self.clock)
+
+    def test_pick_calibration_versions(self):
+        versions = [f"v{i:03d}" for i in range(1, 11)]
+        self.assertEqual(self.module.pick_calibration_versions(versions), ["v001", "v005", "v010"])
+        self.assertEqual(self.module.pick_calibration_versions(versions[:2]), ["v001", "v002"])
+        self.assertEqual(self.module.pick_calibration_versions([]), [])
+
+    def test_fit_cost_model(self):
+        self.assertIsNone(self.module.fit_cost_model([]))
+        # One quality level: everything is per-unit cost
+        self.assertEqual(self.module.fit_cost_model([(2.0, 4.0), (2.0, 6.0)]), (0.0, 2.5))
+        # Two levels separate the fixed cost (scene sync) from the per-sample cost
+        fixed, per_unit = self.module.fit_cost_model([(1.0, 3.0), (4.0, 9.0)])
+        self.assertAlmostEqual(fixed, 1.0)
+        self.assertAlmostEqual(per_unit, 2.0)
+
+    def test_plan_keeps_full_quality_within_budget(self):
+        planner = self._planner(budget=1000)
+        self.assertEqual(planner.plan(10), {"resolution_percentage": 100, "samples": 128})
+
+        # Calibration at 25% / 16 samples took 1s: full quality costs 128s, 10 versions fit in 1000s
+        planner.add_observation(planner.calibration_quality(), 1.5, 1.0)
+        self.clock.now = 10.0
+        quality = planner.plan(7)
+        self.assertEqual((quality["resolution_percentage"], quality["samples"]), (100, 128))
+        self.assertGreater(quality["time_limit"], 128)
+
+    def test_plan_lowers_quality_and_readjusts(self):
+        planner = self._planner(budget=100)
+        planner.add_observation(planner.calibration_quality(), 1.0, 1.0)
+
+        # 100s for 10 versions: ~10s each against 128s at full quality
+        first = planner.plan(10)
+        self.assertLess(first["samples"], 128)
+        self.assertLess(first["resolution_percentage"], 100)
+        units = self.module.get_render_units(first["resolution_percentage"], first["samples"])
+        self.assertLessEqual(units * 1.0, 10.0)
+        self.assertAlmostEqual(first["time_limit"], 12.5)
+
+        # Renders turn out twice as slow as calibrated: later versions get less
+        for _ in range(3):
+            planner.add_observation(first, units * 2.0, units * 2.0)
+        self.clock.now = 60.0
+        later = planner.plan(5)
+        self.assertLess(self.module.get_render_units(later["resolution_percentage"], later["samples"]), units)
+
+    def test_plan_with_exhausted_budget_uses_minimum_quality(self):
+        planner = self._planner(budget=10)
+        planner.add_observation(planner.calibration_quality(), 1.0, 1.0)
+        self.clock.now = 30.0
+        self.assertEqual(planner.plan(4), {"resolution_percentage": 10, "samples": 1, "time_limit": 1.0})
+
+
+if __name__ == '__main__':
+    unittest.main()